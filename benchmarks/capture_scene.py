@@ -0,0 +1,65 @@
+""" Captures every frame a scene displays to an animated APNG (or GIF), with each frame lasting as long as it was displayed. Gives a visual and timing record of transitions, scrolls, etc.
+API responses can be recorded as fixtures and replayed, so the same scene can be captured at different commits and compared pixel by pixel to catch rendering regressions.
+Run from the root of the repository with: python -m benchmarks.capture_scene <scene> <path> [--cycles N] [--record DIR | --replay DIR] [--compare PATH]
+e.g., python -m benchmarks.capture_scene nhl_games nhl_games.png --replay fixtures/nhl
+"""
+
+from utils import capture_utils
+import setup.matrix_setup
+
+# Wrap the matrix before any scenes are imported, so they display frames through the wrapper.
+setup.matrix_setup.matrix = capture_utils.FrameCapture(setup.matrix_setup.matrix)
+
+from setup.session_setup import session
+import main
+
+import argparse
+
+
+def capture_scene(scene_name, path, num_cycles=1):
+    """ Displays a scene, capturing every frame, and saves the capture.
+
+    Args:
+        scene_name (str): Name of the scene in config.yaml scene_order.
+        path (str): Path to save the capture to. Saved as an APNG if it ends in .png, otherwise a GIF.
+        num_cycles (int, optional): Number of times to display the scene. Scenes that compare against the previous data pull (e.g., noting goals) need more than one. Defaults to 1.
+    """
+
+    scene = main.create_scenes()[scene_name]
+    matrix = setup.matrix_setup.matrix
+
+    matrix.start()
+    for cycle in range(num_cycles):
+        session.start_cycle()
+        scene.display_scene()
+    frames, end_time = matrix.stop()
+
+    if not frames:
+        print(f'Scene {scene_name} displayed no frames.')
+        return
+
+    capture_utils.save_frames(frames, end_time, path)
+    print(f'Captured {len(frames)} frames over {end_time - frames[0][0]:.1f}s to {path}.')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Capture every frame a scene displays to an animated APNG or GIF.')
+    parser.add_argument('scene', help='Name of the scene in config.yaml scene_order (e.g., nhl_games).')
+    parser.add_argument('path', help='Path to save the capture to. APNG if it ends in .png (lossless, preferred for comparing), otherwise GIF.')
+    parser.add_argument('--cycles', type=int, default=1, help='Number of times to display the scene.')
+    fixtures = parser.add_mutually_exclusive_group()
+    fixtures.add_argument('--record', metavar='DIR', help='Save API responses as fixtures in DIR.')
+    fixtures.add_argument('--replay', metavar='DIR', help='Respond to API requests with fixtures from DIR rather than making them.')
+    parser.add_argument('--compare', metavar='PATH', help='Compare the capture pixel by pixel to a previous capture.')
+    args = parser.parse_args()
+
+    if args.record:
+        capture_utils.record_fixtures(session, args.record)
+    elif args.replay:
+        capture_utils.replay_fixtures(session, args.replay)
+
+    capture_scene(args.scene, args.path, args.cycles)
+
+    if args.compare:
+        comparison = capture_utils.compare_captures(args.path, args.compare)
+        print(f"{comparison['num_frames']} frames vs {comparison['other_num_frames']} in {args.compare}, {len(comparison['differing_frames'])} differing: {comparison['differing_frames'][:20]}")
@@ -0,0 +1,87 @@
+""" Benchmarks building a frame of a 'modern' game transition (clear, paste the left, centre, and right images at an offset, and fade), comparing PIL to the NumPy frame buffer.
+Run at the native size of each supported panel geometry, from a single 64x32 panel up to 2x2 chained/parallel panels.
+Run from the root of the repository with: python -m benchmarks.frame_compositing
+"""
+
+from utils import frame_utils, image_utils, layout_utils
+
+from PIL import Image, ImageDraw
+import timeit
+
+
+def build_images(size):
+    """ Builds the images composited in a game transition, with some content so they're not blank.
+
+    Args:
+        size (tuple): Width and height of the frame.
+
+    Returns:
+        dict: Images by name.
+    """
+
+    images = {
+        'left':     Image.new('RGB', (40, 30), (200, 16, 46)),
+        'centre':   Image.new('RGB', (20, 30)),
+        'right':    Image.new('RGB', (40, 30), (0, 32, 91)),
+        'full':     Image.new('RGB', size) # Prior to the frame buffer, the full image was composited at the native size.
+    }
+    ImageDraw.Draw(images['centre']).text((0, 16), '3-2', fill=(255, 255, 255))
+    return images
+
+
+def build_frame_pil(images, full_draw, layout, col_offset, overlay_opacity):
+    """ Builds a frame the way scenes did prior to the frame buffer. Clear, paste each image, and fade via alpha compositing.
+    """
+
+    image_utils.clear_image(images['full'], full_draw)
+    for name in ['left', 'centre', 'right']:
+        images['full'].paste(images[name], (layout[name][0] + col_offset, layout[name][1]))
+    return frame_utils.create_faded_image(images['full'], overlay_opacity)
+
+
+def build_frame_buffer(frame_buffer, layout, col_offset, overlay_opacity):
+    """ Builds a frame with the frame buffer.
+    """
+
+    frame_buffer.clear()
+    for name in ['left', 'centre', 'right']:
+        frame_buffer.paste_layer(name, (layout[name][0] + col_offset, layout[name][1]))
+    return frame_buffer.get_image(overlay_opacity)
+
+
+def run_benchmark(size=(64, 32), num_transitions=200):
+    """ Times building every frame of a 'modern' transition, repeated num_transitions times. Prints the time per frame of each approach.
+
+    Args:
+        size (tuple, optional): Width and height of the frame. Defaults to (64, 32).
+        num_transitions (int, optional): Number of transitions to time. Defaults to 200.
+    """
+
+    images = build_images(size)
+    full_draw = ImageDraw.Draw(images['full'])
+    layout = layout_utils.determine_game_layout(size)
+    frame_buffer = frame_utils.FrameBuffer(size)
+    frame_buffer.set_layers(images)
+
+    # Frames of a 'modern' transition in, per GamesScene.transition_image.
+    fade = range(255, -1, -15)
+    frames = list(zip(fade, range(-len(fade)+1, 1, 1)))
+    num_frames = num_transitions * len(frames)
+
+    # Both approaches must produce identical frames.
+    for overlay_opacity, col_offset in frames:
+        assert build_frame_pil(images, full_draw, layout, col_offset, overlay_opacity).tobytes() == build_frame_buffer(frame_buffer, layout, col_offset, overlay_opacity).tobytes()
+
+    pil_time = timeit.timeit(lambda: [build_frame_pil(images, full_draw, layout, col_offset, overlay_opacity) for overlay_opacity, col_offset in frames], number=num_transitions)
+    buffer_time = timeit.timeit(lambda: [build_frame_buffer(frame_buffer, layout, col_offset, overlay_opacity) for overlay_opacity, col_offset in frames], number=num_transitions)
+
+    backend = 'NumPy' if frame_utils.np is not None else 'PIL (NumPy not installed)'
+    print(f'{size[0]}x{size[1]} ({size[0] * size[1]} pixels), {num_frames} frames')
+    print(f'  {"PIL paste + alpha composite:":<45}{pil_time / num_frames * 1e6:8.1f} us/frame')
+    print(f'  {f"Frame buffer, {backend}:":<45}{buffer_time / num_frames * 1e6:8.1f} us/frame ({pil_time / buffer_time:.1f}x)')
+
+
+if __name__ == '__main__':
+    # Native size of each panel geometry (cols x chain_length, rows x parallel) for 64x32 panels.
+    for size in [(64, 32), (128, 32), (64, 64), (128, 64)]:
+        run_benchmark(size)
@@ -0,0 +1,69 @@
+""" Benchmarks reading the NBA standings resultSet, comparing a dict per row of every column (as get_standings used to) to reading only the columns used.
+Run on a synthetic leaguestandingsv3 payload of the same shape as the real one (30 teams, ~90 columns), so no API calls are made.
+Run from the root of the repository with: python -m benchmarks.nba_result_sets
+"""
+
+from data import nba_data
+
+import random
+import timeit
+
+
+def build_result_set(num_rows=30, num_columns=90):
+    """ Builds a resultSet shaped like leaguestandingsv3. The columns used by get_standings are spread among filler columns.
+
+    Args:
+        num_rows (int, optional): Number of rows (teams). Defaults to 30.
+        num_columns (int, optional): Total number of columns. Defaults to 90.
+
+    Returns:
+        dict: resultSet w/ headers and rowSet.
+    """
+
+    headers = [f'Column{index}' for index in range(num_columns)]
+    for index, column in enumerate(nba_data.standings_columns):
+        headers[index * (num_columns // len(nba_data.standings_columns))] = column
+
+    random.seed(0)
+    rows = [[random.random() for column in headers] for row in range(num_rows)]
+    return {'headers': headers, 'rowSet': rows}
+
+
+def read_result_set_per_row(result_set):
+    """ Reads a resultSet the way get_standings used to, zipping every header and value of each row into a dict.
+    """
+
+    rows = []
+    for row in result_set['rowSet']:
+        values = {}
+        for header, value in zip(result_set['headers'], row):
+            values[header] = value
+        rows.append(values)
+    return rows
+
+
+def run_benchmark(num_reads=20000):
+    """ Times reading the resultSet num_reads times with each approach. Prints the time per read.
+
+    Args:
+        num_reads (int, optional): Number of reads to time. Defaults to 20000.
+    """
+
+    result_set = build_result_set()
+    columns = nba_data.standings_columns
+
+    # Both approaches must read identical values for the columns used.
+    per_row = read_result_set_per_row(result_set)
+    columnar = nba_data.read_result_set(result_set, columns)
+    assert [{column: row[column] for column in columns} for row in per_row] == columnar
+
+    per_row_time = timeit.timeit(lambda: read_result_set_per_row(result_set), number=num_reads)
+    columnar_time = timeit.timeit(lambda: nba_data.read_result_set(result_set, columns), number=num_reads)
+
+    print(f"{len(result_set['rowSet'])} rows x {len(result_set['headers'])} columns, reading {len(columns)}")
+    print(f'  {"Dict per row, all columns:":<45}{per_row_time / num_reads * 1e6:8.1f} us/read')
+    print(f'  {"Columnar, used columns only:":<45}{columnar_time / num_reads * 1e6:8.1f} us/read ({per_row_time / columnar_time:.1f}x)')
+
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,51 @@
+""" Runs the scoreboard in virtual time, where sleeping is instant, so hours of operation (rollover, brightness changes, game progress, etc.) run in seconds. Useful for throughput and soak testing.
+Combine with fixtures recorded by capture_scene so no API calls are made. Fixtures are matched by URL, so start on the date they were recorded.
+Run from the root of the repository with: python -m benchmarks.virtual_time_run [--start YYYY-MM-DDTHH:MM] [--hours N] [--replay DIR]
+"""
+
+from utils import capture_utils, clock_utils
+
+import argparse
+from datetime import datetime as dt
+from datetime import timedelta
+import time
+
+
+def run_virtual_time(start_datetime, num_hours, fixtures_directory=None):
+    """ Runs the scoreboard from start_datetime for num_hours of virtual time. Prints how long that took in real time.
+
+    Args:
+        start_datetime (datetime): Local date and time to start at.
+        num_hours (float): Hours of virtual time to run for.
+        fixtures_directory (str, optional): Directory of fixtures to replay API requests from. Defaults to None (make requests as usual).
+    """
+
+    # Set the clock before anything else is imported, so all time (incl. during setup) is virtual.
+    clock = clock_utils.VirtualClock(start_datetime, start_datetime + timedelta(hours=num_hours))
+    clock_utils.set_clock(clock)
+
+    from setup.session_setup import session
+    import main
+
+    if fixtures_directory:
+        capture_utils.replay_fixtures(session, fixtures_directory)
+
+    # Run until the virtual clock reaches its end.
+    start_time = time.perf_counter()
+    try:
+        main.run_scoreboard()
+    except clock_utils.VirtualTimeElapsed:
+        pass
+    real_duration = time.perf_counter() - start_time
+
+    print(f'Ran {clock.elapsed / 3600:.2f} virtual hours ({start_datetime:%Y-%m-%d %H:%M} to {clock.now():%Y-%m-%d %H:%M}) in {real_duration:.1f}s real time ({clock.elapsed / real_duration:,.0f}x).')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run the scoreboard in virtual time.')
+    parser.add_argument('--start', type=dt.fromisoformat, default=dt.today().replace(hour=0, minute=0, second=0, microsecond=0), help='Local date and time to start at, in ISO format. Defaults to midnight today.')
+    parser.add_argument('--hours', type=float, default=24, help='Hours of virtual time to run for.')
+    parser.add_argument('--replay', metavar='DIR', help='Respond to API requests with fixtures from DIR rather than making them.')
+    args = parser.parse_args()
+
+    run_virtual_time(args.start, args.hours, args.replay)
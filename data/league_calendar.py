@@ -0,0 +1,112 @@
+from utils import clock_utils, data_utils
+
+from datetime import timedelta
+import threading
+
+
+# What's known of each league's upcoming games, keyed by league (e.g., 'nhl'). Learned from data already being loaded (schedules, seasons, games), so no API calls of its own.
+# Each has the date of the league's next game (None if no upcoming games were found, e.g., off-season), and when that was noted (monotonic and local date).
+next_games = {}
+
+# Dates each league is known to have no games on, keyed by league then date. Each has when that was noted (monotonic). Learned from games loaded for the date.
+empty_dates = {}
+
+# Guards access to next_games and empty_dates, as data is loaded in background threads.
+lock = threading.Lock()
+
+
+def note_next_game_date(league, next_game_date):
+    """ Notes the date of a league's next game, as found in data loaded for it. Replaces anything noted previously, as the latest data is the most accurate.
+    Should only be noted from data covering all of the league's games from today on (or a span of them), not those of a single team.
+
+    Args:
+        league (str): League. E.g., 'nhl'.
+        next_game_date (date): Date of the league's next game (today if games today). None if there are no upcoming games in the data.
+    """
+
+    with lock:
+        next_games[league.lower()] = {
+            'date': next_game_date,
+            'noted_at': clock_utils.monotonic(),
+            'noted_on': clock_utils.now().astimezone().date()
+        }
+
+        # The date of the next game has games, regardless of what was noted before.
+        empty_dates.get(league.lower(), {}).pop(next_game_date, None)
+
+
+def note_no_games_on_date(league, date):
+    """ Notes that a league has no games on a date, as found in games loaded for it.
+
+    Args:
+        league (str): League. E.g., 'nhl'.
+        date (date): Date w/o games.
+    """
+
+    with lock:
+        league_empty_dates = empty_dates.setdefault(league.lower(), {})
+        league_empty_dates[date] = clock_utils.monotonic()
+
+        # Forget dates well in the past, which are no longer displayed.
+        for empty_date in [empty_date for empty_date in league_empty_dates if empty_date < date - timedelta(days=2)]:
+            del league_empty_dates[empty_date]
+
+
+def is_active(league):
+    """ Determines if a league is active, i.e., has a game coming up soon, per inactive_leagues in config.yaml. Leagues are active unless their data shows otherwise.
+    Inactive leagues are considered active again every recheck_interval hours, so their data is loaded again and any new games are found.
+
+    Args:
+        league (str): League. E.g., 'NHL'. None (e.g., scenes not specific to a league) is always active.
+
+    Returns:
+        bool: If the league is active.
+    """
+
+    settings = data_utils.read_yaml('config.yaml').get('inactive_leagues', {})
+    if not league or not settings.get('skip_inactive_leagues', True):
+        return True
+
+    with lock:
+        next_game = next_games.get(league.lower())
+
+    # Nothing known (or not recently), so assume active. Scenes will load data for the league, noting its next game again.
+    if not next_game or clock_utils.monotonic() - next_game['noted_at'] > settings.get('recheck_interval', 12) * 3600:
+        return True
+
+    # Active if the next game is within days_ahead days.
+    cur_date = clock_utils.now().astimezone().date()
+    return next_game['date'] is not None and next_game['date'] <= cur_date + timedelta(days=settings.get('days_ahead', 2))
+
+
+def has_games_on(league, date):
+    """ Determines if a league may have games on a date, per inactive_leagues in config.yaml. Games scenes skip dates w/o games (and their API calls), rather than displaying a 'no games' splash, even while the league is active.
+    Like is_active, what's known is only relied on for recheck_interval hours, so games added since are found.
+
+    Args:
+        league (str): League. E.g., 'NHL'.
+        date (date): Date of games.
+
+    Returns:
+        bool: False if the league is known to have no games on date. Otherwise (incl. if nothing recent is known), True.
+    """
+
+    settings = data_utils.read_yaml('config.yaml').get('inactive_leagues', {})
+    if not settings.get('skip_inactive_leagues', True):
+        return True
+
+    with lock:
+        next_game = next_games.get(league.lower())
+        empty_noted_at = empty_dates.get(league.lower(), {}).get(date)
+
+    recheck_interval = settings.get('recheck_interval', 12) * 3600
+
+    # Known to have no games, per games loaded for the date.
+    if empty_noted_at is not None and clock_utils.monotonic() - empty_noted_at <= recheck_interval:
+        return False
+
+    # Known to have no games, as the date falls between when the league's next game was noted and that game (or after, if there are no upcoming games).
+    if next_game and clock_utils.monotonic() - next_game['noted_at'] <= recheck_interval:
+        return not (next_game['noted_on'] <= date and (next_game['date'] is None or date < next_game['date']))
+
+    return True
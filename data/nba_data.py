@@ -1,10 +1,67 @@
 from setup.session_setup import session
-from datetime import datetime as dt
-from datetime import timezone as tz
+from data import league_calendar, reference_data, results_store
+from utils.snapshot_utils import stale_while_revalidate
+from utils import clock_utils, date_utils, fetch_utils
+from datetime import timedelta
+from operator import itemgetter
+
+
+# Headers needed for calls to stats.nba.com. Requests without browser-like headers are rejected.
+headers = {
+    'host': "stats.nba.com",
+    'user-agent': "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36",
+    'accept': "application/json, text/plain, */*",
+    'accept-language': "en-US,en;q=0.5",
+    'accept-encoding': "gzip, deflate, br",
+    'connection': "keep-alive",
+    'referer': "https://stats.nba.com/",
+    'pragma': "no-cache",
+    'cache-control': "no-cache",
+    'sec-ch-ua': "\"Chromium\";v=\"140\", \"Google Chrome\";v=\"140\", \"Not;A=Brand\";v=\"24\"",
+    'sec-ch-ua-mobile': "?0",
+    'sec-fetch-dest': "empty"
+}
+
+
+# Columns of the leaguestandingsv3 resultSet used to build standings. The endpoint returns dozens more per team.
+standings_columns = ['TeamID', 'Division', 'DivisionRank', 'Conference', 'PlayoffRank', 'WinPCT', 'ClinchedPostSeason']
+
+
+@stale_while_revalidate(max_age=30)
+def get_games(dates):
+    """ Loads NBA game data for the provided dates (e.g., yesterday and today during rollover).
+    Each endpoint returns a single date, so each date is requested concurrently.
 
+    Args:
+        dates (tuple): Dates that game data should be pulled for.
+
+    Returns:
+        dict: List of dicts of game data for each date, keyed by date.
+    """
+
+    # Request each date concurrently. Dates load independently, so a failed request for one (e.g., yesterday's during rollover) doesn't throw away the fresh games of the others.
+    games_by_date = dict(zip(dates, fetch_utils.run_concurrently([(get_games_on_date, (date,)) for date in dates], raise_errors=False)))
+
+    # Earlier dates that failed fall back to their games from the last successful load, or are left out if never loaded (callers skip missing dates).
+    # If the last date (the current day displayed) failed, raise the error so the last good data is returned and flagged stale.
+    for date, games in list(games_by_date.items()):
+        if isinstance(games, Exception):
+            if date == dates[-1]:
+                raise games
+            print(f'Unable to load NBA games on {date}: {games!r}')
+
+            previous_games = get_games_snapshot(date)
+            if previous_games is not None:
+                games_by_date[date] = previous_games
+            else:
+                del games_by_date[date]
 
-def get_games(date):
+    return games_by_date
+
+
+def get_games_on_date(date):
     """ Loads NBA game data for the provided date.
+    Routes directly to the endpoint appropriate for the date requested. Completed past dates are served from the results store as they never change.
 
     Args:
         date (date): Date that game data should be pulled for.
@@ -13,51 +70,74 @@ def get_games(date):
         list: List of dicts of game data.
     """
 
-    # Create an empty list to hold the game dicts.
-    games = []
+    # Note the current date to determine if the date requested is in the past, present, or future.
+    cur_date = clock_utils.now().astimezone().date()
 
-    # First, hit the todayScoreboard endpoint to see what date it is returning.
-    url = 'https://cdn.nba.com/static/json/liveData/scoreboard/todaysScoreboard_00.json'
-    games_response = session.get(url=url)
-    games_response_date = dt.strptime(games_response.json()['scoreboard']['gameDate'], '%Y-%m-%d').date()
+    # Past dates. If previously pulled and all games were complete, return the stored results without any API calls.
+    if date < cur_date:
+        stored_games = results_store.get_games('nba', date)
+        if stored_games is not None:
+            return stored_games
 
-    # If the date returned by the live score endpoint matches the date requested, use these results.
-    if games_response_date == date:
-        games_json = games_response.json()['scoreboard']['games']
+    games_json = None
+
+    # Today. Hit the todaysScoreboard endpoint, parsing the response a single time.
+    if date == cur_date:
+        url = 'https://cdn.nba.com/static/json/liveData/scoreboard/todaysScoreboard_00.json'
+        scoreboard_json = session.get(url=url).json()['scoreboard']
+
+        # Only use these results if the date returned by the live score endpoint matches the date requested. Around midnight the endpoint can still be returning the previous day.
+        if date_utils.parse_date(scoreboard_json['gameDate'], '%Y-%m-%d') == date:
+            games_json = scoreboard_json['games']
 
-    # Otherwise, hit the scoreboardv3 endpoint w/ the date param.
-    else:
-        # Call the NBA game API for the date specified and store the JSON results.
-        url = 'https://stats.nba.com/stats/scoreboardv3?LeagueID=00'    
-        headers = {
-            'host': "stats.nba.com",
-            'user-agent': "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36",
-            'accept': "application/json, text/plain, */*",
-            'accept-language': "en-US,en;q=0.5",
-            'accept-encoding': "gzip, deflate, br",
-            'connection': "keep-alive",
-            'referer': "https://stats.nba.com/",
-            'pragma': "no-cache",
-            'cache-control': "no-cache",
-            'sec-ch-ua': "\"Chromium\";v=\"140\", \"Google Chrome\";v=\"140\", \"Not;A=Brand\";v=\"24\"",
-            'sec-ch-ua-mobile': "?0",
-            'sec-fetch-dest': "empty"
-        }
+    # Past or future dates (or today when the live endpoint hasn't rolled over yet). Hit the scoreboardv3 endpoint w/ the date param.
+    if games_json is None:
+        url = 'https://stats.nba.com/stats/scoreboardv3?LeagueID=00'
         games_response = session.get(url=f"{url}&GameDate={date.strftime(format='%Y-%m-%d')}", headers=headers)
         games_json = games_response.json()['scoreboard']['games']
 
+    # Build a list of game dicts from the returned JSON.
+    games = parse_games(games_json)
+
+    # If the date is in the past and all games are complete, the results will never change. Save them to the results store.
+    if date < cur_date and all(game['status_code'] == 3 for game in games):
+        results_store.save_games('nba', date, games)
+
+    # If there are games today, the league is active. If there are none on the date, games scenes can skip it.
+    if games and date == cur_date:
+        league_calendar.note_next_game_date('nba', date)
+    elif not games:
+        league_calendar.note_no_games_on_date('nba', date)
+
+    return games
+
+
+def parse_games(games_json):
+    """ Builds game dicts from the games returned by either the todaysScoreboard or scoreboardv3 endpoint. Both share the same game structure.
+
+    Args:
+        games_json (list): List of games as returned by the NBA API.
+
+    Returns:
+        list: List of dicts of game data, sorted by game ID.
+    """
+
+    # Create an empty list to hold the game dicts.
+    games = []
+
     # For each game, build a dict recording current game details.
-    if games_json: # If games today.
+    if games_json: # If games on the date.
         for game in games_json:
             if 'All-Star' not in game['gameLabel'] and 'Preseason' not in game['gameLabel']: # This should leave regular season and playoff games.
+                start_datetime_utc, start_datetime_local = date_utils.parse_timestamp(game['gameTimeUTC'])
                 games.append({
                     'game_id': game['gameId'],
                     'home_abrv': game['homeTeam']['teamTricode'],
                     'away_abrv': game['awayTeam']['teamTricode'],
                     'home_score': game['homeTeam']['score'],
                     'away_score': game['awayTeam']['score'],
-                    'start_datetime_utc': dt.strptime(game['gameTimeUTC'], '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=tz.utc),
-                    'start_datetime_local': dt.strptime(game['gameTimeUTC'], '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=tz.utc).astimezone(tz=None), # Convert UTC to local time.
+                    'start_datetime_utc': start_datetime_utc,
+                    'start_datetime_local': start_datetime_local, # Converted from UTC to local time.
                     'status': game['gameStatusText'],
                     'status_code': game['gameStatus'], # 1=Scheduled, 2=In Progress, 3=Final.
                     'has_started': True if game['gameStatus'] > 1 else False,
@@ -65,6 +145,8 @@ def get_games(date):
                     'period_type': 'OT' if game['period'] > 4 else 'Std',
                     'period_time_remaining': game['gameClock'][2:4] + ':' + game['gameClock'][5:7] if game['gameClock'] != ':' else None, # API returns time remaining in PT##M##.##S format.
                     'is_halftime': True if game['gameClock'] == 'PT00M00.00S' and game['period'] == 2 else False, # No explicit halftime flag, so infer based on period and clock.
+                    'is_clock_running': True if game['gameStatus'] == 2 and game['gameClock'] not in [':', 'PT00M00.00S'] else False, # No explicit flag, so assume running while in progress with time on the clock.
+                    'clock_synced_at': clock_utils.monotonic(), # When the above clock details were pulled. Allows the clock to be ticked forward locally until the next pull.
                     # Will set the remaining later, default to False and None for now.
                     'home_team_scored': False,
                     'away_team_scored': False,
@@ -77,6 +159,27 @@ def get_games(date):
     return games
 
 
+def get_games_snapshot(date, max_age=None):
+    """ Gets the games on date from those already loaded by get_games, without making any API calls.
+    Games are loaded for today alone, or w/ yesterday during rollover, so checks date alone and paired w/ either neighbouring day.
+
+    Args:
+        date (date): Date of the games.
+        max_age (float, optional): Max seconds since the games were loaded. Defaults to None (any age).
+
+    Returns:
+        list: List of dicts of game data. None if games on date haven't been loaded (recently).
+    """
+
+    for dates in [(date,), (date - timedelta(days=1), date), (date, date + timedelta(days=1))]:
+        games_by_date = get_games.snapshot_data(dates, max_age=max_age)
+        if games_by_date is not None:
+            return games_by_date.get(date) # Missing if the date failed to load.
+
+    return None
+
+
+@stale_while_revalidate(max_age=300, share_within_cycle=True)
 def get_next_game(team):
     """ Loads next game details for the supplied NBA team.
     If the team is currently playing, will return details of the current game.
@@ -94,40 +197,32 @@ def get_next_game(team):
     # Call the NBA schedule API for the team specified and store the JSON results.
     # TODO: Save these results to avoid multiple calls if multiple favorite teams are set.
     url = 'https://stats.nba.com/stats/scheduleleaguev2?LeagueID=00'   
-    headers = {
-        'host': "stats.nba.com",
-        'user-agent': "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36",
-        'accept': "application/json, text/plain, */*",
-        'accept-language': "en-US,en;q=0.5",
-        'accept-encoding': "gzip, deflate, br",
-        'connection': "keep-alive",
-        'referer': "https://stats.nba.com/",
-        'pragma': "no-cache",
-        'cache-control': "no-cache",
-        'sec-ch-ua': "\"Chromium\";v=\"140\", \"Google Chrome\";v=\"140\", \"Not;A=Brand\";v=\"24\"",
-        'sec-ch-ua-mobile': "?0",
-        'sec-fetch-dest': "empty"
-    }
     schedule_response = session.get(url=f'{url}&Season={season}', headers=headers)
     schedule_json = schedule_response.json()['leagueSchedule']['gameDates']
 
     # Determine the future games.
-    cur_datetime = dt.today().astimezone()
+    cur_datetime = clock_utils.now().astimezone()
     cur_date = cur_datetime.date()
-    upcoming_days_games = [day_games for day_games in schedule_json if dt.strptime(day_games['gameDate'], '%m/%d/%Y %H:%M:%S').date() >= cur_date]
+    upcoming_days_games = [day_games for day_games in schedule_json if date_utils.parse_date(day_games['gameDate'], '%m/%d/%Y %H:%M:%S') >= cur_date]
+
+    # Note the date of the league's next game, if any left this season.
+    upcoming_dates = [date_utils.parse_date(day_games['gameDate'], '%m/%d/%Y %H:%M:%S') for day_games in upcoming_days_games if day_games['games']]
+    league_calendar.note_next_game_date('nba', upcoming_dates[0] if upcoming_dates else None)
     
     # Determine the next game for the team specified and return game details.
     for day_game in upcoming_days_games:
         for game in day_game['games']:
             if game['homeTeam']['teamTricode'] == team or game['awayTeam']['teamTricode'] == team:
+                start_datetime_utc, start_datetime_local = date_utils.parse_timestamp(game['gameDateTimeUTC'])
+
                 # Put together a dictionary with needed details.
                 next_game = {
                     'home_or_away': 'away' if game['homeTeam']['teamTricode'] != team else 'home',
                     'opponent_abrv': game['homeTeam']['teamTricode'] if game['homeTeam']['teamTricode'] != team else game['awayTeam']['teamTricode'],
-                    'start_datetime_utc': dt.strptime(game['gameDateTimeUTC'], '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=tz.utc),
-                    'start_datetime_local': dt.strptime(game['gameDateTimeUTC'], '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=tz.utc).astimezone(tz=None),
-                    'is_today': True if dt.strptime(game['gameDateTimeUTC'], '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=tz.utc).astimezone(tz=None).date() == cur_date or dt.strptime(game['gameDateTimeUTC'], '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=tz.utc).astimezone(tz=None) < cur_datetime else False, # TODO: clean this up. Needed in case game is still going when date rolls over.
-                    'has_started': True if cur_datetime >= dt.strptime(game['gameDateTimeUTC'], '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=tz.utc).astimezone(tz=None) else False
+                    'start_datetime_utc': start_datetime_utc,
+                    'start_datetime_local': start_datetime_local,
+                    'is_today': True if start_datetime_local.date() == cur_date or start_datetime_local < cur_datetime else False, # Needed in case game is still going when date rolls over.
+                    'has_started': True if cur_datetime >= start_datetime_local else False
                 }
 
                 # Skip to next game if this one has started more than 3 hours ago (longer than an avg game). Schedule API doesn't update in real-time w/ game status.
@@ -140,6 +235,7 @@ def get_next_game(team):
     return None
 
 
+@stale_while_revalidate(max_age=600, share_within_cycle=True)
 def get_standings():
     """ Loads current NBA standings by division, conference, and overall league.
 
@@ -152,82 +248,18 @@ def get_standings():
 
     # Call the NBA standings API and store the JSON results.
     url = 'https://stats.nba.com/stats/leaguestandingsv3?LeagueID=00&SeasonType=Regular Season'    
-    headers = {
-        'host': "stats.nba.com",
-        'user-agent': "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36",
-        'accept': "application/json, text/plain, */*",
-        'accept-language': "en-US,en;q=0.5",
-        'accept-encoding': "gzip, deflate, br",
-        'connection': "keep-alive",
-        'referer': "https://stats.nba.com/",
-        'pragma': "no-cache",
-        'cache-control': "no-cache",
-        'sec-ch-ua': "\"Chromium\";v=\"140\", \"Google Chrome\";v=\"140\", \"Not;A=Brand\";v=\"24\"",
-        'sec-ch-ua-mobile': "?0",
-        'sec-fetch-dest': "empty"
-    }
     standings_response = session.get(url=f'{url}&Season={season}', headers=headers)
-    standings_json_unprocessed = standings_response.json()['resultSets'][0]
-
-    # Process the returned JSON into a more usable format.
-    standings_json = []
-    for team in standings_json_unprocessed['rowSet']:
-        team_values = {}
-        for header, value in zip(standings_json_unprocessed['headers'], team):
-            team_values[header] = value
-        
-        # Add the team abbreviation to the dict based on the dict defined above.
+    standings_result_set = standings_response.json()['resultSets'][0]
+
+    # Process the returned JSON into a more usable format, reading only the columns used below.
+    standings_json = read_result_set(standings_result_set, standings_columns)
+    for team_values in standings_json:
+        # Add the team abbreviation to the dict based on the reference table.
         team_values['teamTricode'] = determine_team_abbreviation(team_values['TeamID'])
-        standings_json.append(team_values)
 
-    # Set up structure of the returned dict.
+    # Set up structure of the returned dict from the reference template.
     # Teams lists will be populated w/ the API results.
-    standings = {
-        'rank_method': 'Win Percentage',
-        'division': {
-            'divisions': {
-                'Atlantic': {
-                    'abrv': 'Atl',
-                    'teams': []
-                },
-                'Central': {
-                    'abrv': 'Cen',
-                    'teams': []
-                },
-                'Southeast': {
-                    'abrv': 'SE',
-                    'teams': []
-                },
-                'Northwest': {
-                    'abrv': 'NW',
-                    'teams': []
-                },
-                'Pacific': {
-                    'abrv': 'Pac',
-                    'teams': []
-                },
-                'Southwest': {
-                    'abrv': 'SW',
-                    'teams': []
-                }
-            }
-        },
-
-        'conference': {
-            'playoff_cutoff_hard': 10,
-            'playoff_cutoff_soft': 6,
-            'conferences': {
-                'East': {
-                    'abrv': 'Est',
-                    'teams': []
-                },
-                'West': {
-                    'abrv': 'Wst',
-                    'teams': []
-                },
-            }
-        }
-    }
+    standings = reference_data.build_standings_skeleton(reference_data.NBA_STANDINGS_TEMPLATE)
 
     # Populate the team lists w/ dicts containing details of each team.
     # API returns teams in overall standing order, so generally won't have to sort.
@@ -255,6 +287,26 @@ def get_standings():
     return standings
 
 
+def read_result_set(result_set, columns):
+    """ Reads the provided columns of a resultSet, the tabular format returned by stats.nba.com endpoints (a list of headers, and a rowSet of lists of values).
+    The index of each column is resolved once for the whole resultSet, and only those values are copied out of each row.
+
+    Args:
+        result_set (dict): resultSet as returned by a stats.nba.com endpoint.
+        columns (list): Headers of the columns to read.
+
+    Returns:
+        list: List of dicts, one per row, of the values of the columns keyed by header.
+    """
+
+    # Resolve column indices. Errors if a column is missing, as that means the endpoint has changed.
+    indices = [result_set['headers'].index(column) for column in columns]
+
+    # Read the columns from each row. itemgetter returns a tuple for multiple indices, but a bare value for one, so wrap it.
+    get_values = itemgetter(*indices) if len(indices) > 1 else lambda row: (row[indices[0]],)
+    return [dict(zip(columns, get_values(row))) for row in result_set['rowSet']]
+
+
 def determine_current_season():
     """ Determines the current NBA season based on the current date.
 
@@ -262,7 +314,7 @@ def determine_current_season():
         str: Current NBA season in 'YYYY-YY' format.
     """
 
-    cur_date = dt.today().astimezone().date()
+    cur_date = clock_utils.now().astimezone().date()
     season = f'{cur_date.year}-{str(cur_date.year + 1)[2:4]}' if cur_date.month >= 7 else f'{cur_date.year -1}-{str(cur_date.year)[2:4]}'
     return season
 
@@ -277,38 +329,4 @@ def determine_team_abbreviation(team_id):
         str: Team tricode.
     """
 
-    # Mapping of NBA teams IDs to abbreviations. Needed since schedule API does not return abbreviations.
-    team_ids_to_abbreviations = {
-        1610612737: 'ATL',
-        1610612738: 'BOS',
-        1610612739: 'CLE',
-        1610612740: 'NOP',
-        1610612741: 'CHI',
-        1610612742: 'DAL',
-        1610612743: 'DEN',
-        1610612744: 'GSW',
-        1610612745: 'HOU',
-        1610612746: 'LAC',
-        1610612747: 'LAL',
-        1610612748: 'MIA',
-        1610612749: 'MIL',
-        1610612750: 'MIN',
-        1610612751: 'BKN',
-        1610612752: 'NYK',
-        1610612753: 'ORL',
-        1610612754: 'IND',
-        1610612755: 'PHI',
-        1610612756: 'PHX',
-        1610612757: 'POR',
-        1610612758: 'SAC',
-        1610612759: 'SAS',
-        1610612760: 'OKC',
-        1610612761: 'TOR',
-        1610612762: 'UTA',
-        1610612763: 'MEM',
-        1610612764: 'WAS',
-        1610612765: 'DET',
-        1610612766: 'CHA'
-    }
-
-    return team_ids_to_abbreviations.get(team_id, None)
\ No newline at end of file
+    return reference_data.NBA_TEAM_ABBREVIATIONS.get(team_id, None)
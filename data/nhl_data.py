@@ -1,9 +1,43 @@
 from setup.session_setup import session
-from datetime import datetime as dt
-from datetime import timezone as tz
+from data import league_calendar, reference_data, results_store
+from utils.snapshot_utils import stale_while_revalidate
+from utils import clock_utils, date_utils, fetch_utils
+from datetime import timedelta
 
 
-def get_games(date):
+@stale_while_revalidate(max_age=30)
+def get_games(dates):
+    """ Loads NHL game data for the provided dates (e.g., yesterday and today during rollover).
+    The score endpoint returns a single date, so each date is requested concurrently. The schedule endpoint covers a week, but lacks the live clock/period details.
+
+    Args:
+        dates (tuple): Dates that game data should be pulled for.
+
+    Returns:
+        dict: List of dicts of game data for each date, keyed by date.
+    """
+
+    # Request each date concurrently. Dates load independently, so a failed request for one (e.g., yesterday's during rollover) doesn't throw away the fresh games of the others.
+    games_by_date = dict(zip(dates, fetch_utils.run_concurrently([(get_games_on_date, (date,)) for date in dates], raise_errors=False)))
+
+    # Earlier dates that failed fall back to their games from the last successful load, or are left out if never loaded (callers skip missing dates).
+    # If the last date (the current day displayed) failed, raise the error so the last good data is returned and flagged stale.
+    for date, games in list(games_by_date.items()):
+        if isinstance(games, Exception):
+            if date == dates[-1]:
+                raise games
+            print(f'Unable to load NHL games on {date}: {games!r}')
+
+            previous_games = get_games_snapshot(date)
+            if previous_games is not None:
+                games_by_date[date] = previous_games
+            else:
+                del games_by_date[date]
+
+    return games_by_date
+
+
+def get_games_on_date(date):
     """ Loads NHL game data for the provided date.
 
     Args:
@@ -12,6 +46,13 @@ def get_games(date):
     Returns:
         list: List of dicts of game data.
     """
+
+    # Past dates where all games were complete are served from the results store without any API calls.
+    is_past_date = date < clock_utils.now().astimezone().date()
+    if is_past_date:
+        stored_games = results_store.get_games('nhl', date)
+        if stored_games is not None:
+            return stored_games
     
     # Create an empty list to hold the game dicts.
     games = []
@@ -27,31 +68,110 @@ def get_games(date):
             # Append the dict to the games list. We only want to get regular season (gameType = 2) and playoff (3) games.
             # Note that 19 and 20 may need to be included. These were used for the 4 Nations Face-Off round robin & finals and will be evaluated again in the future.
             if game['gameType'] in [2, 3]:
+                start_datetime_utc, start_datetime_local = date_utils.parse_timestamp(game['startTimeUTC'])
                 games.append({
                     'game_id': game['id'],
                     'home_abrv': game['homeTeam']['abbrev'],
                     'away_abrv': game['awayTeam']['abbrev'],
                     'home_score': game['homeTeam'].get('score'), # Doesn't exist until game starts.
                     'away_score': game['awayTeam'].get('score'),
-                    'start_datetime_utc': dt.strptime(game['startTimeUTC'], '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=tz.utc),
-                    'start_datetime_local': dt.strptime(game['startTimeUTC'], '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=tz.utc).astimezone(tz=None), # Convert UTC to local time.
+                    'start_datetime_utc': start_datetime_utc,
+                    'start_datetime_local': start_datetime_local, # Converted from UTC to local time.
                     'status': game['gameState'],
-                    'has_started': True if game['gameState'] in ['LIVE', 'CRIT', 'OFF', 'FINAL'] else False,
+                    'has_started': True if game['gameState'] in ['LIVE', 'CRIT', 'OVER', 'OFF', 'FINAL'] else False,
                     'period_num': game.get('period'), # Doesn't until game starts.
                     'period_type': game.get('periodDescriptor', {}).get('periodType'), # periodDescriptor doesn't exist until game starts.
                     'period_time_remaining': game.get('clock', {}).get('timeRemaining'), # clock doesn't exist until game starts.
                     'is_intermission': game.get('clock', {}).get('inIntermission'),
+                    'is_clock_running': game.get('clock', {}).get('running', False),
+                    'clock_synced_at': clock_utils.monotonic(), # When the above clock details were pulled. Allows the clock to be ticked forward locally until the next pull.
                     # Will set the remaining later, default to False and None for now.
                     'home_team_scored': False,
                     'away_team_scored': False,
                     'scoring_team': None
                 })
 
+    # If the date is in the past and all games are official finals, the results will never change. Save them to the results store.
+    if is_past_date and all(game['status'] == 'OFF' for game in games):
+        results_store.save_games('nhl', date, games)
+
+    # If there are games today, the league is active. If there are none on the date, games scenes can skip it.
+    if games and date == clock_utils.now().astimezone().date():
+        league_calendar.note_next_game_date('nhl', date)
+    elif not games:
+        league_calendar.note_no_games_on_date('nhl', date)
+
     return games
 
 
+@stale_while_revalidate(max_age=300, share_within_cycle=True)
+def get_next_games(teams):
+    """ Loads next game details for each of the supplied NHL teams, w/ as few API calls as possible regardless of the number of teams.
+    Teams playing today are resolved from today's games if already loaded (e.g., by the games scene), which are more up to date than any schedule.
+    Other teams are resolved from a single call for the league schedule of the coming week. Only teams without a game that week (e.g., breaks, off-season) need their own call.
+    If a team is currently playing, will return details of the current game. This includes games that started yesterday and are still going after midnight.
+
+    Args:
+        teams (tuple): Three char abbreviations of the teams to pull next game details for.
+
+    Returns:
+        dict: Dict of next game details for each team (None if no next game found), keyed by team.
+    """
+
+    # Note the current datetime.
+    cur_datetime = clock_utils.now().astimezone()
+    cur_date = cur_datetime.date()
+
+    next_games = {}
+
+    # Resolve teams playing today from yesterday's and today's games, if loaded recently. Only games in progress from yesterday (i.e., still going after midnight), and games that haven't concluded from today.
+    for date, statuses in [(cur_date - timedelta(days=1), ('LIVE', 'CRIT')), (cur_date, ('FUT', 'PRE', 'LIVE', 'CRIT'))]:
+        for game in get_games_snapshot(date, max_age=300) or []:
+            if game['status'] not in statuses:
+                continue
+            for team in teams:
+                if team in (game['home_abrv'], game['away_abrv']) and team not in next_games:
+                    next_games[team] = {
+                        'home_or_away': 'away' if game['home_abrv'] != team else 'home',
+                        'opponent_abrv': game['home_abrv'] if game['home_abrv'] != team else game['away_abrv'],
+                        'start_datetime_utc': game['start_datetime_utc'],
+                        'start_datetime_local': game['start_datetime_local'],
+                        'is_today': True, # In progress games from yesterday are still considered today's.
+                        'has_started': True if game['status'] in ('LIVE', 'CRIT') else False
+                    }
+
+    # Resolve the remaining teams from the league schedule for the week starting yesterday, so games still going after midnight are included.
+    # Filter to games in progress from yesterday, and games that have not already concluded from today on.
+    remaining_teams = [team for team in teams if team not in next_games]
+    if remaining_teams:
+        url = 'https://api-web.nhle.com/v1/schedule/'
+        schedule_response = session.get(url=f"{url}{(cur_date - timedelta(days=1)).strftime(format='%Y-%m-%d')}")
+        schedule_json = schedule_response.json()['gameWeek']
+        upcoming_days = [
+            {'date': day['date'], 'games': [game for game in day['games'] if game['gameState'] in (('FUT', 'PRE', 'LIVE', 'CRIT') if date_utils.parse_date(day['date'], '%Y-%m-%d') >= cur_date else ('LIVE', 'CRIT'))]}
+            for day in schedule_json
+        ]
+        upcoming_games = [game for day in upcoming_days for game in day['games']]
+
+        # Note the date of the league's next game, if any in the coming week. Games still going from yesterday count as today's.
+        upcoming_dates = [max(date_utils.parse_date(day['date'], '%Y-%m-%d'), cur_date) for day in upcoming_days if day['games']]
+        league_calendar.note_next_game_date('nhl', upcoming_dates[0] if upcoming_dates else None)
+
+        for team in remaining_teams:
+            next_game_details = next((game for game in upcoming_games if team in (game['homeTeam']['abbrev'], game['awayTeam']['abbrev'])), None)
+            if next_game_details:
+                next_games[team] = build_next_game(team, next_game_details, cur_datetime)
+
+    # Teams w/o a game this week need the season schedule of their team.
+    for team in teams:
+        if team not in next_games:
+            next_games[team] = get_next_game(team)
+
+    return next_games
+
+
 def get_next_game(team):
-    """ Loads next game details for the supplied NHL team.
+    """ Loads next game details for the supplied NHL team from the team's season schedule. Used by get_next_games for teams w/o a game in the coming week.
     If the team is currently playing, will return details of the current game.
 
     Args:
@@ -62,8 +182,7 @@ def get_next_game(team):
     """
     
     # Note the current datetime.
-    cur_datetime = dt.today().astimezone()
-    cur_date = dt.today().astimezone().date()
+    cur_datetime = clock_utils.now().astimezone()
 
     # Call the NHL schedule API for the team specified and store the JSON results.
     url = f'https://api-web.nhle.com/v1/club-schedule-season/{team}/now'
@@ -75,21 +194,59 @@ def get_next_game(team):
     next_game_details = upcoming_games[0] if len(upcoming_games) > 0 else None
 
     if next_game_details:
-        # Put together a dictionary with needed details.
-        next_game = {
-            'home_or_away': 'away' if next_game_details['homeTeam']['abbrev'] != team else 'home',
-            'opponent_abrv': next_game_details['homeTeam']['abbrev'] if next_game_details['homeTeam']['abbrev'] != team else next_game_details['awayTeam']['abbrev'],
-            'start_datetime_utc': dt.strptime(next_game_details['startTimeUTC'], '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=tz.utc),
-            'start_datetime_local': dt.strptime(next_game_details['startTimeUTC'], '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=tz.utc).astimezone(tz=None),
-            'is_today': True if dt.strptime(next_game_details['startTimeUTC'], '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=tz.utc).astimezone(tz=None).date() == cur_date or dt.strptime(next_game_details['startTimeUTC'], '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=tz.utc).astimezone(tz=None) < cur_datetime else False, # TODO: clean this up. Needed in case game is still going when date rolls over.
-            'has_started': True if next_game_details['gameState'] in ('LIVE', 'CRIT') else False
-        }
-        return(next_game)
+        return build_next_game(team, next_game_details, cur_datetime)
     
     # If no next game found, return None.
     return None
 
 
+def build_next_game(team, next_game_details, cur_datetime):
+    """ Builds next game details for the supplied NHL team from a game as returned by the schedule APIs (league or team).
+
+    Args:
+        team (str): Three char abbreviation of the team.
+        next_game_details (dict): Game as returned by the schedule API.
+        cur_datetime (datetime): Current local datetime.
+
+    Returns:
+        dict: Dict of next game details.
+    """
+
+    start_datetime_utc, start_datetime_local = date_utils.parse_timestamp(next_game_details['startTimeUTC'])
+
+    # Put together a dictionary with needed details.
+    next_game = {
+        'home_or_away': 'away' if next_game_details['homeTeam']['abbrev'] != team else 'home',
+        'opponent_abrv': next_game_details['homeTeam']['abbrev'] if next_game_details['homeTeam']['abbrev'] != team else next_game_details['awayTeam']['abbrev'],
+        'start_datetime_utc': start_datetime_utc,
+        'start_datetime_local': start_datetime_local,
+        'is_today': True if start_datetime_local.date() == cur_datetime.date() or start_datetime_local < cur_datetime else False, # Needed in case game is still going when date rolls over.
+        'has_started': True if next_game_details['gameState'] in ('LIVE', 'CRIT') else False
+    }
+    return next_game
+
+
+def get_games_snapshot(date, max_age=None):
+    """ Gets the games on date from those already loaded by get_games (e.g., by the games scene), without making any API calls.
+    Games are loaded for today alone, or w/ yesterday during rollover, so checks date alone and paired w/ either neighbouring day.
+
+    Args:
+        date (date): Date of the games.
+        max_age (float, optional): Max seconds since the games were loaded. Defaults to None (any age).
+
+    Returns:
+        list: List of dicts of game data. None if games on date haven't been loaded (recently).
+    """
+
+    for dates in [(date,), (date - timedelta(days=1), date), (date, date + timedelta(days=1))]:
+        games_by_date = get_games.snapshot_data(dates, max_age=max_age)
+        if games_by_date is not None:
+            return games_by_date.get(date) # Missing if the date failed to load.
+
+    return None
+
+
+@stale_while_revalidate(max_age=600, share_within_cycle=True)
 def get_standings():
     """ Loads current NHL standings by division, wildcard, conference, and overall league.
 
@@ -102,70 +259,9 @@ def get_standings():
     standings_response = session.get(url=url)
     standings_json = standings_response.json()['standings']
 
-    # Set up structure of the returned dict.
+    # Set up structure of the returned dict from the reference template.
     # Teams lists will be populated w/ the API results.
-    standings = {
-        'rank_method': 'Points',
-        'division': {
-            'playoff_cutoff_soft': 3, # Notes how many teams from each div make the playoffs before wildcards.
-            'divisions': {
-                'Atlantic': {
-                    'abrv': 'Atl',
-                    'teams': []
-                },
-                'Metropolitan': {
-                    'abrv': 'Met',
-                    'teams': []
-                },
-                'Central': {
-                    'abrv': 'Cen',
-                    'teams': []
-                },
-                'Pacific': {
-                    'abrv': 'Pac',
-                    'teams': []
-                }
-            }
-         },
-
-        'wildcard': {
-            'playoff_cutoff_hard': 8, # Not exactly true... but will help build the images. Total num of playoff bound teams.
-            'playoff_cutoff_soft': 6,
-            'conferences': {
-                'Eastern': {
-                    'abrv': 'Est',
-                    'teams': []
-                },
-                'Western': {
-                    'abrv': 'Wst',
-                    'teams': []
-                }
-            }
-        },
-
-        # Structure for conferences and league is not the best, but want to leave open in case of future divisional changes (e.g., return to conference based playoff thresholds).
-        'conference': {
-            'conferences': {
-                'Eastern': {
-                    'abrv': 'Est',
-                    'teams': []
-                },
-                'Western': {
-                    'abrv': 'Wst',
-                    'teams': []
-                },
-            }
-        },
-
-        'league': {
-            'leagues': {
-                'NHL': {
-                    'abrv': 'All',
-                    'teams': []
-                }
-            }
-        }
-    }
+    standings = reference_data.build_standings_skeleton(reference_data.NHL_STANDINGS_TEMPLATE)
 
     # Populate the team lists w/ dicts containing details of each team.
     # API returns teams in overall standing order, so generally won't have to sort.
@@ -1,45 +1,66 @@
 from setup.session_setup import session
-from datetime import datetime as dt
-from datetime import timezone as tz
+from data import league_calendar, reference_data, results_store
+from utils.snapshot_utils import stale_while_revalidate
+from utils import clock_utils, date_utils, fetch_utils
 import json
 
 
 key = '446521baf8c38984'  # API key for PWHL data. https://github.com/IsabelleLefebvre97/PWHL-Data-Reference
 
-def get_games(date):
-    """ Placeholder: Loads PWHL game data for the provided date.
+@stale_while_revalidate(max_age=30)
+def get_games(dates):
+    """ Loads PWHL game data for the provided dates (e.g., yesterday and today during rollover).
+    The scorebar covers yesterday through tomorrow, so all dates are served by a single request.
 
     Args:
-        date (date): Date that game data should be pulled for.
+        dates (tuple): Dates that game data should be pulled for.
 
     Returns:
-        list: List of dicts of game data. (Currently placeholder — implement API calls.)
+        dict: List of dicts of game data for each date, keyed by date.
     """
-    
-    # Create an empty list to hold the game dicts.
-    games = []
 
-    # Call the PWHL game API for the date specified and store the JSON results. First determine the current season.
-    cur_season_id = get_season_id()
+    # Past dates where all games were complete are served from the results store without any API calls.
+    cur_date = clock_utils.now().astimezone().date()
+    games_by_date = {}
+    for date in dates:
+        if date < cur_date:
+            stored_games = results_store.get_games('pwhl', date)
+            if stored_games is not None:
+                games_by_date[date] = stored_games
+
+    # Note the remaining dates by the date format used by the API. Nothing more to do if there are none.
+    dates_to_pull = {date.strftime('%Y-%m-%d'): date for date in dates if date not in games_by_date}
+    if not dates_to_pull:
+        return games_by_date
+
+    # Create an empty list to hold the game dicts of each date.
+    for date in dates_to_pull.values():
+        games_by_date[date] = []
+
+    # Call the PWHL game API and store the JSON results. Determine the current season concurrently, as the two calls are independent.
     url = f'https://lscluster.hockeytech.com/feed/index.php?client_code=pwhl&key={key}&feed=modulekit&view=scorebar&numberofdaysback=1&numberofdaysahead=1'
-    games_response = session.get(url=url)
-    games_json = games_response.json()['SiteKit']['Scorebar']
+    cur_season_id, games_response_json = fetch_utils.run_concurrently([
+        (get_season_id, ()),
+        (fetch_utils.get_json, (url,))
+    ])
+    games_json = games_response_json['SiteKit']['Scorebar']
 
     # For each game, build a dict recording current game details.
-    if games_json: # If games today. # TODO: validate what's returned when no games during range.
+    if games_json: # If games during range. # TODO: validate what's returned when no games during range.
         for game in games_json:
-            if game['SeasonID'] != str(cur_season_id) or game['Date'] != date.strftime('%Y-%m-%d'):
-                continue    # Skip games not in current season or not on the requested date.
+            if game['SeasonID'] != str(cur_season_id) or game['Date'] not in dates_to_pull:
+                continue    # Skip games not in current season or not on a requested date.
             
-            # Append the dict to the games list.
-            games.append({
+            # Append the dict to the games list of its date.
+            start_datetime_utc, start_datetime_local = date_utils.parse_timestamp(game['GameDateISO8601'])
+            games_by_date[dates_to_pull[game['Date']]].append({
                 'game_id': game['ID'],
                 'home_abrv': game['HomeCode'],
                 'away_abrv': game['VisitorCode'],
                 'home_score': int(game['HomeGoals']),
                 'away_score': int(game['VisitorGoals']),
-                'start_datetime_utc': dt.strptime(game['GameDateISO8601'], '%Y-%m-%dT%H:%M:%S%z').astimezone(tz=tz.utc),
-                'start_datetime_local': dt.strptime(game['GameDateISO8601'], '%Y-%m-%dT%H:%M:%S%z').astimezone(tz=None), # Convert UTC to local time.
+                'start_datetime_utc': start_datetime_utc,
+                'start_datetime_local': start_datetime_local, # Converted from UTC to local time.
                 'status': game['GameStatus'],
                 'has_started': True if game['GameStatus'] in ['2', '3', '4'] else False, # 2 = In Progress, 3 = Unofficial Final,  4 = Final
                 'period_num': int(game['Period']),
@@ -49,18 +70,32 @@ def get_games(date):
                     game['Intermission'] == '1'
                     or (game['GameClock'] == '00:00' and game['GameStatus'] not in ['3', '4']) # Doesn't seem like the API sets Intermission flag consistently, so also check if time is 0 and game not final.
                 ) else False,
+                'is_clock_running': True if game['GameStatus'] == '2' and game['Intermission'] != '1' and game['GameClock'] != '00:00' else False, # No explicit flag, so assume running while in progress with time on the clock.
+                'clock_synced_at': clock_utils.monotonic(), # When the above clock details were pulled. Allows the clock to be ticked forward locally until the next pull.
                 # Will set the remaining later, default to False and None for now.
                 'home_team_scored': False,
                 'away_team_scored': False,
                 'scoring_team': None
             })
     
-    # Sort games by ID to ensure consistent order.
-    games = sorted(games, key=lambda x: x['game_id'])
+    for date in dates_to_pull.values():
+        # Sort games by ID to ensure consistent order.
+        games_by_date[date] = sorted(games_by_date[date], key=lambda x: x['game_id'])
+
+        # If the date is in the past and all games are official finals, the results will never change. Save them to the results store.
+        if date < cur_date and all(game['status'] == '4' for game in games_by_date[date]):
+            results_store.save_games('pwhl', date, games_by_date[date])
+
+        # If there are games today, the league is active. If there are none on the date, games scenes can skip it.
+        if games_by_date[date] and date == cur_date:
+            league_calendar.note_next_game_date('pwhl', date)
+        elif not games_by_date[date]:
+            league_calendar.note_no_games_on_date('pwhl', date)
 
-    return games
+    return games_by_date
 
 
+@stale_while_revalidate(max_age=300, share_within_cycle=True)
 def get_next_game(team):
     """ Placeholder: Loads next game details for the supplied PWHL team.
 
@@ -78,20 +113,26 @@ def get_next_game(team):
     schedule_json = schedule_response.json()['SiteKit']['Schedule']
 
     # Determine the future games.
-    cur_datetime = dt.today().astimezone()
+    cur_datetime = clock_utils.now().astimezone()
     cur_date = cur_datetime.date()
     upcoming_games = [game for  game in schedule_json if game['status'] in ('1','2')] # 1 = Scheduled, 2 = In Progress
 
+    # Note the date of the league's next game, if any left this season.
+    upcoming_dates = [date_utils.parse_timestamp(game['GameDateISO8601'])[1].date() for game in upcoming_games]
+    league_calendar.note_next_game_date('pwhl', min(upcoming_dates) if upcoming_dates else None)
+
     # Determine the next game for the team specified and return game details.
     for game in upcoming_games:
         if game['home_team_code'] == team or game['visiting_team_code'] == team:
+            start_datetime_utc, start_datetime_local = date_utils.parse_timestamp(game['GameDateISO8601'])
+
             # Put together a dictionary with needed details.
             next_game = {
                 'home_or_away': 'away' if game['home_team_code'] != team else 'home',
                 'opponent_abrv': game['home_team_code'] if game['home_team_code'] != team else game['visiting_team_code'],
-                'start_datetime_utc': dt.strptime(game['GameDateISO8601'], '%Y-%m-%dT%H:%M:%S%z').astimezone(tz=tz.utc),
-                'start_datetime_local': dt.strptime(game['GameDateISO8601'], '%Y-%m-%dT%H:%M:%S%z').astimezone(tz=None), # Convert UTC to local time.
-                'is_today': True if dt.strptime(game['GameDateISO8601'], '%Y-%m-%dT%H:%M:%S%z').astimezone(tz=None).date() == cur_date or dt.strptime(game['GameDateISO8601'], '%Y-%m-%dT%H:%M:%S%z').astimezone(tz=None) < cur_datetime else False, # TODO: clean this up. Needed in case game is still going when date rolls over.
+                'start_datetime_utc': start_datetime_utc,
+                'start_datetime_local': start_datetime_local, # Converted from UTC to local time.
+                'is_today': True if start_datetime_local.date() == cur_date or start_datetime_local < cur_datetime else False, # Needed in case game is still going when date rolls over.
                 'has_started': True if game['status'] in ['2', '3', '4'] else False # 2 = In Progress, 3 = Unofficial Final,  4 = Final
             }
 
@@ -101,6 +142,7 @@ def get_next_game(team):
     return None
 
 
+@stale_while_revalidate(max_age=600, share_within_cycle=True)
 def get_standings():
     """ Loads current PWHL standings.
 
@@ -114,20 +156,9 @@ def get_standings():
     standings_response = session.get(url=url)
     standings_json = standings_response.json()['SiteKit']['Statviewtype'][1:] # 0th element is metadata.
 
-    # Set up structure of the returned dict.
+    # Set up structure of the returned dict from the reference template.
     # Teams lists will be populated w/ the API results.
-    standings = {
-        'rank_method': 'Points',
-        'league': {
-            'playoff_cutoff_hard': 4,
-            'leagues': {
-                'PWHL': {
-                    'abrv': '', # Don't want to display anything besides PWHL. #TODO: Clean up logic in parent standings scene to make abrv optional.
-                    'teams': []
-                }
-            }
-        }
-    }
+    standings = reference_data.build_standings_skeleton(reference_data.PWHL_STANDINGS_TEMPLATE)
 
     # Populate the team lists w/ dicts containing details of each team.
     for team in standings_json:
@@ -144,6 +175,7 @@ def get_standings():
     return standings
 
 
+@stale_while_revalidate(max_age=3600, share_within_cycle=True)
 def get_season_id():
     """ Determines the PWHL season ID.
 
@@ -152,14 +184,19 @@ def get_season_id():
     """
 
     # Note the current datetime.
-    cur_datetime = dt.today().astimezone()
-    cur_date = dt.today().astimezone().date()
+    cur_datetime = clock_utils.now().astimezone()
+    cur_date = clock_utils.now().astimezone().date()
 
     # Call the PWHL seasons API and store the JSON results.
     url = f'https://lscluster.hockeytech.com/feed/index.php?client_code=pwhl&key={key}&feed=modulekit&view=seasons'
     seasons_response = session.get(url=url)
     seasons_json = seasons_response.json()['SiteKit']['Seasons']
 
+    # If outside of every season (i.e., off-season), note the league's next games are when the next season starts (if known).
+    if not any(season['start_date'] <= cur_date.strftime('%Y-%m-%d') <= season['end_date'] for season in seasons_json):
+        upcoming_start_dates = [season['start_date'] for season in seasons_json if season['start_date'] > cur_date.strftime('%Y-%m-%d')]
+        league_calendar.note_next_game_date('pwhl', date_utils.parse_date(min(upcoming_start_dates), '%Y-%m-%d') if upcoming_start_dates else None)
+
     # The API returns the current season, but as we don't want preseason games, we'll need to parse further.
     for season in seasons_json:
         # Determine the current season. If preseason, return the next season ID.
@@ -0,0 +1,143 @@
+from types import MappingProxyType
+
+
+def freeze(value):
+    """ Makes a nested dict read-only, so reference tables can't be modified by accident (e.g., by a parser appending to a template).
+
+    Args:
+        value (dict or any): Value to freeze. Nested dicts are frozen too.
+
+    Returns:
+        MappingProxyType or any: Read-only view of the dict, or the value as is if not a dict.
+    """
+
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(nested_value) for key, nested_value in value.items()})
+    return value
+
+
+def build_standings_skeleton(template):
+    """ Builds the structure of a standings dict from one of the templates below, ready for teams to be added.
+    Copies only the template's mappings, and gives each division/conference/league an empty teams list.
+
+    Args:
+        template (MappingProxyType): Standings template. E.g., NHL_STANDINGS_TEMPLATE.
+
+    Returns:
+        dict: Standings dict with empty teams lists.
+    """
+
+    skeleton = {key: build_standings_skeleton(value) if isinstance(value, MappingProxyType) else value for key, value in template.items()}
+
+    # Each grouping (anything w/ an abbreviation) holds a list of teams.
+    if 'abrv' in skeleton:
+        skeleton['teams'] = []
+
+    return skeleton
+
+
+# Mapping of NBA team IDs to abbreviations. Needed since the standings API does not return abbreviations.
+NBA_TEAM_ABBREVIATIONS = freeze({
+    1610612737: 'ATL',
+    1610612738: 'BOS',
+    1610612739: 'CLE',
+    1610612740: 'NOP',
+    1610612741: 'CHI',
+    1610612742: 'DAL',
+    1610612743: 'DEN',
+    1610612744: 'GSW',
+    1610612745: 'HOU',
+    1610612746: 'LAC',
+    1610612747: 'LAL',
+    1610612748: 'MIA',
+    1610612749: 'MIL',
+    1610612750: 'MIN',
+    1610612751: 'BKN',
+    1610612752: 'NYK',
+    1610612753: 'ORL',
+    1610612754: 'IND',
+    1610612755: 'PHI',
+    1610612756: 'PHX',
+    1610612757: 'POR',
+    1610612758: 'SAC',
+    1610612759: 'SAS',
+    1610612760: 'OKC',
+    1610612761: 'TOR',
+    1610612762: 'UTA',
+    1610612763: 'MEM',
+    1610612764: 'WAS',
+    1610612765: 'DET',
+    1610612766: 'CHA'
+})
+
+
+# Structure of the standings dicts returned by each league's get_standings, without teams.
+# Divisions, conferences, etc. are keyed by name as returned by the league's API, so teams can be added to them directly.
+NHL_STANDINGS_TEMPLATE = freeze({
+    'rank_method': 'Points',
+    'division': {
+        'playoff_cutoff_soft': 3, # Notes how many teams from each div make the playoffs before wildcards.
+        'divisions': {
+            'Atlantic': {'abrv': 'Atl'},
+            'Metropolitan': {'abrv': 'Met'},
+            'Central': {'abrv': 'Cen'},
+            'Pacific': {'abrv': 'Pac'}
+        }
+    },
+
+    'wildcard': {
+        'playoff_cutoff_hard': 8, # Not exactly true... but will help build the images. Total num of playoff bound teams.
+        'playoff_cutoff_soft': 6,
+        'conferences': {
+            'Eastern': {'abrv': 'Est'},
+            'Western': {'abrv': 'Wst'}
+        }
+    },
+
+    # Structure for conferences and league is not the best, but want to leave open in case of future divisional changes (e.g., return to conference based playoff thresholds).
+    'conference': {
+        'conferences': {
+            'Eastern': {'abrv': 'Est'},
+            'Western': {'abrv': 'Wst'}
+        }
+    },
+
+    'league': {
+        'leagues': {
+            'NHL': {'abrv': 'All'}
+        }
+    }
+})
+
+NBA_STANDINGS_TEMPLATE = freeze({
+    'rank_method': 'Win Percentage',
+    'division': {
+        'divisions': {
+            'Atlantic': {'abrv': 'Atl'},
+            'Central': {'abrv': 'Cen'},
+            'Southeast': {'abrv': 'SE'},
+            'Northwest': {'abrv': 'NW'},
+            'Pacific': {'abrv': 'Pac'},
+            'Southwest': {'abrv': 'SW'}
+        }
+    },
+
+    'conference': {
+        'playoff_cutoff_hard': 10,
+        'playoff_cutoff_soft': 6,
+        'conferences': {
+            'East': {'abrv': 'Est'},
+            'West': {'abrv': 'Wst'}
+        }
+    }
+})
+
+PWHL_STANDINGS_TEMPLATE = freeze({
+    'rank_method': 'Points',
+    'league': {
+        'playoff_cutoff_hard': 4,
+        'leagues': {
+            'PWHL': {'abrv': ''} # Don't want to display anything besides PWHL. #TODO: Clean up logic in parent standings scene to make abrv optional.
+        }
+    }
+})
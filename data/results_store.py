@@ -0,0 +1,143 @@
+import sqlite3
+import json
+import os
+from contextlib import contextmanager
+from datetime import datetime as dt
+
+
+# Location of the on-disk store. Relative to the app root, like config.yaml and assets.
+store_path = 'cache/results.db'
+
+
+def get_games(league, date):
+    """ Loads stored game data for the provided league and date.
+    Only dates where every game was complete are ever stored, so anything returned here is final.
+
+    Args:
+        league (str): League the games belong to. E.g., 'nhl'.
+        date (date): Date to load game data for.
+
+    Returns:
+        list: List of dicts of game data, or None if the date has not been stored.
+    """
+
+    with connect() as connection:
+        # Check that the date itself was stored. Needed to differentiate between a stored date with no games and a date that's never been stored.
+        day = connection.execute('SELECT 1 FROM days WHERE league = ? AND date = ?', (league, date.isoformat())).fetchone()
+        if not day:
+            return None
+
+        rows = connection.execute('SELECT game_json FROM games WHERE league = ? AND date = ? ORDER BY game_id', (league, date.isoformat())).fetchall()
+
+    return [json.loads(row[0], object_hook=decode_datetimes) for row in rows]
+
+
+def save_games(league, date, games):
+    """ Stores game data for the provided league and date. Should only be called once all games on the date are complete.
+
+    Args:
+        league (str): League the games belong to. E.g., 'nhl'.
+        date (date): Date of the games.
+        games (list): List of dicts of game data.
+    """
+
+    with connect() as connection:
+        # Replace anything stored previously for the date, then record the date and each of its games.
+        connection.execute('DELETE FROM games WHERE league = ? AND date = ?', (league, date.isoformat()))
+        connection.execute('INSERT OR REPLACE INTO days (league, date, num_games) VALUES (?, ?, ?)', (league, date.isoformat(), len(games)))
+        connection.executemany(
+            'INSERT OR REPLACE INTO games (league, game_id, date, home_abrv, away_abrv, game_json) VALUES (?, ?, ?, ?, ?, ?)',
+            [(league, str(game['game_id']), date.isoformat(), game['home_abrv'], game['away_abrv'], json.dumps(game, default=encode_datetimes)) for game in games]
+        )
+
+
+def get_team_results(league, team, num_results=5):
+    """ Loads the most recent stored results for the provided team.
+
+    Args:
+        league (str): League the team belongs to. E.g., 'nhl'.
+        team (str): Team abbreviation.
+        num_results (int, optional): Max number of results to return. Defaults to 5.
+
+    Returns:
+        list: List of dicts of game data, most recent first.
+    """
+
+    with connect() as connection:
+        rows = connection.execute(
+            'SELECT game_json FROM games WHERE league = ? AND (home_abrv = ? OR away_abrv = ?) ORDER BY date DESC, game_id DESC LIMIT ?',
+            (league, team, team, num_results)
+        ).fetchall()
+
+    return [json.loads(row[0], object_hook=decode_datetimes) for row in rows]
+
+
+@contextmanager
+def connect():
+    """ Opens a connection to the store, creating the file and tables if they don't exist yet.
+    A new connection is made for each use so the store can be used safely from any thread. Changes are committed and the connection closed on exit.
+
+    Yields:
+        Connection: sqlite3 connection.
+    """
+
+    os.makedirs(os.path.dirname(store_path), exist_ok=True)
+    connection = sqlite3.connect(store_path)
+
+    # Days table notes which dates are stored. Games table holds the individual games, indexed for lookup by date and by team.
+    connection.executescript('''
+        CREATE TABLE IF NOT EXISTS days (
+            league TEXT NOT NULL,
+            date TEXT NOT NULL,
+            num_games INTEGER NOT NULL,
+            PRIMARY KEY (league, date)
+        );
+        CREATE TABLE IF NOT EXISTS games (
+            league TEXT NOT NULL,
+            game_id TEXT NOT NULL,
+            date TEXT NOT NULL,
+            home_abrv TEXT NOT NULL,
+            away_abrv TEXT NOT NULL,
+            game_json TEXT NOT NULL,
+            PRIMARY KEY (league, game_id)
+        );
+        CREATE INDEX IF NOT EXISTS games_by_date ON games (league, date);
+        CREATE INDEX IF NOT EXISTS games_by_home_team ON games (league, home_abrv, date);
+        CREATE INDEX IF NOT EXISTS games_by_away_team ON games (league, away_abrv, date);
+    ''')
+
+    try:
+        yield connection
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def encode_datetimes(value):
+    """ JSON encoder hook. Converts datetimes to a tagged ISO 8601 string so they can be restored when loaded.
+
+    Args:
+        value (any): Value that the JSON encoder doesn't natively support.
+
+    Returns:
+        dict: Tagged ISO 8601 representation of the datetime.
+    """
+
+    if isinstance(value, dt):
+        return {'__datetime__': value.isoformat()}
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def decode_datetimes(obj):
+    """ JSON decoder hook. Restores datetimes tagged by encode_datetimes.
+
+    Args:
+        obj (dict): Dict decoded by the JSON decoder.
+
+    Returns:
+        any: Restored datetime if obj was tagged, otherwise obj unchanged.
+    """
+
+    if '__datetime__' in obj:
+        return dt.fromisoformat(obj['__datetime__'])
+    return obj
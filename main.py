@@ -10,13 +10,26 @@ from scenes.game_scenes.games_scene_pwhl import PWHLGamesScene
 from scenes.fav_team_next_game_scenes.fav_team_next_game_scene_pwhl import PWHLFavTeamNextGameScene
 from scenes.standings_scenes.standings_scene_pwhl import PWHLStandingsScene
 
-from setup.matrix_setup import matrix, determine_matrix_brightness
-from utils import data_utils
+from scenes.ticker_scenes.ticker_scene import TickerScene
 
+from setup.matrix_setup import brightness_controller
+from setup.session_setup import session
+from data import league_calendar
+from utils import clock_utils, data_utils, fetch_utils, snapshot_utils, warm_start_utils
 
-def run_scoreboard():
-    # Instantiate objects for each of the "scenes" (i.e., visual ideas) supported.
-    scene_mapping = {
+import atexit
+import signal
+import sys
+
+
+def create_scenes():
+    """ Instantiates objects for each of the "scenes" (i.e., visual ideas) supported.
+
+    Returns:
+        dict: Scene objects by their name in config.yaml scene_order.
+    """
+
+    return {
         'nhl_games': NHLGamesScene(),
         'nhl_fav_team_next_game': NHLFavTeamNextGameScene(),
         'nhl_standings': NHLStandingsScene(),
@@ -27,21 +40,71 @@ def run_scoreboard():
         
         'pwhl_games': PWHLGamesScene(),
         'pwhl_fav_team_next_game': PWHLFavTeamNextGameScene(),
-        'pwhl_standings': PWHLStandingsScene()
+        'pwhl_standings': PWHLStandingsScene(),
+
+        'ticker': TickerScene()
     }
 
+
+def run_scoreboard():
+    # Instantiate objects for each of the "scenes" (i.e., visual ideas) supported.
+    scene_mapping = create_scenes()
+
+    # Keep matrix brightness up to date in the background, independent of the scene being displayed.
+    brightness_controller.start()
+
+    # Restore the data and rendered images saved before the last restart, so scenes display straight away while fresh data is loaded in the background. Save them again on shutdown.
+    if data_utils.read_yaml('config.yaml').get('warm_start', {}).get('enabled', True):
+        warm_start_utils.load_state(scene_mapping)
+        atexit.register(warm_start_utils.save_state, scene_mapping)
+    saved_at = clock_utils.monotonic()
+
     # Infinite loop.
     while True:
         # Determine the order scenes should be displayed per config.yaml.
-        scene_order = data_utils.read_yaml('config.yaml')['scene_order']
+        config = data_utils.read_yaml('config.yaml')
+        scene_order = config['scene_order']
+
+        # Reset network metrics and latency budget for the new cycle.
+        session.start_cycle()
 
-        # Set matrix brightness.
-        matrix.brightness = determine_matrix_brightness()
+        # Start sharing data within the new cycle, so scenes listed more than once reuse the data (schedules, standings, etc.) loaded for their first appearance.
+        snapshot_utils.start_cycle((config.get('network') or {}).get('cycle_data_max_age', 900))
+
+        # Skip the scenes of leagues w/o games coming up (e.g., off-season), including their data calls. If that's every scene, wait a while before checking again.
+        scene_order = [scene for scene in scene_order if league_calendar.is_active(getattr(scene_mapping[scene], 'LEAGUE', None))]
+        if not scene_order:
+            clock_utils.sleep(60)
+            continue
+
+        # Make the data calls for every scene in this cycle concurrently, ahead of displaying any of them. Scenes then use these results rather than waiting on each call in sequence.
+        # Only calls for data shared within the cycle (schedules, standings, etc.), which stays fresh until its scenes are displayed. Live data (e.g., scores) would be stale again by then, so is loaded by its scene when displayed.
+        # Any errors are handled when the scene itself is displayed.
+        data_calls = [data_call for scene in dict.fromkeys(scene_order) for data_call in scene_mapping[scene].get_data_calls() if getattr(data_call[0], 'share_within_cycle', False)]
+        fetch_utils.run_concurrently(list(dict.fromkeys(data_calls)), raise_errors=False)
 
         # Display each scene in the order specified above.
+        # If a scene fails (e.g., no data could be loaded for it), note the error and move on to the next scene rather than stopping the scoreboard.
         for scene in scene_order:
-            scene_mapping[scene].display_scene()
+            try:
+                scene_mapping[scene].display_scene()
+            except Exception as e:
+                print(f'Unable to display scene {scene}: {e!r}')
+                clock_utils.sleep(1) # Avoid a tight loop if every scene is failing (e.g., no network connection).
+
+        # Note if the cycle's network latency budget was exceeded.
+        network_metrics = session.get_cycle_metrics()
+        if network_metrics['is_budget_exceeded']:
+            print(f"Network latency budget exceeded: {network_metrics['network_time']:.1f}s of network time ({network_metrics['total_latency']:.1f}s over {network_metrics['requests']} requests), {network_metrics['skipped_budget_exceeded']} skipped.")
+
+        # Periodically save the data and rendered images, in case of an unclean shutdown (e.g., power loss). Saved between loops, as scenes aren't modifying their images.
+        warm_start_settings = config.get('warm_start', {})
+        if warm_start_settings.get('enabled', True) and clock_utils.monotonic() - saved_at >= warm_start_settings.get('save_interval', 300):
+            warm_start_utils.save_state(scene_mapping)
+            saved_at = clock_utils.monotonic()
 
 # Entrypoint.
 if __name__ == '__main__':
+    # Exit cleanly when stopped (e.g., docker stop), so shutdown tasks like saving state run.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
     run_scoreboard()
\ No newline at end of file
@@ -1,9 +1,8 @@
 from ..scene import Scene
-from setup.matrix_setup import matrix, matrix_options
-from utils import image_utils
+from setup.matrix_setup import matrix, display_size
+from utils import clock_utils, frame_utils, image_utils, layout_utils
 
 from PIL import Image, ImageDraw
-from time import sleep
 import math
 
 
@@ -21,7 +20,7 @@ class FavTeamNextGameScene(Scene):
 
         # Image object.
         self.images = {
-            'full':     Image.new('RGB', (matrix_options.cols, matrix_options.rows))
+            'full':     Image.new('RGB', layout_utils.CARD_SIZE) # Sized to a single panel, and placed within the display per the layout below.
         }
 
         # ImageDraw object ssociated with each of the above Image objects.
@@ -29,6 +28,12 @@ class FavTeamNextGameScene(Scene):
             'full':     ImageDraw.Draw(self.images['full'])
         }
 
+        # Frame buffer that the above image is composited onto for each frame of an animation.
+        self.frame_buffer = frame_utils.FrameBuffer(display_size)
+
+        # Position of the above image on the display, per the display's size.
+        self.layout = layout_utils.determine_full_layout(display_size)
+
 
     def build_next_game_image(self, team, game):
         """ Builds next game image for the specified team and game.
@@ -124,72 +129,58 @@ class FavTeamNextGameScene(Scene):
             direction (str): Direction of the transition. 'in' or 'out'.
         """
 
+        # Load the image into the frame buffer. Each frame of the transition is composited there from it.
+        self.frame_buffer.set_layers(self.images)
+        col, row = self.layout['full']
+
         # 'Cut' transition.
         if self.settings['transition'] == 'cut':
-            if direction == 'in':                
+            if direction == 'in':
                 # Since there's no animation of any sort, an out transition is not needed. Simply display the image on the matrix.
-                matrix.SetImage(self.images['full'])
-        
+                self.frame_buffer.clear()
+                self.frame_buffer.paste_layer('full', (col, row))
+                matrix.SetImage(self.frame_buffer.get_image())
+
         # 'Fade' transition.
         elif self.settings['transition'] == 'fade':
             # Define the 'fade rule', that is the steps between 0 (transparent) and 255 (opaque).
             fade = (255, -1, -15) if direction == 'in' else (0, 256, 15)
 
+            # Build the frame once. Only the fade changes between frames.
+            self.frame_buffer.clear()
+            self.frame_buffer.paste_layer('full', (col, row))
+
             # Loop over opacities to apply to image.
             for overlay_opacity in range(*fade):
-                # Create faded image to display on matrix.
-                faded_for_display_image = self.create_faded_image(self.images['full'], overlay_opacity)
-
-                # Display and sleep for a short time to pace the animation.
-                matrix.SetImage(faded_for_display_image)
-                sleep(0.025)
+                # Display the faded frame and sleep for a short time to pace the animation.
+                matrix.SetImage(self.frame_buffer.get_image(overlay_opacity))
+                clock_utils.sleep(0.025)
 
             # Hold a moment with nothing displayed after fading out.
             if direction == 'out':
-                sleep(0.2)
+                clock_utils.sleep(0.2)
 
         # 'Modern' transition.
         elif self.settings['transition'] == 'modern':
             # Define the 'fade rule', that is the steps between 0 (transparent) and 255 (opaque).
             fade = (255, -1, -15) if direction == 'in' else (0, 256, 15)
 
-            # Make a copy of the image for later use.
-            combined_image = self.images['full'].copy()
+            # Define the horizontal movement. Slides in from the left to the final position, or out to the right from the final position.
+            col_offsets = range(-len(range(*fade))+1, 1, 1) if direction == 'in' else range(0, len(range(*fade)), 1)
 
-            if direction == 'in':
-                # Loop over opacities to apply to image and horizontal movement via col_offset.
-                for overlay_opacity, col_offset in zip(range(*fade), range(-len(range(*fade))+1, 1, 1)):
-                    # Rebuild full image with offsets. Will first need to clear the image. This will also ensure there's no artifacts between loops of animation.    
-                    image_utils.clear_image(self.images['full'], self.draw['full'])
-                           
-                    # Copy the combined_image copied above to full with a col_offset applied.
-                    self.images['full'].paste(combined_image, (col_offset, 0))
-
-                    # Create faded image to display on matrix.
-                    faded_for_display_image = self.create_faded_image(self.images['full'], overlay_opacity)
-
-                    # Display and sleep for a short time to pace the animation.
-                    matrix.SetImage(faded_for_display_image)
-                    sleep(0.025)
-            
-            elif direction == 'out':
-                # Loop over opacities to apply to image and horizontal movement via col_offset.
-                for overlay_opacity, col_offset in zip(range(*fade), range(0, len(range(*fade)), 1)):
-                    # Rebuild full image with offsets. Will first need to clear the image. This will also ensure there's no artifacts between loops of animation.    
-                    image_utils.clear_image(self.images['full'], self.draw['full'])
-                         
-                    # Copy the combined_image copied above to full with a col_offset applied.
-                    self.images['full'].paste(combined_image, (col_offset, 0))
-
-                    # Create faded image to display on matrix.
-                    faded_for_display_image = self.create_faded_image(self.images['full'], overlay_opacity)
-
-                    # Display and sleep for a short time to pace the animation.
-                    matrix.SetImage(faded_for_display_image)
-                    sleep(0.025)
-
-                # Hold a moment with nothing displayed.
-                sleep(0.2)
+            # Loop over opacities to apply to image and horizontal movement via col_offset.
+            for overlay_opacity, col_offset in zip(range(*fade), col_offsets):
+                # Rebuild the frame with offsets. Will first need to clear it. This will also ensure there's no artifacts between loops of animation.
+                self.frame_buffer.clear()
+                self.frame_buffer.paste_layer('full', (col + col_offset, row))
+
+                # Display the faded frame and sleep for a short time to pace the animation.
+                matrix.SetImage(self.frame_buffer.get_image(overlay_opacity))
+                clock_utils.sleep(0.025)
+
+            # Hold a moment with nothing displayed.
+            if direction == 'out':
+                clock_utils.sleep(0.2)
 
         # On way out of 'out' transitions, reset all images to black for next image build.
         if direction == 'out':
@@ -1,10 +1,9 @@
 from .fav_team_next_game_scene import FavTeamNextGameScene
 from setup.matrix_setup import matrix
 import data.nhl_data
-from utils import data_utils
+from utils import clock_utils, data_utils
 
 from datetime import datetime as dt
-from time import sleep
 
 
 class NHLFavTeamNextGameScene(FavTeamNextGameScene):
@@ -21,6 +20,17 @@ class NHLFavTeamNextGameScene(FavTeamNextGameScene):
         self.LEAGUE = 'NHL'
 
 
+    def get_data_calls(self):
+        """ Notes the data calls made when this scene is displayed. Allows them to be made concurrently ahead of displaying the scene.
+
+        Returns:
+            list: List of tuples of a data function and a tuple of args to call it with.
+        """
+
+        favourite_teams = data_utils.read_yaml('config.yaml')['favourite_teams'][self.LEAGUE.lower()]
+        return [(data.nhl_data.get_next_games, (tuple(favourite_teams),))] if favourite_teams else []
+
+
     def display_scene(self):
         """ Displays the scene on the matrix.
         """
@@ -30,10 +40,11 @@ class NHLFavTeamNextGameScene(FavTeamNextGameScene):
         self.favourite_teams = data_utils.read_yaml('config.yaml')['favourite_teams'][self.LEAGUE.lower()]
         self.alt_logos = data_utils.read_yaml('config.yaml')['alt_logos'][self.LEAGUE.lower()] if data_utils.read_yaml('config.yaml')['alt_logos'][self.LEAGUE.lower()] else {} # Note the teams with an alternative logo per config.yaml.
 
-        # Determine next game for each fav team per config.yaml. Build images and display.
+        # Determine next game for each fav team per config.yaml (all in a single call). Build images and display.
         if self.favourite_teams:
+            next_games = data.nhl_data.get_next_games(tuple(self.favourite_teams))
             for team in self.favourite_teams:
-                next_game_details = data.nhl_data.get_next_game(team)
+                next_game_details = next_games[team]
                 
                 if next_game_details:
                     # If a game is in progress, and display_if_in_progress is False, exit without displaying anything.
@@ -44,5 +55,5 @@ class NHLFavTeamNextGameScene(FavTeamNextGameScene):
                     else:
                         self.build_next_game_image(team, next_game_details)
                         self.transition_image(direction='in')
-                        sleep(self.settings['display_duration'])
+                        clock_utils.sleep(self.settings['display_duration'])
                         self.transition_image(direction='out')
\ No newline at end of file
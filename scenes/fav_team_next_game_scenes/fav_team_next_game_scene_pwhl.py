@@ -1,10 +1,9 @@
 from .fav_team_next_game_scene import FavTeamNextGameScene
 from setup.matrix_setup import matrix
 import data.pwhl_data
-from utils import data_utils
+from utils import clock_utils, data_utils
 
 from datetime import datetime as dt
-from time import sleep
 
 
 class PWHLFavTeamNextGameScene(FavTeamNextGameScene):
@@ -17,6 +16,17 @@ class PWHLFavTeamNextGameScene(FavTeamNextGameScene):
         self.LEAGUE = 'PWHL'
 
 
+    def get_data_calls(self):
+        """ Notes the data calls made when this scene is displayed. Allows them to be made concurrently ahead of displaying the scene.
+
+        Returns:
+            list: List of tuples of a data function and a tuple of args to call it with.
+        """
+
+        favourite_teams = data_utils.read_yaml('config.yaml')['favourite_teams'][self.LEAGUE.lower()]
+        return [(data.pwhl_data.get_next_game, (team,)) for team in favourite_teams or []]
+
+
     def display_scene(self):
         # Refresh config and load to settings key.
         self.settings = data_utils.read_yaml('config.yaml')['scene_settings'][self.LEAGUE.lower()]['fav_team_next_game']
@@ -37,5 +47,5 @@ class PWHLFavTeamNextGameScene(FavTeamNextGameScene):
                     else:
                         self.build_next_game_image(team, next_game_details)
                         self.transition_image(direction='in')
-                        sleep(self.settings['display_duration'])
+                        clock_utils.sleep(self.settings['display_duration'])
                         self.transition_image(direction='out')
@@ -1,9 +1,9 @@
 from ..scene import Scene
-from setup.matrix_setup import matrix, matrix_options
-from utils import image_utils
+from setup.matrix_setup import matrix, display_size
+from data import league_calendar
+from utils import clock_utils, data_utils, frame_utils, game_clock_utils, image_utils, layout_utils
 
 from PIL import Image, ImageDraw
-from time import sleep
 import math
 
 
@@ -25,8 +25,8 @@ class GamesScene(Scene):
             'left':     Image.new('RGB', (40, 30)), # 21 of 40 cols will be visible on matrix (cols 0-20) when not moving. This leaves a col of buffer before the centre.
             'centre':   Image.new('RGB', (20, 30)),
             'right':    Image.new('RGB', (40, 30)), # 21 of 40 cols will be visible on matrix (cols 43-63) when not moving. This leaves a col of buffer after the centre.
-            # Full image that gets displayed to matrix.
-            'full':     Image.new('RGB', (matrix_options.cols, matrix_options.rows))
+            # Full image for scenes built directly to it (e.g., splash). Sized to a single panel, and placed within the display per the layout below.
+            'full':     Image.new('RGB', layout_utils.CARD_SIZE)
         }
 
         # ImageDraw objects associated with each of the above Image objects.
@@ -37,6 +37,221 @@ class GamesScene(Scene):
             'full':     ImageDraw.Draw(self.images['full'])
         }
 
+        # Frame buffer that the above images are composited onto for each frame of an animation.
+        self.frame_buffer = frame_utils.FrameBuffer(display_size)
+
+        # Position of each of the above images on the display, per the display's size.
+        self.layout = layout_utils.determine_game_layout(display_size)
+
+        # Details of the game card(s) currently displayed. Each has the game, the position of its images on the display, and the area of the display it's limited to.
+        self.game_cards = []
+
+        # Previously built game images by game ID, along with the inputs that produced them. Allows unchanged parts of a game's image to be reused rather than rebuilt each data pull.
+        self.game_image_cache = {}
+        self.GAME_IMAGE_CACHE_SIZE = 32 # Max number of games to keep. Comfortably more than the number of games on any two days.
+
+        # Seconds between checks of whether a displayed game clock has ticked, when clocks are ticked forward locally between data pulls.
+        self.CLOCK_REDRAW_INTERVAL = 0.25
+
+        # If the league's API reports whether the game clock is running. If not, it's guessed, so clocks aren't ticked forward unless enabled in config.yaml, as they'd count down through stoppages.
+        self.REPORTS_CLOCK_RUNNING = True
+
+
+    def load_settings(self):
+        """ Refreshes config and loads the league's game settings and alt logos.
+        """
+
+        self.settings = data_utils.read_yaml('config.yaml')['scene_settings'][self.LEAGUE.lower()]['games']
+        self.alt_logos = data_utils.read_yaml('config.yaml')['alt_logos'][self.LEAGUE.lower()] if data_utils.read_yaml('config.yaml')['alt_logos'][self.LEAGUE.lower()] else {} # Note the teams with an alternative logo per config.yaml.
+
+
+    def has_games_to_display(self, dates):
+        """ Determines if there may be games to display on any of the dates, per what's known of the league's schedule (see league_calendar).
+        If not (e.g., a day off), the scene is skipped rather than loading data and displaying a 'no games' splash.
+
+        Args:
+            dates (list): Dates to display games for.
+
+        Returns:
+            bool: If any of the dates may have games.
+        """
+
+        return any(league_calendar.has_games_on(self.LEAGUE, date) for date in dates)
+
+
+    def determine_scoring_teams(self, games, games_previous_pull):
+        """ Notes which team (if any) scored in each game since the previous data pull, per the away_team_scored, home_team_scored, and scoring_team keys of each game.
+
+        Args:
+            games (list): List of game dicts from the current data pull.
+            games_previous_pull (list): List of game dicts from the previous data pull. None if there's no previous pull.
+        """
+
+        # Only applicable if there's a previous copy to compare to.
+        if not games_previous_pull:
+            return
+
+        # Match games between data pulls.
+        previous_games = {game['game_id']: game for game in games_previous_pull}
+        for game in games:
+            # Not applicable if the game hadn't started as of either pull.
+            matched_game = previous_games.get(game['game_id'])
+            if not game['has_started'] or not matched_game or not matched_game['has_started']:
+                continue
+
+            # Determine if either team scored and set keys accordingly.
+            game['away_team_scored'] = game['away_score'] > matched_game['away_score']
+            game['home_team_scored'] = game['home_score'] > matched_game['home_score']
+
+            if game['away_team_scored'] and game['home_team_scored']:
+                game['scoring_team'] = 'both'
+            elif game['away_team_scored']:
+                game['scoring_team'] = 'away'
+            elif game['home_team_scored']:
+                game['scoring_team'] = 'home'
+
+
+    def display_game_images(self, games, date=None, is_stale=False):
+        """ Builds and displays images on the matrix for each game in games.
+        If enabled in config.yaml, as many games as fit on the display are displayed at once, each as a card in a grid. Otherwise, one game at a time.
+
+        Args:
+            games (list): List of game dicts. Each element has all details for a single game.
+            date (date, optional): Date of games. Only used to build 'no games' image when there's... well, no games on that data. Defaults to None.
+            is_stale (bool, optional): If the game data is stale. Adds a stale indicator to each game image if True. Defaults to False.
+        """
+
+        # If there's any games to display, loop through them in groups of as many as are displayed at once.
+        if games:
+            games_per_image = layout_utils.determine_max_cards(display_size) if self.settings.get('display_multiple_games') else 1
+
+            # Every group is laid out in the same grid, so cards stay in place between groups (e.g., a short last group isn't re-centred).
+            grid_size = layout_utils.determine_card_grid(display_size, min(len(games), games_per_image))
+
+            for first_game in range(0, len(games), games_per_image):
+                game_group = games[first_game:first_game + games_per_image]
+
+                # Build the images for each game in the group, and transition them in on the matrix together.
+                self.build_game_cards(game_group, grid_size, is_stale)
+                self.transition_image(direction='in')
+
+                # If a goal was scored in any of the games, do goal fade animation (if enabled).
+                if self.settings['score_alerting']['score_coloured'] and self.settings['score_alerting']['score_fade_animation']:
+                    if any(game['scoring_team'] for game in game_group):
+                        self.fade_score_change()
+
+                # Hold image for calculated duration and transition out.
+                self.hold_game_cards(game_group, grid_size, is_stale)
+                self.transition_image(direction='out')
+
+        # If there's no games to display, and splash is disabled, build and display the no games image.
+        elif not self.settings['splash']['display_splash']:
+            self.build_no_games_image(date)
+            self.transition_image(direction='in', image_already_combined=True)
+            clock_utils.sleep(self.settings['game_display_duration'])
+            self.transition_image(direction='out', image_already_combined=True)
+
+
+    def build_game_cards(self, games, grid_size=(1, 1), is_stale=False):
+        """ Builds the images for each of the provided games and loads them into the frame buffer, laid out as cards in a grid.
+        Games fill the grid in order, so a group w/ fewer games than the grid leaves the remaining cards empty.
+
+        Args:
+            games (list): List of game dicts to display at once. No more than fit in the grid.
+            grid_size (tuple, optional): Cols and rows of cards in the grid. Defaults to (1, 1), a single game.
+            is_stale (bool, optional): If the game data is stale. Adds a stale indicator to each game image if True. Defaults to False.
+        """
+
+        self.game_cards = []
+        for card, game in enumerate(games):
+            # Build the appropriate image for the game's status.
+            self.build_game_status_image(game) # This exists in child classes.
+
+            # If the data is stale, note that on the image.
+            if is_stale:
+                self.add_stale_indicator_to_image()
+
+            # Load the images into the frame buffer for this card.
+            for name in ['left', 'centre', 'right']:
+                self.frame_buffer.set_layer(f'{name}_{card}', self.images[name].copy())
+
+            # Note the card's layout. The left and right images are limited to their card so they don't overlap neighbouring cards or spill onto the rest of the display.
+            self.game_cards.append({
+                'game': game,
+                'layout': layout_utils.determine_game_layout(display_size, grid_size, card),
+                'clip_box': layout_utils.determine_card_box(display_size, grid_size, card),
+                'centre': self.images['centre'].copy() # Kept to redraw the score on for the goal fade animation.
+            })
+
+            # Clear the images for the next game.
+            for name in ['left', 'centre', 'right']:
+                image_utils.clear_image(self.images[name], self.draw[name])
+
+
+    def hold_game_cards(self, games, grid_size=(1, 1), is_stale=False):
+        """ Holds the displayed game card(s) on the matrix for game_display_duration.
+        If clock interpolation is enabled in config.yaml, cards are redrawn each time a running game clock ticks, so the clock counts down between data pulls.
+
+        Args:
+            games (list): List of game dicts displayed.
+            grid_size (tuple, optional): Cols and rows of cards in the grid the games are displayed in. Defaults to (1, 1), a single game.
+            is_stale (bool, optional): If the game data is stale. Defaults to False.
+        """
+
+        # If no displayed clocks are ticking, there's nothing to redraw.
+        if not self.settings.get('interpolate_clock', self.REPORTS_CLOCK_RUNNING) or not any(game_clock_utils.is_clock_running(game) for game in games):
+            clock_utils.sleep(self.settings['game_display_duration'])
+            return
+
+        # If the goal fade animation was done, scores have already faded back to white. Keep them that way when redrawing.
+        if self.settings['score_alerting']['score_coloured'] and self.settings['score_alerting']['score_fade_animation']:
+            games = [dict(game, scoring_team=None) for game in games]
+
+        # Until the hold is over, redraw the card(s) whenever a displayed clock changes. Only the clock region of each card is redrawn (see build_game_image).
+        end_time = clock_utils.monotonic() + self.settings['game_display_duration']
+        displayed_times = [game_clock_utils.determine_time_remaining(game) for game in games]
+        while True:
+            remaining = end_time - clock_utils.monotonic()
+            if remaining <= 0:
+                break
+            clock_utils.sleep(min(self.CLOCK_REDRAW_INTERVAL, remaining))
+
+            times = [game_clock_utils.determine_time_remaining(game) for game in games]
+            if times != displayed_times:
+                self.build_game_cards(games, grid_size, is_stale)
+                self.frame_buffer.clear()
+                self.composite_game_image()
+                matrix.SetImage(self.frame_buffer.get_image())
+                displayed_times = times
+
+
+    def build_game_card_image(self, game, is_stale=False):
+        """ Builds a single image of a game card, as displayed when showing one game at a time. Used to display games outside of this scene (e.g., the ticker).
+
+        Args:
+            game (dict): Dictionary with all details of a specific game.
+            is_stale (bool, optional): If the game data is stale. Adds a stale indicator to the image if True. Defaults to False.
+
+        Returns:
+            Image: Image of the game card, the size of a single panel.
+        """
+
+        # Build the appropriate image for the game's status.
+        self.build_game_status_image(game) # This exists in child classes.
+
+        # If the data is stale, note that on the image.
+        if is_stale:
+            self.add_stale_indicator_to_image()
+
+        # Combine the images as laid out on a single panel. Portions of the left and right images off the panel are ignored.
+        card_image = Image.new('RGB', layout_utils.CARD_SIZE)
+        card_layout = layout_utils.determine_game_layout(layout_utils.CARD_SIZE)
+        for name in ['left', 'centre', 'right']:
+            card_image.paste(self.images[name], card_layout[name])
+            image_utils.clear_image(self.images[name], self.draw[name])
+
+        return card_image
+
 
     def build_splash_image(self, num_games, date):
         """ Builds splash screen image.
@@ -94,21 +309,11 @@ class GamesScene(Scene):
             game (dict): Dictionary with all details of a specific game.
         """
 
-        # First, add the team logos to the left and right images.
-        self.add_team_logos_to_image(game)        
-
-        # Add 'Today' to the centre image.
-        self.draw['centre'].text((0, -1), 'T', font=self.FONTS['med'], fill=self.COLOURS['white']) # Text has some padding on the top that needs to be accounted for.
-        self.draw['centre'].text((4, 1), 'o', font=self.FONTS['sm'], fill=self.COLOURS['white'])
-        self.draw['centre'].text((8, 1), 'd', font=self.FONTS['sm'], fill=self.COLOURS['white'])
-        self.draw['centre'].text((12, 1), 'a', font=self.FONTS['sm'], fill=self.COLOURS['white'])
-        self.draw['centre'].text((16, 1), 'y', font=self.FONTS['sm'], fill=self.COLOURS['white'])
-
-        # Add '@' to the centre image.
-        self.draw['centre'].text((5, 7), '@', font=self.FONTS['lrg'], fill=self.COLOURS['white'])
-
-        # Add the start time to the centre image.
-        self.add_time_to_image(game)
+        # 'Today' and '@' never change, so only the start time needs to be redrawn if it changes.
+        self.build_game_image(game, 'not_started', {
+            'today':        ((0, 0, 20, 21), None, self.add_today_to_image),
+            'start_time':   ((0, 21, 20, 30), game['start_datetime_local'], self.add_time_to_image)
+        })
 
 
     def build_game_in_progress_image(self, game):
@@ -119,16 +324,17 @@ class GamesScene(Scene):
             game (dict): Dictionary with all details of a specific game.
         """
 
-        # First, add the team logos to the left and right images.
-        self.add_team_logos_to_image(game)
+        # If enabled, tick the clock forward from the latest data pull.
+        if self.settings.get('interpolate_clock', self.REPORTS_CLOCK_RUNNING):
+            game = dict(game, period_time_remaining=game_clock_utils.determine_time_remaining(game))
 
-        # Add the period and time remaining to the centre image.
-        self.add_playing_period_to_image(game) # This exists in child classes.
-        if self.should_display_time_remaining_in_playing_period(game): # This exists in child classes.
-            self.add_time_to_image(game)        
-
-        # Add the current score to the centre image, noting if either team scored since previous data pull.
-        self.add_score_to_image(game, overriding_team=game['scoring_team'], colour_override=self.COLOURS['red'])
+        # The period, time remaining, and score are each only redrawn if the details they display change.
+        period_inputs = (game.get('period_num'), game.get('period_type'), game.get('is_intermission'), game.get('is_halftime'))
+        self.build_game_image(game, 'in_progress', {
+            'period':   ((0, 0, 20, 9), period_inputs, self.add_playing_period_to_image), # This exists in child classes.
+            'clock':    ((0, 9, 20, 19), period_inputs + (game['period_time_remaining'],), self.add_clock_to_image),
+            'score':    ((0, 19, 20, 30), self.determine_score_image_inputs(game), self.add_latest_score_to_image)
+        })
 
 
     def build_game_complete_image(self, game):
@@ -139,8 +345,92 @@ class GamesScene(Scene):
             game (dict): Dictionary with all details of a specific game.
         """
 
-        # First, add the team logos to the left and right images.
-        self.add_team_logos_to_image(game)
+        # 'Final' (and OT, etc.) and the score are each only redrawn if the details they display change.
+        self.build_game_image(game, 'complete', {
+            'final':    ((0, 0, 20, 19), (game.get('period_num'), game.get('period_type')), self.add_final_to_image),
+            'score':    ((0, 19, 20, 30), self.determine_score_image_inputs(game), self.add_latest_score_to_image)
+        })
+
+
+    def build_game_image(self, game, image_type, centre_regions):
+        """ Builds the left, right, and centre images for a game, reusing what was built for the same game previously where possible.
+        Team logos are only loaded when a game is first built (or its logos change). Each region of the centre image is only redrawn when its inputs have changed, so a game where nothing has changed costs nothing to rebuild.
+
+        Args:
+            game (dict): Dictionary with all details of a specific game.
+            image_type (str): Type of image being built (e.g., 'in_progress'). Regions are only reused between builds of the same type.
+            centre_regions (dict): Details of each region of the centre image, by name. Each is a tuple of the region's box (left, upper, right, lower), the inputs that determine its content, and the function that draws it.
+                The function is provided the game and draws to the centre image. Anything drawn outside the region's box is ignored, so the regions must cover the full centre image between them.
+        """
+
+        # Get the game's cached images. Start fresh if the game hasn't been built before or was built as a different type of image (e.g., game has since started).
+        cached_game = self.game_image_cache.pop(game['game_id'], None)
+        if not cached_game or cached_game['image_type'] != image_type:
+            cached_game = {'image_type': image_type, 'logo_inputs': None, 'centre': Image.new('RGB', self.images['centre'].size), 'centre_inputs': {}}
+
+        # Add the team logos to the left and right images. Only load them if they've changed, otherwise copy from the cache.
+        logo_inputs = (game['away_abrv'], self.alt_logos.get(game['away_abrv']), game['home_abrv'], self.alt_logos.get(game['home_abrv']))
+        if cached_game['logo_inputs'] != logo_inputs:
+            self.add_team_logos_to_image(game)
+            cached_game.update(logo_inputs=logo_inputs, left=self.images['left'].copy(), right=self.images['right'].copy())
+        else:
+            self.images['left'].paste(cached_game['left'], (0, 0))
+            self.images['right'].paste(cached_game['right'], (0, 0))
+
+        # Redraw each region of the centre image whose inputs have changed. Each is drawn to the (cleared) centre image, then the region is copied to the cached centre image.
+        for region, (box, inputs, add_region_to_image) in centre_regions.items():
+            if region not in cached_game['centre_inputs'] or cached_game['centre_inputs'][region] != inputs:
+                image_utils.clear_image(self.images['centre'], self.draw['centre'])
+                add_region_to_image(game)
+                cached_game['centre'].paste(self.images['centre'].crop(box), box[:2])
+                cached_game['centre_inputs'][region] = inputs
+
+        # Copy the full cached centre image to the centre image.
+        self.images['centre'].paste(cached_game['centre'], (0, 0))
+
+        # (Re)insert the game as the most recently used, and drop the least recently used if the cache is full.
+        self.game_image_cache[game['game_id']] = cached_game
+        if len(self.game_image_cache) > self.GAME_IMAGE_CACHE_SIZE:
+            del self.game_image_cache[next(iter(self.game_image_cache))]
+
+
+    def determine_score_image_inputs(self, game):
+        """ Determines the inputs that impact how the score is drawn in the centre image.
+
+        Args:
+            game (dict): Dictionary with all details of a specific game.
+
+        Returns:
+            tuple: Scores, which team (if any) scored since the previous data pull, and if scores are coloured when a team scores.
+        """
+
+        return (game['away_score'], game['home_score'], game['scoring_team'], self.settings['score_alerting']['score_coloured'])
+
+
+    def add_today_to_image(self, game):
+        """ Adds 'Today' and '@' to the centre image, for a game that has yet to start.
+
+        Args:
+            game (dict): Dictionary with all details of a specific game.
+        """
+
+        # Add 'Today' to the centre image.
+        self.draw['centre'].text((0, -1), 'T', font=self.FONTS['med'], fill=self.COLOURS['white']) # Text has some padding on the top that needs to be accounted for.
+        self.draw['centre'].text((4, 1), 'o', font=self.FONTS['sm'], fill=self.COLOURS['white'])
+        self.draw['centre'].text((8, 1), 'd', font=self.FONTS['sm'], fill=self.COLOURS['white'])
+        self.draw['centre'].text((12, 1), 'a', font=self.FONTS['sm'], fill=self.COLOURS['white'])
+        self.draw['centre'].text((16, 1), 'y', font=self.FONTS['sm'], fill=self.COLOURS['white'])
+
+        # Add '@' to the centre image.
+        self.draw['centre'].text((5, 7), '@', font=self.FONTS['lrg'], fill=self.COLOURS['white'])
+
+
+    def add_final_to_image(self, game):
+        """ Adds 'Final' to the centre image, along with if the game ended in OT, etc.
+
+        Args:
+            game (dict): Dictionary with all details of a specific game.
+        """
 
         # Add 'Final' to the centre image.
         self.draw['centre'].text((0, -1), 'F', font=self.FONTS['med'], fill=self.COLOURS['white'])
@@ -152,7 +442,27 @@ class GamesScene(Scene):
         # If game ended in OT, etc. add that to the centre image.
         self.add_final_playing_period_to_image(game) # This exists in child classes.
 
-        # Add the current score to the centre image, noting if either team scored since previous data pull.
+
+    def add_clock_to_image(self, game):
+        """ Adds the time remaining in the period to the centre image, or intermission, etc. when the clock isn't running.
+
+        Args:
+            game (dict): Dictionary with all details of a specific game.
+        """
+
+        # Intermission, etc. is added alongside the period in child classes.
+        self.add_playing_period_to_image(game)
+        if self.should_display_time_remaining_in_playing_period(game): # This exists in child classes.
+            self.add_time_to_image(game)
+
+
+    def add_latest_score_to_image(self, game):
+        """ Adds the current score to the centre image, noting if either team scored since previous data pull.
+
+        Args:
+            game (dict): Dictionary with all details of a specific game.
+        """
+
         self.add_score_to_image(game, overriding_team=game['scoring_team'], colour_override=self.COLOURS['red'])
 
 
@@ -295,6 +605,15 @@ class GamesScene(Scene):
             self.draw['centre'].text((home_score_col_start, home_team_row_start), str(game['home_score']), font=self.FONTS['sm'], fill=colour_home)
 
 
+    def add_stale_indicator_to_image(self):
+        """ Adds a small indicator to the top right corner of the right image, noting the data displayed is stale.
+        Data is stale when the latest pull failed or didn't complete in time and the last good data was displayed instead.
+        """
+
+        # Col 20 of the right image is the rightmost col visible on the matrix.
+        self.draw['right'].point((20, 0), fill=self.COLOURS['yellow'])
+
+
     def add_league_logo_to_image(self):
         """ Adds logo for a specific league to the full image.
         League is determined in the extended class specific to each league.
@@ -313,28 +632,54 @@ class GamesScene(Scene):
         self.images['full'].paste(league_logo, (row_location, col_location))
 
 
-    def fade_score_change(self, game):
-        """ Fades score from red to white after a goal is scored.
+    def fade_score_change(self):
+        """ Fades score from red to white after a goal is scored, for each game card displayed where a goal was scored.
         Achieved by rapidly calculating a new colour and re-adding the score to the centre image before displaying again.
-
-        Args:
-            game (dict): Dictionary with all details of a specific game.
         """
 
         # Stay red for a short time before fading.
-        sleep(0.5)
+        clock_utils.sleep(0.5)
+
+        # Note the cards of the games where a goal was scored.
+        scoring_cards = [card for card, game_card in enumerate(self.game_cards) if game_card['game']['scoring_team']]
 
         # Loop over the colour between red and white.
         for n in range(self.COLOURS['red'][2], self.COLOURS['white'][2]):
-            # Add score to the centre image, with the new colour.
-            self.add_score_to_image(game, overriding_team=game['scoring_team'], colour_override=(255, n, n))
-            
-            # Rebuild the full image and display on matrix.
-            self.images['full'].paste(self.images['left'], (-19, 1))
-            self.images['full'].paste(self.images['centre'], (22, 1))
-            self.images['full'].paste(self.images['right'], (43, 1))
-            matrix.SetImage(self.images['full'])
-            sleep(0.015) # Sleep for a short time to pace animation.
+            for card in scoring_cards:
+                game_card = self.game_cards[card]
+
+                # Add score to the game's centre image, with the new colour. Reload it into the frame buffer.
+                self.images['centre'].paste(game_card['centre'], (0, 0))
+                self.add_score_to_image(game_card['game'], overriding_team=game_card['game']['scoring_team'], colour_override=(255, n, n))
+                game_card['centre'] = self.images['centre'].copy()
+                self.frame_buffer.set_layer(f'centre_{card}', game_card['centre'])
+
+            # Rebuild the frame and display on matrix.
+            self.frame_buffer.clear()
+            self.composite_game_image()
+            matrix.SetImage(self.frame_buffer.get_image())
+            clock_utils.sleep(0.015) # Sleep for a short time to pace animation.
+
+
+    def composite_game_image(self, col_offset=0, image_already_combined=False):
+        """ Pastes the layers of the image onto the frame buffer. The layers must already be loaded into the frame buffer.
+
+        Args:
+            col_offset (int, optional): Horizontal offset of the image, used in transitions. Defaults to 0.
+            image_already_combined (bool, optional): If the image was build directly to the full image. If true, paste that rather than the game card(s). Defaults to False.
+        """
+
+        if image_already_combined:
+            col, row = self.layout['full']
+            self.frame_buffer.paste_layer('full', (col + col_offset, row))
+            return
+
+        # Paste the left, centre, and right images of each game card. Cards move together, each limited to its own area of the display.
+        # The left and right images are wider than the card, so are always clipped to it. Otherwise they'd spill onto the rest of larger displays. The area doesn't move w/ the card, same as the edges of a single panel.
+        for card, game_card in enumerate(self.game_cards):
+            for name in ['left', 'centre', 'right']:
+                col, row = game_card['layout'][name]
+                self.frame_buffer.paste_layer(f'{name}_{card}', (col + col_offset, row), game_card['clip_box'])
 
 
     def transition_image(self, direction, image_already_combined=False):
@@ -346,97 +691,60 @@ class GamesScene(Scene):
             image_already_combined (bool, optional): If the image was build directly to the full image. If true, skip building it here. Defaults to False.
         """
 
+        # Load the full image into the frame buffer if the image was built directly to it. Otherwise, the game card(s) were loaded as they were built.
+        if image_already_combined:
+            self.frame_buffer.set_layer('full', self.images['full'])
+
         # 'Cut' transition.
         if self.settings['transition'] == 'cut':
             if direction == 'in':
-                # Build combined image if needed.
-                if not image_already_combined:
-                    self.images['full'].paste(self.images['left'], (-19, 1))
-                    self.images['full'].paste(self.images['centre'], (22, 1))
-                    self.images['full'].paste(self.images['right'], (43, 1))
-                
+                # Build combined image.
+                self.frame_buffer.clear()
+                self.composite_game_image(image_already_combined=image_already_combined)
+
                 # Since there's no animation of any sort, an out transition is not needed. Simply display the image on the matrix.
-                matrix.SetImage(self.images['full'])
-        
+                matrix.SetImage(self.frame_buffer.get_image())
+
         # 'Fade' transition.
         elif self.settings['transition'] == 'fade':
             # Define the 'fade rule', that is the steps between 0 (transparent) and 255 (opaque).
             fade = (255, -1, -15) if direction == 'in' else (0, 256, 15)
 
-            # Build combined image if needed.
-            if not image_already_combined:
-                self.images['full'].paste(self.images['left'], (-19, 1))
-                self.images['full'].paste(self.images['centre'], (22, 1))
-                self.images['full'].paste(self.images['right'], (43, 1))
+            # Build the combined image once. Only the fade changes between frames.
+            self.frame_buffer.clear()
+            self.composite_game_image(image_already_combined=image_already_combined)
 
             # Loop over opacities to apply to image.
             for overlay_opacity in range(*fade):
-                # Create faded image to display on matrix.
-                faded_for_display_image = self.create_faded_image(self.images['full'], overlay_opacity)
-
-                # Display and sleep for a short time to pace the animation.
-                matrix.SetImage(faded_for_display_image)
-                sleep(0.025)
+                # Display the faded frame and sleep for a short time to pace the animation.
+                matrix.SetImage(self.frame_buffer.get_image(overlay_opacity))
+                clock_utils.sleep(0.025)
 
             # Hold a moment with nothing displayed after fading out.
             if direction == 'out':
-                sleep(0.2)
+                clock_utils.sleep(0.2)
 
         # 'Modern' transition.
         elif self.settings['transition'] == 'modern':
             # Define the 'fade rule', that is the steps between 0 (transparent) and 255 (opaque).
             fade = (255, -1, -15) if direction == 'in' else (0, 256, 15)
 
-            # If the final image already exists, make a copy for later use.
-            if image_already_combined:
-                combined_image = self.images['full'].copy()
+            # Define the horizontal movement. Slides in from the left to the final position, or out to the right from the final position.
+            col_offsets = range(-len(range(*fade))+1, 1, 1) if direction == 'in' else range(0, len(range(*fade)), 1)
 
-            if direction == 'in':
-                # Loop over opacities to apply to image and horizontal movement via col_offset.
-                for overlay_opacity, col_offset in zip(range(*fade), range(-len(range(*fade))+1, 1, 1)):
-                    # Rebuild full image with offsets. Will first need to clear the image. This will also ensure there's no artifacts between loops of animation.    
-                    image_utils.clear_image(self.images['full'], self.draw['full'])
-                    
-                    # If the image has not already been combined, add each sub-image to the full with a col_offset applied.
-                    if not image_already_combined:                        
-                        self.images['full'].paste(self.images['left'], (-19 + col_offset, 1))
-                        self.images['full'].paste(self.images['centre'], (22 + col_offset, 1))
-                        self.images['full'].paste(self.images['right'], (43 + col_offset, 1))          
-                    # Otherwise, copy the combined_image copied above to full with a col_offset applied.
-                    else:
-                        self.images['full'].paste(combined_image, (col_offset, 0))
-
-                    # Create faded image to display on matrix.
-                    faded_for_display_image = self.create_faded_image(self.images['full'], overlay_opacity)
-
-                    # Display and sleep for a short time to pace the animation.
-                    matrix.SetImage(faded_for_display_image)
-                    sleep(0.025)
-            
-            elif direction == 'out':
-                # Loop over opacities to apply to image and horizontal movement via col_offset.
-                for overlay_opacity, col_offset in zip(range(*fade), range(0, len(range(*fade)), 1)):
-                    # Rebuild full image with offsets. Will first need to clear the image. This will also ensure there's no artifacts between loops of animation.    
-                    image_utils.clear_image(self.images['full'], self.draw['full'])
-                    
-                    # If the image has not already been combined, add each sub-image to the full with a col_offset applied.
-                    if not image_already_combined:                        
-                        self.images['full'].paste(self.images['left'], (-19 + col_offset, 1))
-                        self.images['full'].paste(self.images['centre'], (22 + col_offset, 1))
-                        self.images['full'].paste(self.images['right'], (43 + col_offset, 1))       
-                    # Otherwise, copy the combined_image copied above to full with a col_offset applied.
-                    else:
-                        self.images['full'].paste(combined_image, (col_offset, 0))
-
-                    # Create faded image to display on matrix.
-                    faded_for_display_image = self.create_faded_image(self.images['full'], overlay_opacity)
-
-                    # Display and sleep for a short time to pace the animation.
-                    matrix.SetImage(faded_for_display_image)
-                    sleep(0.025)
-
-                # Hold a moment with nothing displayed.
-                sleep(0.2)
+            # Loop over opacities to apply to image and horizontal movement via col_offset.
+            for overlay_opacity, col_offset in zip(range(*fade), col_offsets):
+                # Rebuild the frame with offsets. Will first need to clear it. This will also ensure there's no artifacts between loops of animation.
+                self.frame_buffer.clear()
+                self.composite_game_image(col_offset, image_already_combined)
+
+                # Display the faded frame and sleep for a short time to pace the animation.
+                matrix.SetImage(self.frame_buffer.get_image(overlay_opacity))
+                clock_utils.sleep(0.025)
+
+            # Hold a moment with nothing displayed.
+            if direction == 'out':
+                clock_utils.sleep(0.2)
 
         # On way out of 'out' transitions, reset all images to black for next image build.
         if direction == 'out':
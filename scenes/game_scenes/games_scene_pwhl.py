@@ -1,10 +1,8 @@
 from .games_scene import GamesScene
-from setup.matrix_setup import matrix
 import data.pwhl_data
-from utils import data_utils, date_utils
+from utils import clock_utils, data_utils, date_utils
 
 from datetime import datetime as dt
-from time import sleep
 
 
 class PWHLGamesScene(GamesScene):
@@ -15,63 +13,61 @@ class PWHLGamesScene(GamesScene):
     def __init__(self):
         super().__init__()
         self.LEAGUE = 'PWHL'
+        self.REPORTS_CLOCK_RUNNING = False # No running clock flag, so it's guessed from the game being in progress w/ time on the clock.
 
 
     def display_scene(self):
         # Refresh config and load to settings key.
-        self.settings = data_utils.read_yaml('config.yaml')['scene_settings'][self.LEAGUE.lower()]['games']
-        self.alt_logos = data_utils.read_yaml('config.yaml')['alt_logos'][self.LEAGUE.lower()] if data_utils.read_yaml('config.yaml')['alt_logos'][self.LEAGUE.lower()] else {} # Note the teams with an alternative logo per config.yaml.
+        self.load_settings()
 
         # Determine which days should be displayed. Will generate a list with one or two elements. Two means rollover time and yesterday's games should be displayed.
         dates_to_display = date_utils.determine_dates_to_display_games(self.settings['rollover']['rollover_start_time_local'], self.settings['rollover']['rollover_end_time_local'])
         display_yesterday = True if len(dates_to_display) == 2 else False # Will have to display yesterday's games if dates_to_display has 2 elements.
 
-        # If in rollover time, and the data for previous day hasn't been saved / is from a different date than needed, then pull it.
-        # This will ensure we don't need to pull the previous day data (that doesn't change) every loop.
-        if display_yesterday:
-            if (hasattr(self, 'data_previous_day') and self.data_previous_day['saved_date'] != dates_to_display[0]) or not hasattr(self, 'data_previous_day'):
-                self.data_previous_day = {
-                    'saved_date': dates_to_display[0], # Note the previous date.
-                    'games': data.pwhl_data.get_games(dates_to_display[0]) # Get data for previous date.
-                }
+        # Skip the scene if none of the days have games (e.g., a day off), rather than loading data and displaying a 'no games' splash.
+        if not self.has_games_to_display(dates_to_display):
+            return
+
+        # Get game data for each day in a single call, so it's pulled together (and shared w/ other scenes displaying the same days).
+        games_by_date = data.pwhl_data.get_games(tuple(dates_to_display))
 
         # Get current day game data. Save this for future reference.
         self.data = {
             'games_previous_pull': self.data['games'] if hasattr(self, 'data') else None, # If this is the first time this is run, we'd expect self.data to not exist.
-            'games': data.pwhl_data.get_games(dates_to_display[-1]), # Get data for current day. Current day will always be the last element of dates_to_display.
+            'games': games_by_date[dates_to_display[-1]], # Current day will always be the last element of dates_to_display.
         }
 
+        # Note if the current day's data is stale (i.e., the latest pull failed or didn't complete in time and the last good data was returned instead).
+        snapshot_info = data.pwhl_data.get_games.snapshot_info(tuple(dates_to_display))
+        self.data['is_stale'] = snapshot_info['is_stale'] if snapshot_info else False
+
         # If there are games to display from yesterday (and setting is enabled), build and display splash image (if enabled), then images for those games.
         if display_yesterday and self.settings['rollover']['show_completed_games_until_rollover_end_time']:
             if self.settings['splash']['display_splash']:
-                self.display_splash_image(len(self.data_previous_day['games']), date=dates_to_display[0])
-            self.display_game_images(self.data_previous_day['games'], date=dates_to_display[0])
+                self.display_splash_image(len(games_by_date[dates_to_display[0]]), date=dates_to_display[0])
+            self.display_game_images(games_by_date[dates_to_display[0]], date=dates_to_display[0])
 
         # For the current day's games, note if any goals were scored since the last data pull.
-        if self.data['games_previous_pull']: # Only applicable if there's a previous copy to compare to.
-            for game in self.data['games']:
-                if game['status'] != 1: # Not applicable if the game hasn't started yet.
-                    # Match games between data pulls.
-                    matched_game = next(filter(lambda x: x['game_id'] == game['game_id'], self.data['games_previous_pull']))
-
-                    if matched_game['status']  != 1: # Not applicable if the game hasn't started yet in the previous pull.
-                        # Determine if either team scored and set keys accordingly.
-                        game['away_team_scored'] = True if game['away_score'] > matched_game['away_score'] else False
-                        game['home_team_scored'] = True if game['home_score'] > matched_game['home_score'] else False
-                        
-                        if game['away_team_scored'] and game['home_team_scored']:
-                            game['scoring_team'] = 'both'
-                        elif game['away_team_scored']:
-                            game['scoring_team'] = 'away'
-                        elif game['home_team_scored']:
-                            game['scoring_team'] = 'home'
-                    
+        self.determine_scoring_teams(self.data['games'], self.data['games_previous_pull'])
+
         # Display splash (if enabled) for current day.
         if self.settings['splash']['display_splash']:
             self.display_splash_image(len(self.data['games']), date=dates_to_display[-1])
         
         # Display game image(s) for current day.
-        self.display_game_images(self.data['games'], date=dates_to_display[-1])
+        self.display_game_images(self.data['games'], date=dates_to_display[-1], is_stale=self.data['is_stale'])
+
+
+    def get_data_calls(self):
+        """ Notes the data calls made when this scene is displayed. Allows them to be made concurrently ahead of displaying the scene.
+
+        Returns:
+            list: List of tuples of a data function and a tuple of args to call it with.
+        """
+
+        settings = data_utils.read_yaml('config.yaml')['scene_settings'][self.LEAGUE.lower()]['games']
+        dates_to_display = date_utils.determine_dates_to_display_games(settings['rollover']['rollover_start_time_local'], settings['rollover']['rollover_end_time_local'])
+        return [(data.pwhl_data.get_games, (tuple(dates_to_display),))] if self.has_games_to_display(dates_to_display) else []
 
 
     def display_splash_image(self, num_games, date):
@@ -85,53 +81,30 @@ class PWHLGamesScene(GamesScene):
         # Build splash image, transition in, pause, transition out. 
         self.build_splash_image(num_games, date)
         self.transition_image(direction='in', image_already_combined=True)
-        sleep(self.settings['splash']['splash_display_duration'])
+        clock_utils.sleep(self.settings['splash']['splash_display_duration'])
         self.transition_image(direction='out', image_already_combined=True)
 
 
-    def display_game_images(self, games, date=None):
-        """ Builds and displays images on the matrix for each game in games.
+    def build_game_status_image(self, game):
+        """ Builds the appropriate image for the game's status (not started, in progress, or complete).
 
         Args:
-            games (list): List of game dicts. Each element has all details for a single game.
-            date (date, optional): Date of games. Only used to build 'no games' image when there's... well, no games on that data. Defaults to None.
+            game (dict): Dictionary with all details of a specific game.
         """
-        
-        # If there's any games to display, loop through them and build the appropriate images.
-        if games:
-            for game in games:
-                # If the game has yet to begin, build the game not started image.
-                if game['status'] in ['1']:
-                    self.build_game_not_started_image(game)
-
-                # If the game is over, build the final score image.
-                elif game['status'] in ['3','4']:
-                    self.build_game_complete_image(game)
-
-                # Otherwise, the game is in progress. Build the game in progress screen.
-                elif game['status'] in ['2']:
-                    self.build_game_in_progress_image(game)
-                else:
-                    print(f"Unexpected gameState encountered from API: {game['status']}.")
-
-                # Transition the image in on the matrix.
-                self.transition_image(direction='in')
-
-                # If a goal was scored, do goal fade animation (if enabled).
-                if self.settings['score_alerting']['score_coloured'] and self.settings['score_alerting']['score_fade_animation']:
-                    if game['scoring_team']:
-                        self.fade_score_change(game)
-                
-                # Hold image for calculated duration and transition out.
-                sleep(self.settings['game_display_duration'])
-                self.transition_image(direction='out')
-        
-        # If there's no games to display, and splash is disabled, build and display the no games image.
-        elif not self.settings['splash']['display_splash']:
-            self.build_no_games_image(date)
-            self.transition_image(direction='in', image_already_combined=True)
-            sleep(self.settings['game_display_duration'])
-            self.transition_image(direction='out', image_already_combined=True)
+
+        # If the game has yet to begin, build the game not started image.
+        if game['status'] in ['1']:
+            self.build_game_not_started_image(game)
+
+        # If the game is over, build the final score image.
+        elif game['status'] in ['3','4']:
+            self.build_game_complete_image(game)
+
+        # Otherwise, the game is in progress. Build the game in progress screen.
+        elif game['status'] in ['2']:
+            self.build_game_in_progress_image(game)
+        else:
+            print(f"Unexpected gameState encountered from API: {game['status']}.")
 
 
     def add_playing_period_to_image(self, game):
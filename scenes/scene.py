@@ -1,4 +1,6 @@
-from PIL import Image, ImageDraw, ImageFont
+from utils import frame_utils
+
+from PIL import ImageFont
 
 
 class Scene():
@@ -44,16 +46,4 @@ class Scene():
             Image: Provided image with a black overlay applied with opacity of overlay_opacity.
         """
 
-        # Convert input image to RGBA. Needed in order to apply fade overlay.
-        image = image.convert('RGBA')
-
-        # Create a new image of the same size with a black rectangle with opacity of the input overlay_opacity.
-        fade_overlay_image = Image.new('RGBA', image.size)
-        fade_overlay_draw = ImageDraw.Draw(fade_overlay_image)
-        fade_overlay_draw.rectangle([(0,0), fade_overlay_image.size], fill=self.COLOURS['black']+(overlay_opacity,))
-        
-        # Apply the overlay to the provided image and convert to RGB.
-        faded_image = Image.alpha_composite(image, fade_overlay_image)
-        faded_image = faded_image.convert('RGB')
-
-        return faded_image
\ No newline at end of file
+        return frame_utils.create_faded_image(image, overlay_opacity)
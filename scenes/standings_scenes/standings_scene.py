@@ -1,9 +1,9 @@
 from ..scene import Scene
-from setup.matrix_setup import matrix, matrix_options
-from utils import image_utils
+from setup.matrix_setup import matrix, display_size
+from utils import clock_utils, frame_utils, image_utils, layout_utils, scroll_utils
 
 from PIL import Image, ImageDraw
-from time import sleep
+import hashlib
 import math
 
 
@@ -21,21 +21,35 @@ class StandingsScene(Scene):
 
         # Image objects.
         self.images = {
-            'side':             Image.new('RGB', (8, matrix_options.rows)),
-            'standings_rows':   [], # Represents the individual rows in the standings, will be populated later.
-            'standings':        Image.new('RGB', (56, 256)),
-            'full':             Image.new('RGB', (matrix_options.cols, matrix_options.rows)),
-
+            'side':             Image.new('RGB', (8, display_size[1])),
+            'standings':        Image.new('RGB', (56, display_size[1])), # Strip with a row for every team in the standings. Replaced w/ a right-sized strip each time standings are built.
+            'full':             Image.new('RGB', layout_utils.CARD_SIZE), # For scenes built directly to it (e.g., splash). Sized to a single panel, and placed within the display per the layout below.
         }
 
         # ImageDraw object associated with each of the above Image objects.
         self.draw = {
             'side':             ImageDraw.Draw(self.images['side']),
-            'standings_rows':   [],
             'standings':        ImageDraw.Draw(self.images['standings']),
             'full':             ImageDraw.Draw(self.images['full'])
         }
 
+        # Frame buffer that the above images are composited onto for each frame of an animation.
+        self.frame_buffer = frame_utils.FrameBuffer(display_size)
+
+        # Position of each of the above images on the display, per the display's size.
+        self.layout = layout_utils.determine_standings_layout(display_size)
+
+        # Number of team rows in the current standings strip, and the number of rows that fit on the matrix at once.
+        self.num_standings_rows = 0
+        self.num_visible_rows = display_size[1] // 8
+
+        # Min seconds between frames when scrolling.
+        self.SCROLL_FRAME_INTERVAL = 1 / 60
+
+        # Side and strip images built previously, keyed by a hash of everything that impacts how they're drawn. Views whose data hasn't changed reuse these rather than being rebuilt.
+        self.standings_image_cache = {}
+        self.STANDINGS_IMAGE_CACHE_SIZE = 16 # Max number of views to keep. Comfortably more than the number of views any league displays.
+
 
     def build_splash_image(self, date):
         """ Builds splash screen image.
@@ -66,6 +80,7 @@ class StandingsScene(Scene):
 
     def build_standings_image(self, type, name, standings, playoff_cutoff_hard=0, playoff_cutoff_soft=0):
         """ Build overall standings image. Includes standing type in sidebar, and the actual standings by team.
+        If the same view was built previously from identical data, the cached side and strip images are reused rather than rebuilt.
 
         Args:
             type (str): Type of standing image that will be build (e.g., division, conference, etc.).
@@ -75,8 +90,40 @@ class StandingsScene(Scene):
             playoff_cutoff_soft (int, optional): How many teams above the soft cutoff for playoffs (think NBA play-in). Impacts line colours. Defaults to 0.
         """
 
-        # For the sideways text in the sidebar, create a temp image, then rotate that.
-        tmp_img = Image.new('RGB', self.images['side'].size[::-1])
+        # Note the number of teams to display.
+        self.num_standings_rows = len(standings)
+
+        # Note the favourite teams that should be highlighted per config.yaml.
+        highlighted_teams = sorted(self.favourite_teams) if self.favourite_teams and self.settings['highlight_fav_teams'] else []
+
+        # Hash everything that impacts how the view is drawn. If it matches a cached view, reuse its images.
+        cache_key = hashlib.sha1(repr((self.LEAGUE, type, name, standings, self.data['standings']['rank_method'], playoff_cutoff_hard, playoff_cutoff_soft, highlighted_teams)).encode()).hexdigest()
+        cached_view = self.standings_image_cache.pop(cache_key, None)
+
+        if cached_view:
+            # The side image is cleared after each view is displayed, so copy the cached one onto it. The strip is never cleared, so can be used directly.
+            self.images['side'].paste(cached_view['side'], (0, 0))
+            self.images['standings'] = cached_view['standings']
+        else:
+            self.build_side_image(name)
+            self.build_standing_row_images(standings, playoff_cutoff_hard, playoff_cutoff_soft, highlighted_teams)
+            cached_view = {'side': self.images['side'].copy(), 'standings': self.images['standings']}
+
+        # (Re)insert the view as the most recently used, and drop the least recently used if the cache is full.
+        self.standings_image_cache[cache_key] = cached_view
+        if len(self.standings_image_cache) > self.STANDINGS_IMAGE_CACHE_SIZE:
+            del self.standings_image_cache[next(iter(self.standings_image_cache))]
+
+
+    def build_side_image(self, name):
+        """ Builds the side image. Includes the league and standing type name as sideways text.
+
+        Args:
+            name (str): Name of the standing type to display (e.g., 'Atl').
+        """
+
+        # For the sideways text in the sidebar, create a temp image the height of a single panel, then rotate that. On taller displays, it sits at the top of the side image.
+        tmp_img = Image.new('RGB', (layout_utils.CARD_SIZE[1], 8))
         tmp_draw = ImageDraw.Draw(tmp_img)
         
         # First, add the background and text to the non-rotated image.
@@ -88,28 +135,28 @@ class StandingsScene(Scene):
         tmp_img = tmp_img.rotate(90, expand=True)
         self.images['side'].paste(tmp_img, (0,0))
 
-        # Build the individual standing row images and overall standing image.
-        self.build_standing_row_images(standings, playoff_cutoff_hard, playoff_cutoff_soft)
-
 
-    def build_standing_row_images(self, standings, playoff_cutoff_hard=0, playoff_cutoff_soft=0):
-        """ Builds images for each standing row (each team + details), as well as one for all the standings.
+    def build_standing_row_images(self, standings, playoff_cutoff_hard=0, playoff_cutoff_soft=0, highlighted_teams=()):
+        """ Builds the standings strip, a single image with a row for each team + details. Rows are drawn directly onto the strip.
 
         Args:
             standings (list): List of standing detail dicts.
             playoff_cutoff_hard (int, optional): How many teams above the hard cutoff for playoffs. Impacts line colours. Defaults to 0.
             playoff_cutoff_soft (int, optional): How many teams above the soft cutoff for playoffs (think NBA play-in). Impacts line colours. Defaults to 0.
+            highlighted_teams (list, optional): Abbreviations of teams to highlight. Defaults to ().
         """
 
-        # Reset standing rows back to an empty list and note the number of teams to display.
-        self.images['standings_rows'] = []
+        # Note the number of teams to display.
         num_teams = len(standings)
 
-        # For each team in the standings, build an image with just that row, append to a list, and add to the overall standings image.
+        # Create a strip tall enough for every team. Always at least the height of the matrix so a full viewport can be cropped from it.
+        strip = Image.new('RGB', (56, max(8 * num_teams, display_size[1])))
+        strip_draw = ImageDraw.Draw(strip)
+
+        # For each team in the standings, draw its row onto the strip.
         for row, team in enumerate(standings):
-            # Create temp Image and ImageDraw objects for the row.
-            tmp_img = Image.new('RGB', (self.images['standings'].size[0], 8))
-            tmp_draw = ImageDraw.Draw(tmp_img)
+            # Vertical offset of the row within the strip.
+            offset = row * 8
 
             # Determine the horizontal line colour based on the provided playoff cutoff(s).
             if row == playoff_cutoff_hard-1:
@@ -119,29 +166,28 @@ class StandingsScene(Scene):
             else:
                 line_colour = self.COLOURS['grey_dark']
             
-            # Add a horizontal line to the image. Skip this in the final iteration.
+            # Add a horizontal line to the row. Skip this in the final iteration.
             if row != num_teams-1:
-                tmp_draw.line([(1, 7), (54, 7)], fill=line_colour)
+                strip_draw.line([(1, offset+7), (54, offset+7)], fill=line_colour)
             
             # Determine the colour for each row's text based on if the team is a favourite per config.yaml.
             team_colour = self.COLOURS['white'] # Default white.
-            if self.favourite_teams and self.settings['highlight_fav_teams']:
-                if team['team_abrv'] in self.favourite_teams:
-                    team_colour = self.COLOURS['yellow'] # Favs are yellow.
+            if team['team_abrv'] in highlighted_teams:
+                team_colour = self.COLOURS['yellow'] # Favs are yellow.
 
-            # Determine placement of team ranking and add to image.
+            # Determine placement of team ranking and add to the row.
             rank_offset = 5 if len(str(team['rank'])) < 2 else 0
-            tmp_draw.text((1+rank_offset, -1), str(team['rank']), font=self.FONTS['sm'], fill=team_colour)
+            strip_draw.text((1+rank_offset, offset-1), str(team['rank']), font=self.FONTS['sm'], fill=team_colour)
 
             # Add a red star if the team has clinched a playoff spot.
             if team['has_clinched']:
-                tmp_draw.text((14, -2), '*', font=self.FONTS['med'], fill=self.COLOURS['red'])
+                strip_draw.text((14, offset-2), '*', font=self.FONTS['med'], fill=self.COLOURS['red'])
             
             # Add team abrv.
-            tmp_draw.text((21, -1), team['team_abrv'], font=self.FONTS['sm'], fill=team_colour)
+            strip_draw.text((21, offset-1), team['team_abrv'], font=self.FONTS['sm'], fill=team_colour)
 
             if self.data['standings']['rank_method'] == 'Points':
-                # Determine placement of team points and add to image.
+                # Determine placement of team points and add to the row.
                 ranker_to_display = str(team['points'])
                 if team['points'] < 10:
                     ranker_offset = 0
@@ -150,53 +196,86 @@ class StandingsScene(Scene):
                 else:
                     ranker_offset = -10
             elif self.data['standings']['rank_method'] == 'Win Percentage':
-                # Determine placement of team win percentage and add to image.
+                # Determine placement of team win percentage and add to the row.
                 ranker_to_display = team['percent'][2:] if team['percent'].startswith('0') else '00' # Looks odd, but will help display as 1.00.
                 
                 if ranker_to_display == '00':
                     ranker_offset = -5
-                    tmp_draw.point((51+ranker_offset-3, 5), fill=team_colour)
-                    tmp_draw.text((51+ranker_offset-8, -1), '1', font=self.FONTS['sm'], fill=team_colour)
+                    strip_draw.point((51+ranker_offset-3, offset+5), fill=team_colour)
+                    strip_draw.text((51+ranker_offset-8, offset-1), '1', font=self.FONTS['sm'], fill=team_colour)
                 else:
                     ranker_offset = -10
                     # Add a decimal place if needed (just a dot since the font's decimal looks odd).
-                    tmp_draw.point((51+ranker_offset-2, 5), fill=team_colour)
+                    strip_draw.point((51+ranker_offset-2, offset+5), fill=team_colour)
             elif self.data['standings']['rank_method'] == 'Wins':
                 pass # TODO: implement in future.
 
-            # Add ranker to image.
-            tmp_draw.text((51+ranker_offset, -1), ranker_to_display, font=self.FONTS['sm'], fill=team_colour)
+            # Add ranker to the row.
+            strip_draw.text((51+ranker_offset, offset-1), ranker_to_display, font=self.FONTS['sm'], fill=team_colour)
 
-            # Append the temp image to standings_rows.
-            self.images['standings_rows'].append(tmp_img)
-            
-            # Lastly, add to the overall standings image as well.
-            offset = row * 8
-            self.images['standings'].paste(tmp_img, (0, offset))    
+        # Use the new strip.
+        self.images['standings'] = strip
+        self.draw['standings'] = strip_draw
 
 
     def scroll_standings_image(self):
-        """ Scrolls the overall standing image down on the matrix, pausing after each complete row.
+        """ Scrolls the standings strip down on the matrix, pausing after each complete row.
+        Scroll position is based on elapsed time per a precomputed schedule, so the scroll takes the same time regardless of how long each frame takes to display. Frames are dropped if running behind.
+        Only the standings viewport is updated each frame. The side image doesn't move, so is left as is.
         """
 
         # Determine how many rows may need to be scrolled over.
-        num_teams = len(self.images['standings_rows'])
-        row_delta = -8 * max(num_teams - 4, 0) # If there's 4 or fewer teams to display, there will be no scrolling need.
-
-        # Loop over the distance, updating the full image w/ a new location for the standings image.
-        for offset in range(0, row_delta - 1, -1):
-            # Clear the main image and rebuild with new placements.
-            image_utils.clear_image(self.images['full'], self.draw['full'])
-            self.images['full'].paste(self.images['side'], (0, 0))
-            self.images['full'].paste(self.images['standings'], (8 , offset))
+        row_delta = 8 * max(self.num_standings_rows - self.num_visible_rows, 0) # If all teams fit on the matrix, there will be no scrolling needed.
+
+        # Precompute the scroll schedule per config.yaml. If no speed or total duration is provided, move a pixel per scroll_frame_duration.
+        scroll_settings = self.settings['scroll']
+        schedule = scroll_utils.build_scroll_schedule(
+            row_delta,
+            step=8,
+            pause_duration=scroll_settings['scroll_pause_duration'],
+            speed=scroll_settings.get('scroll_speed') or (1 / scroll_settings['scroll_frame_duration'] if scroll_settings['scroll_frame_duration'] > 0 else math.inf),
+            total_duration=scroll_settings.get('scroll_duration')
+        )
+
+        # Load the side image and strip into the frame buffer, and add the side image once. It stays in place for the whole scroll.
+        self.frame_buffer.set_layers(self.images)
+        self.frame_buffer.clear()
+        self.frame_buffer.paste_layer('side', self.layout['side'])
+
+        # Display frames until the schedule is complete. Only rebuild and display when the offset changes.
+        start_time = clock_utils.monotonic()
+        displayed_offset = None
+        while True:
+            elapsed = clock_utils.monotonic() - start_time
+            offset = scroll_utils.get_scroll_offset(schedule, elapsed)
+
+            if offset != displayed_offset:
+                col, row = self.layout['standings']
+                self.frame_buffer.paste_layer('standings', (col, row - offset)) # Portion of the strip above and below the matrix is ignored.
+                matrix.SetImage(self.frame_buffer.get_image())
+                displayed_offset = offset
+
+            if elapsed >= schedule[-1]['end']:
+                break
+
+            # Wait until the next frame is due.
+            clock_utils.sleep(max(self.SCROLL_FRAME_INTERVAL - (clock_utils.monotonic() - start_time - elapsed), 0))
+
+
+    def composite_standings_image(self, row_offset=0, col_offset=0, image_already_combined=False):
+        """ Pastes the layers of the image onto the frame buffer. The layers must already be loaded into the frame buffer.
 
-            # Display and hold for a duration specified in config.yaml. This is the very short time between frames.
-            matrix.SetImage(self.images['full'])
-            sleep(self.settings['scroll']['scroll_frame_duration'])
+        Args:
+            row_offset (int, optional): How many rows of pixels down the standings strip is scrolled. Defaults to 0.
+            col_offset (int, optional): Horizontal offset of the image, used in transitions. Defaults to 0.
+            image_already_combined (bool, optional): If the image was build directly to the full image. If true, paste that rather than the side image and standings strip. Defaults to False.
+        """
 
-            # If scrolled a full row, pause longer as specified in config.yaml.
-            if offset % 8 == 0:
-                sleep(self.settings['scroll']['scroll_pause_duration'])
+        for name in (['full'] if image_already_combined else ['side', 'standings']):
+            col, row = self.layout[name]
+            if name == 'standings':
+                row -= row_offset # Portion of the strip above and below the matrix is ignored.
+            self.frame_buffer.paste_layer(name, (col + col_offset, row))
 
 
     def add_league_logo_to_image(self):
@@ -226,97 +305,64 @@ class StandingsScene(Scene):
             image_already_combined (bool, optional): If the image was build directly to the full image. If true, skip building it here. Defaults to False.
         """
 
+        # Load the images into the frame buffer. Each frame of the transition is composited there from these.
+        self.frame_buffer.set_layers(self.images)
+
+        # On the way out, account for any scrolling that occurred.
+        row_offset = 8 * max(self.num_standings_rows - self.num_visible_rows, 0) if direction == 'out' else 0
+
         # 'Cut' transition.
         if self.settings['transition'] == 'cut':
             if direction == 'in':
-                # Build combined image if needed.
-                if not image_already_combined:
-                    self.images['full'].paste(self.images['side'], (0, 0))
-                    self.images['full'].paste(self.images['standings'], (8, 0))
-                
+                # Build combined image.
+                self.frame_buffer.clear()
+                self.composite_standings_image(image_already_combined=image_already_combined)
+
                 # Since there's no animation of any sort, an out transition is not needed. Simply display the image on the matrix.
-                matrix.SetImage(self.images['full'])
-        
+                matrix.SetImage(self.frame_buffer.get_image())
+
         # 'Fade' transition.
         elif self.settings['transition'] == 'fade':
             # Define the 'fade rule', that is the steps between 0 (transparent) and 255 (opaque).
             fade = (255, -1, -15) if direction == 'in' else (0, 256, 15)
 
-            # Build combined image if needed, don't need to do on the way out as the image is already build from the scroll.
-            if not image_already_combined and direction == 'in':
-                self.images['full'].paste(self.images['side'], (0, 0))
-                self.images['full'].paste(self.images['standings'], (8, 0))
+            # Build the combined image once. Only the fade changes between frames.
+            self.frame_buffer.clear()
+            self.composite_standings_image(row_offset, image_already_combined=image_already_combined)
 
             # Loop over opacities to apply to image.
             for overlay_opacity in range(*fade):
-                # Create faded image to display on matrix.
-                faded_for_display_image = self.create_faded_image(self.images['full'], overlay_opacity)
-
-                # Display and sleep for a short time to pace the animation.
-                matrix.SetImage(faded_for_display_image)
-                sleep(0.025)
+                # Display the faded frame and sleep for a short time to pace the animation.
+                matrix.SetImage(self.frame_buffer.get_image(overlay_opacity))
+                clock_utils.sleep(0.025)
 
             # Hold a moment with nothing displayed after fading out.
             if direction == 'out':
-                sleep(0.2)
+                clock_utils.sleep(0.2)
 
         # 'Modern' transition.
         elif self.settings['transition'] == 'modern':
             # Define the 'fade rule', that is the steps between 0 (transparent) and 255 (opaque).
             fade = (255, -1, -15) if direction == 'in' else (0, 256, 15)
 
-            # If the final image already exists, make a copy for later use.
-            if image_already_combined:
-                combined_image = self.images['full'].copy()
+            # Define the horizontal movement. Slides in from the left to the final position, or out to the right from the final position.
+            col_offsets = range(-len(range(*fade))+1, 1, 1) if direction == 'in' else range(0, len(range(*fade)), 1)
 
-            if direction == 'in':
-                # Loop over opacities to apply to image and horizontal movement via col_offset.
-                for overlay_opacity, col_offset in zip(range(*fade), range(-len(range(*fade))+1, 1, 1)):
-                    # Rebuild full image with offsets. Will first need to clear the image. This will also ensure there's no artifacts between loops of animation.    
-                    image_utils.clear_image(self.images['full'], self.draw['full'])
-                    
-                    # If the image has not already been combined, add each sub-image to the full with a col_offset applied.
-                    if not image_already_combined:
-                        self.images['full'].paste(self.images['side'], (0 + col_offset, 0))
-                        self.images['full'].paste(self.images['standings'], (8 + col_offset, 0))   
-                    # Otherwise, copy the combined_image copied above to full with a col_offset applied.
-                    else:
-                        self.images['full'].paste(combined_image, (col_offset, 0))
-
-                    # Create faded image to display on matrix.
-                    faded_for_display_image = self.create_faded_image(self.images['full'], overlay_opacity)
-
-                    # Display and sleep for a short time to pace the animation.
-                    matrix.SetImage(faded_for_display_image)
-                    sleep(0.025)
-            
-            elif direction == 'out':
-                # Loop over opacities to apply to image and horizontal movement via col_offset.
-                for overlay_opacity, col_offset in zip(range(*fade), range(0, len(range(*fade)), 1)):
-                    # Rebuild full image with offsets. Will first need to clear the image. This will also ensure there's no artifacts between loops of animation.    
-                    image_utils.clear_image(self.images['full'], self.draw['full'])
-                    
-                    # If the image has not already been combined, add each sub-image to the full with a col_offset applied.
-                    if not image_already_combined:
-                        # Determine the vertical offset needed to account for any scrolling that occurred.
-                        row_offset = -8 * max(len(self.images['standings_rows']) - 4, 0)           
-                        self.images['full'].paste(self.images['side'], (0 + col_offset, 0))
-                        self.images['full'].paste(self.images['standings'], (8 + col_offset, row_offset))      
-                    # Otherwise, copy the combined_image copied above to full with a col_offset applied.
-                    else:
-                        self.images['full'].paste(combined_image, (col_offset, 0))
-
-                    # Create faded image to display on matrix.
-                    faded_for_display_image = self.create_faded_image(self.images['full'], overlay_opacity)
-
-                    # Display and sleep for a short time to pace the animation.
-                    matrix.SetImage(faded_for_display_image)
-                    sleep(0.025)
-
-                # Hold a moment with nothing displayed.
-                sleep(0.2)
-
-        # On way out of 'out' transitions, reset all images to black for next image build.
+            # Loop over opacities to apply to image and horizontal movement via col_offset.
+            for overlay_opacity, col_offset in zip(range(*fade), col_offsets):
+                # Rebuild the frame with offsets. Will first need to clear it. This will also ensure there's no artifacts between loops of animation.
+                self.frame_buffer.clear()
+                self.composite_standings_image(row_offset, col_offset, image_already_combined)
+
+                # Display the faded frame and sleep for a short time to pace the animation.
+                matrix.SetImage(self.frame_buffer.get_image(overlay_opacity))
+                clock_utils.sleep(0.025)
+
+            # Hold a moment with nothing displayed.
+            if direction == 'out':
+                clock_utils.sleep(0.2)
+
+        # On way out of 'out' transitions, reset the side and full images to black for next image build. The standings strip is cached for reuse, so is left as is.
         if direction == 'out':
-            for image, image_draw in zip(self.images.values(), self.draw.values()):
-                image_utils.clear_image(image, image_draw)
\ No newline at end of file
+            for key in ['side', 'full']:
+                image_utils.clear_image(self.images[key], self.draw[key])
\ No newline at end of file
@@ -1,10 +1,7 @@
 from .standings_scene import StandingsScene
 from setup.matrix_setup import matrix
 import data.pwhl_data
-from utils import data_utils
-
-from datetime import datetime as dt
-from time import sleep
+from utils import clock_utils, data_utils
 
 
 class PWHLStandingsScene(StandingsScene):
@@ -17,6 +14,16 @@ class PWHLStandingsScene(StandingsScene):
         self.LEAGUE = 'PWHL'
 
 
+    def get_data_calls(self):
+        """ Notes the data calls made when this scene is displayed. Allows them to be made concurrently ahead of displaying the scene.
+
+        Returns:
+            list: List of tuples of a data function and a tuple of args to call it with.
+        """
+
+        return [(data.pwhl_data.get_standings, ())]
+
+
     def display_scene(self):
         # Refresh config and load to settings key.
         self.settings = data_utils.read_yaml('config.yaml')['scene_settings'][self.LEAGUE.lower()]['standings']
@@ -30,9 +37,9 @@ class PWHLStandingsScene(StandingsScene):
         # Display splash if enabled.
         if self.settings['splash']['display_splash']:
             # Build splash image, transition in, pause, transition out. 
-            self.build_splash_image(dt.today().date())
+            self.build_splash_image(clock_utils.now().date())
             self.transition_image(direction='in', image_already_combined=True)
-            sleep(self.settings['splash']['splash_display_duration'])
+            clock_utils.sleep(self.settings['splash']['splash_display_duration'])
             self.transition_image(direction='out', image_already_combined=True)
 
         # For each standing type that should be displayed per config.yaml, build images and display.
@@ -0,0 +1,216 @@
+from ..scene import Scene
+from ..game_scenes.games_scene_nhl import NHLGamesScene
+from ..game_scenes.games_scene_nba import NBAGamesScene
+from ..game_scenes.games_scene_pwhl import PWHLGamesScene
+from setup.matrix_setup import matrix, display_size
+import data.nhl_data
+import data.nba_data
+import data.pwhl_data
+from data import league_calendar
+from utils import clock_utils, data_utils, date_utils, fetch_utils, frame_utils, image_utils, layout_utils
+
+from PIL import Image
+
+
+class TickerScene(Scene):
+    """ Ticker scene, across leagues. Renders today's games for each league into a single strip and scrolls it across the matrix.
+    Game images are built by the game scene of each league, so look the same as they do in those scenes. This class extends the general Scene class. An object of this class type is created when the scoreboard is started.
+    """
+
+    def __init__(self):
+        """ Creates a game scene for each league and notes its games data function. Game scenes are only used to build images, never displayed directly.
+        First runs init from generic Scene class.
+        """
+
+        super().__init__()
+
+        # Game scene and games data function for each league, by the league's name in config.yaml.
+        self.LEAGUES = {
+            'nhl':  {'games_scene': NHLGamesScene(), 'get_games': data.nhl_data.get_games},
+            'nba':  {'games_scene': NBAGamesScene(), 'get_games': data.nba_data.get_games},
+            'pwhl': {'games_scene': PWHLGamesScene(), 'get_games': data.pwhl_data.get_games}
+        }
+
+        # Strip with a tile for each league and game. Replaced w/ a right-sized strip when the games displayed change.
+        self.images = {
+            'strip': Image.new('RGB', (0, layout_utils.CARD_SIZE[1]))
+        }
+
+        # Col of each tile within the strip, and the bytes of the tile drawn there, by tile key. Allows tiles that haven't changed to be left as is.
+        self.tile_cols = {}
+        self.tile_bytes = {}
+
+        # League logo tiles by league. These never change, so are only built once.
+        self.league_tiles = {}
+
+        # Games from the previous data pull, by league. Used to note which teams scored since.
+        self.games_previous_pull = {}
+
+        # Cols between tiles in the strip.
+        self.TILE_SPACING = 8
+
+        # Min seconds between frames when scrolling.
+        self.SCROLL_FRAME_INTERVAL = 1 / 60
+
+        # Frame buffer that the strip is composited onto for each frame of the scroll.
+        self.frame_buffer = frame_utils.FrameBuffer(display_size)
+
+
+    def display_scene(self):
+        """ Displays the scene on the matrix.
+        Includes logic on which tiles to build, when to display, etc.
+        """
+
+        # Refresh config and load to settings key.
+        self.settings = data_utils.read_yaml('config.yaml')['scene_settings']['ticker']
+
+        # Load each league's games concurrently, as they're independent. Loaded here rather than ahead of the cycle, as live scores would be stale again by the time the ticker is displayed.
+        fetch_utils.run_concurrently(self.get_data_calls(), raise_errors=False)
+
+        # Build a tile for each league with games today, followed by a tile for each of those games. Leagues w/o games coming up (e.g., off-season) are skipped.
+        tiles = {}
+        for league in filter(league_calendar.is_active, self.settings['leagues']):
+            games_scene = self.LEAGUES[league]['games_scene']
+            games_scene.load_settings()
+            dates = self.determine_dates_to_pull(games_scene.settings)
+
+            # Skip leagues w/o games today (e.g., a day off), per what's known of their schedule.
+            if not games_scene.has_games_to_display(dates[-1:]):
+                continue
+
+            # Get the league's games for today (the last date), and note if the data is stale (i.e., the latest pull failed or didn't complete in time and the last good data was returned instead).
+            games = self.LEAGUES[league]['get_games'](dates)[dates[-1]]
+            snapshot_info = self.LEAGUES[league]['get_games'].snapshot_info(dates)
+            is_stale = snapshot_info['is_stale'] if snapshot_info else False
+
+            # Note which teams scored since the last data pull, then save this pull for next time.
+            games_scene.determine_scoring_teams(games, self.games_previous_pull.get(league))
+            self.games_previous_pull[league] = games
+
+            if games:
+                tiles[('league', league)] = self.build_league_tile(league)
+                for game in games:
+                    tiles[(league, game['game_id'])] = games_scene.build_game_card_image(game, is_stale)
+
+        # If there's no games to display for any league, there's nothing to scroll.
+        if not tiles:
+            return
+
+        # Update the strip with the tiles and scroll it across the matrix.
+        self.update_strip(tiles)
+        self.scroll_strip()
+
+
+    def get_data_calls(self):
+        """ Notes the data calls made when this scene is displayed. Allows them to be made concurrently ahead of displaying the scene.
+
+        Returns:
+            list: List of tuples of a data function and a tuple of args to call it with.
+        """
+
+        settings = data_utils.read_yaml('config.yaml')['scene_settings']
+        data_calls = []
+        for league in filter(league_calendar.is_active, settings['ticker']['leagues']):
+            dates = self.determine_dates_to_pull(settings[league]['games'])
+            if self.LEAGUES[league]['games_scene'].has_games_to_display(dates[-1:]):
+                data_calls.append((self.LEAGUES[league]['get_games'], (dates,)))
+
+        return data_calls
+
+
+    def determine_dates_to_pull(self, games_settings):
+        """ Determines the dates to pull games for. The same dates as the league's game scene, so both share the same data. Only today (the last date) is displayed.
+
+        Args:
+            games_settings (dict): Game scene settings for the league.
+
+        Returns:
+            tuple: Dates to pull games for.
+        """
+
+        return tuple(date_utils.determine_dates_to_display_games(games_settings['rollover']['rollover_start_time_local'], games_settings['rollover']['rollover_end_time_local']))
+
+
+    def build_league_tile(self, league):
+        """ Builds the tile that precedes a league's games in the strip. Includes the league logo.
+
+        Args:
+            league (str): League's name in config.yaml.
+
+        Returns:
+            Image: League tile.
+        """
+
+        # Only build the tile once. Uses the league logo as added to the game scene's splash.
+        if league not in self.league_tiles:
+            games_scene = self.LEAGUES[league]['games_scene']
+            games_scene.add_league_logo_to_image()
+            self.league_tiles[league] = games_scene.images['full'].crop((0, 0, 32, layout_utils.CARD_SIZE[1]))
+            image_utils.clear_image(games_scene.images['full'], games_scene.draw['full'])
+
+        return self.league_tiles[league]
+
+
+    def update_strip(self, tiles):
+        """ Updates the strip with the provided tiles.
+        If the same tiles are displayed as last time, only those that changed (e.g., a game's score) are redrawn, in place. Otherwise, the strip is rebuilt.
+
+        Args:
+            tiles (dict): Tile images by key, in the order they're displayed.
+        """
+
+        # If the tiles are the same as last time, redraw only those that have changed.
+        if list(tiles) == list(self.tile_cols):
+            for key, tile in tiles.items():
+                tile_bytes = tile.tobytes()
+                if tile_bytes != self.tile_bytes[key]:
+                    self.images['strip'].paste(tile, (self.tile_cols[key], 0))
+                    self.tile_bytes[key] = tile_bytes
+
+        # Otherwise, build a new strip. Tiles are separated by TILE_SPACING, with no spacing after the last.
+        else:
+            strip_width = sum(tile.size[0] for tile in tiles.values()) + self.TILE_SPACING * (len(tiles) - 1)
+            self.images['strip'] = Image.new('RGB', (strip_width, layout_utils.CARD_SIZE[1]))
+            self.tile_cols = {}
+            self.tile_bytes = {}
+
+            col = 0
+            for key, tile in tiles.items():
+                self.images['strip'].paste(tile, (col, 0))
+                self.tile_cols[key] = col
+                self.tile_bytes[key] = tile.tobytes()
+                col += tile.size[0] + self.TILE_SPACING
+
+
+    def scroll_strip(self):
+        """ Scrolls the strip across the matrix from right to left, until it has fully left the matrix.
+        Scroll position is based on elapsed time, so the scroll takes the same time regardless of how long each frame takes to display. Frames are dropped if running behind.
+        The strip is only loaded into the frame buffer once. Each frame pastes the portion of it visible on the matrix.
+        """
+
+        # Determine how far to scroll, and how long it'll take.
+        distance = self.images['strip'].size[0] + display_size[0]
+        duration = distance / self.settings['scroll_speed']
+
+        # Load the strip into the frame buffer. It's vertically placed the same as a single game.
+        self.frame_buffer.set_layer('strip', self.images['strip'])
+        row = layout_utils.determine_card_origin(display_size)[1]
+
+        # Display frames until the strip has left the matrix. Only rebuild and display when the offset changes.
+        start_time = clock_utils.monotonic()
+        displayed_offset = None
+        while True:
+            elapsed = clock_utils.monotonic() - start_time
+            offset = min(int(elapsed * self.settings['scroll_speed']), distance)
+
+            if offset != displayed_offset:
+                self.frame_buffer.clear()
+                self.frame_buffer.paste_layer('strip', (display_size[0] - offset, row)) # Portion of the strip off the matrix is ignored.
+                matrix.SetImage(self.frame_buffer.get_image())
+                displayed_offset = offset
+
+            if elapsed >= duration:
+                break
+
+            # Wait until the next frame is due.
+            clock_utils.sleep(max(self.SCROLL_FRAME_INTERVAL - (clock_utils.monotonic() - start_time - elapsed), 0))
@@ -1,55 +1,29 @@
-from utils import data_utils
+from utils import brightness_utils, data_utils
 from rgbmatrix import RGBMatrix, RGBMatrixOptions
 # from RGBMatrixEmulator import RGBMatrix, RGBMatrixOptions
-from datetime import datetime as dt
-import math
 
 
-def determine_matrix_brightness():
-    """ Determines the brightness of the LED matrix.
-
-    Returns:
-        int: brightness from 1-100.
-    """
-
-    # Load brightness config settings from config.yaml.
-    brightness_config = data_utils.read_yaml('config.yaml')['brightness']
-
-    # If static brightness, simply get the brightness from confir.yaml.
-    if brightness_config['brightness_mode'] == 'static':
-        return brightness_config['max_brightness']
-    
-    # If automatic brightness, calculate the brightness based on max_brightness and the current time.
-    elif brightness_config['brightness_mode'] == 'auto':
-        # Get hour of current time as an int 0-23.
-        hour_int = dt.today().time().hour
-        
-        # Calculate brightness based on max_brightness and current time.
-        max_brightness = brightness_config['max_brightness']
-        brightness = math.ceil(max_brightness * hour_int / 12 if hour_int <= 12 else max_brightness * (24 - hour_int) / 12)
-        brightness = brightness if brightness >= 15 else 15
-        return brightness
-    
-    # If unexpected brightness_mode, fallback to max brightness.
-    else:
-        print("Unexpected brightness_mode encountered in config.yaml: {brightness_config['brightness_mode']}")
-        return 100
+# Hardware specific config from config.yaml.
+hardware_config = data_utils.read_yaml('config.yaml')['hardware_config']
 
-# Make matrix options object with needed settings.
+# Make matrix options object with needed settings. Panel geometry defaults to a single 64x32 panel if not specified in config.yaml.
 matrix_options = RGBMatrixOptions()
-matrix_options.rows = 32
-matrix_options.cols = 64
-matrix_options.chain_length = 1
-matrix_options.parallel = 1
+matrix_options.rows = hardware_config.get('rows', 32)
+matrix_options.cols = hardware_config.get('cols', 64)
+matrix_options.chain_length = hardware_config.get('chain_length', 1)
+matrix_options.parallel = hardware_config.get('parallel', 1)
 matrix_options.drop_privileges = False # Needed to ensure fonts and images load correctly.
-
-# Hardware specific config from config.yaml.
-hardware_config = data_utils.read_yaml('config.yaml')['hardware_config']
 matrix_options.gpio_slowdown = hardware_config['gpio_slowdown']
 matrix_options.hardware_mapping = hardware_config['hardware_mapping']
 
-# Determine brightness.
-matrix_options.brightness = determine_matrix_brightness()
+# Native size (width, height) of the display, in pixels. Chained panels extend the width, parallel chains extend the height.
+display_size = (matrix_options.cols * matrix_options.chain_length, matrix_options.rows * matrix_options.parallel)
+
+# Make matrix object.
+hardware_matrix = RGBMatrix(options=matrix_options)
+
+# Set brightness per the precomputed schedule. Updated from a background timer once the scoreboard is running.
+brightness_controller = brightness_utils.BrightnessController(hardware_matrix)
 
-# Finally, make matrix object.
-matrix = RGBMatrix(options=matrix_options)
+# Finally, wrap the matrix so frames are dimmed in software when below the hardware min brightness (if set).
+matrix = brightness_utils.DimmedMatrix(hardware_matrix, brightness_controller)
@@ -1,12 +1,222 @@
+from utils import clock_utils, data_utils
+
 import requests
 from requests.adapters import HTTPAdapter, Retry
+from urllib.parse import urlparse
+import threading
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """ Raised in place of making a request to a host that has failed repeatedly and is within its cool-down period.
+    """
+
+
+class LatencyBudgetExceededError(requests.exceptions.Timeout):
+    """ Raised in place of making a request once the network time for the current cycle has exceeded the configured budget.
+    Network time is wall-clock time w/ any request in flight, so concurrent requests only count once.
+    """
+
+
+class ScoreboardSession(requests.Session):
+    """ Session used for all API calls. Extends requests.Session with default timeouts, a per-host circuit breaker, and a per-cycle latency budget.
+    Retries and pooled keep-alive connections are handled by the adapter mounted for both http:// and https://.
+    """
+
+    def __init__(self, network_config):
+        """ Mounts the retry/pooling adapter and sets up circuit breaker and metrics state.
+
+        Args:
+            network_config (dict): Network settings per config.yaml.
+        """
+
+        super().__init__()
+        self.network_config = network_config
+
+        # Define a retry strategy and connection pooling. Each host gets its own pool of keep-alive connections, capped at max_connections_per_host.
+        retry_strategy = Retry(
+            total=3, # Maximum number of retries. Kept low as the timeouts below bound each attempt.
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504] # HTTP status codes to retry on.
+        )
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=10, # Number of hosts to keep pools for.
+            pool_maxsize=network_config['max_connections_per_host'],
+            pool_block=True # Wait for a free connection rather than opening extras beyond pool_maxsize.
+        )
+        self.mount('http://', adapter)
+        self.mount('https://', adapter)
+
+        # Requests can be made from background threads, so guard all of the below state.
+        self.lock = threading.Lock()
+
+        # Circuit breaker state by host. Each has the count of consecutive failures and the time (monotonic) the host can be tried again.
+        self.circuits = {}
+
+        # Number of requests in flight, and when (monotonic) the network last became busy, i.e., went from none to one in flight. Used to measure network time w/o double counting concurrent requests.
+        self.requests_in_flight = 0
+        self.busy_since = None
+
+        # Network metrics for the current cycle.
+        self.start_cycle()
+
+
+    def start_cycle(self):
+        """ Resets the network metrics and latency budget. Called at the start of each scoreboard cycle.
+        """
+
+        with self.lock:
+            self.cycle_metrics = {
+                'requests': 0,
+                'failures': 0,
+                'skipped_circuit_open': 0,
+                'skipped_budget_exceeded': 0,
+                'network_time': 0.0, # Wall-clock time w/ any request in flight. What the latency budget applies to.
+                'total_latency': 0.0, # Sum of the latency of each request. More than network_time when requests are made concurrently.
+                'max_latency': 0.0,
+                'latency_by_host': {}
+            }
+
+            # Requests still in flight from the previous cycle only count towards this one from now on.
+            if self.requests_in_flight:
+                self.busy_since = clock_utils.monotonic()
+
+
+    def get_cycle_metrics(self):
+        """ Gets the network metrics for the current cycle.
+
+        Returns:
+            dict: Request counts and latency (seconds) for the current cycle. Includes the budget and if it has been exceeded.
+        """
+
+        with self.lock:
+            metrics = dict(self.cycle_metrics, latency_by_host=dict(self.cycle_metrics['latency_by_host']), network_time=self.determine_network_time())
+
+        metrics['latency_budget'] = self.network_config['cycle_latency_budget']
+        metrics['is_budget_exceeded'] = metrics['network_time'] >= metrics['latency_budget']
+        return metrics
+
+
+    def determine_network_time(self):
+        """ Determines the network time of the current cycle so far, including any requests still in flight. Must be called w/ the lock held.
+
+        Returns:
+            float: Seconds of wall-clock time w/ any request in flight.
+        """
+
+        if self.requests_in_flight:
+            return self.cycle_metrics['network_time'] + clock_utils.monotonic() - self.busy_since
+        return self.cycle_metrics['network_time']
+
+
+    def request(self, method, url, **kwargs):
+        """ Makes a request, applying the circuit breaker, latency budget, and default timeouts. Records metrics for the request.
+        Responses with an error status code raise an exception, same as a failed connection.
+
+        Args:
+            method (str): HTTP method.
+            url (str): URL to request.
+
+        Returns:
+            Response: Response of the request.
+        """
+
+        host = urlparse(url).hostname
+
+        with self.lock:
+            # If the circuit for this host is open, skip it until the cool-down period has passed.
+            circuit = self.circuits.get(host)
+            if circuit and clock_utils.monotonic() < circuit['retry_at']:
+                self.cycle_metrics['skipped_circuit_open'] += 1
+                raise CircuitOpenError(f'Skipping request to {host}, circuit open after {circuit["failures"]} consecutive failures.')
+
+            # If the cycle's latency budget has been used up, skip.
+            remaining_budget = self.network_config['cycle_latency_budget'] - self.determine_network_time()
+            if remaining_budget <= 0:
+                self.cycle_metrics['skipped_budget_exceeded'] += 1
+                raise LatencyBudgetExceededError(f'Skipping request to {host}, cycle latency budget of {self.network_config["cycle_latency_budget"]}s exceeded.')
+
+            # Note the request is in flight. If it's the only one, the network is now busy.
+            if not self.requests_in_flight:
+                self.busy_since = clock_utils.monotonic()
+            self.requests_in_flight += 1
+
+        # Apply default connect/read timeouts if none were provided. The read timeout is capped at what's left of the cycle's latency budget.
+        kwargs.setdefault('timeout', (self.network_config['connect_timeout'], min(self.network_config['read_timeout'], remaining_budget)))
+
+        start_time = clock_utils.monotonic()
+        try:
+            response = super().request(method, url, **kwargs)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            # Client errors (4xx) are a problem with the request rather than the host, so don't count towards the circuit breaker.
+            is_client_error = isinstance(e, requests.exceptions.HTTPError) and e.response is not None and e.response.status_code < 500
+            self.record_request(host, clock_utils.monotonic() - start_time, failed=True, is_host_failure=not is_client_error)
+            raise
+        finally:
+            # Note the request is no longer in flight. If it was the last one, add the time the network was busy to the cycle's network time.
+            with self.lock:
+                self.requests_in_flight -= 1
+                if not self.requests_in_flight:
+                    self.cycle_metrics['network_time'] += clock_utils.monotonic() - self.busy_since
+
+        self.record_request(host, clock_utils.monotonic() - start_time, failed=False)
+        return response
+
+
+    def record_request(self, host, latency, failed, is_host_failure=True):
+        """ Records metrics for a completed request and updates the host's circuit breaker.
+
+        Args:
+            host (str): Host the request was made to.
+            latency (float): Seconds the request took, including retries.
+            failed (bool): If the request failed.
+            is_host_failure (bool, optional): If a failure should count towards the host's circuit breaker. Defaults to True.
+        """
+
+        with self.lock:
+            # Metrics.
+            self.cycle_metrics['requests'] += 1
+            self.cycle_metrics['total_latency'] += latency
+            self.cycle_metrics['max_latency'] = max(self.cycle_metrics['max_latency'], latency)
+            self.cycle_metrics['latency_by_host'][host] = self.cycle_metrics['latency_by_host'].get(host, 0.0) + latency
+
+            # Circuit breaker. A success closes the circuit. Enough consecutive failures open it for the cool-down period.
+            if not failed:
+                self.circuits.pop(host, None)
+            else:
+                self.cycle_metrics['failures'] += 1
+                if not is_host_failure:
+                    return
+                circuit = self.circuits.setdefault(host, {'failures': 0, 'retry_at': 0})
+                circuit['failures'] += 1
+                if circuit['failures'] >= self.network_config['circuit_breaker']['failure_threshold']:
+                    circuit['retry_at'] = clock_utils.monotonic() + self.network_config['circuit_breaker']['cooldown_duration']
+
+
+def load_network_config():
+    """ Loads network settings from config.yaml, falling back to defaults for anything not specified (e.g., an older config.yaml).
+
+    Returns:
+        dict: Network settings.
+    """
+
+    network_config = {
+        'connect_timeout': 3.05,
+        'read_timeout': 10,
+        'max_connections_per_host': 4,
+        'cycle_latency_budget': 60,
+        'circuit_breaker': {
+            'failure_threshold': 3,
+            'cooldown_duration': 60
+        }
+    }
+
+    user_network_config = data_utils.read_yaml('config.yaml').get('network') or {}
+    network_config['circuit_breaker'].update(user_network_config.pop('circuit_breaker', None) or {})
+    network_config.update(user_network_config)
+    return network_config
 
 
-# Create a session and define a retry strategy. Used for API calls.
-session = requests.Session()
-retry_strategy = Retry(
-    total=10, # Maximum number of retries.
-    backoff_factor=0.5, 
-    status_forcelist=[429, 500, 502, 503, 504] # HTTP status codes to retry on.
-)
-session.mount('http://', HTTPAdapter(max_retries=retry_strategy))
\ No newline at end of file
+# Create a session used for API calls.
+session = ScoreboardSession(load_network_config())
@@ -0,0 +1,177 @@
+from utils import clock_utils, data_utils
+
+import math
+import os
+import threading
+
+
+def build_brightness_schedule(brightness_config):
+    """ Precomputes the brightness for each minute of the day per the brightness settings in config.yaml.
+    In auto mode, brightness follows a smooth curve from min_brightness at midnight up to max_brightness at noon, and back down.
+
+    Args:
+        brightness_config (dict): Brightness settings per config.yaml.
+
+    Returns:
+        list: Brightness (0-100) for each minute of the day, starting at midnight.
+    """
+
+    max_brightness = brightness_config['max_brightness']
+
+    # If static brightness, every minute is max_brightness.
+    if brightness_config['brightness_mode'] == 'static':
+        return [max_brightness] * 1440
+
+    # If automatic brightness, ease between min_brightness and max_brightness over the day.
+    elif brightness_config['brightness_mode'] == 'auto':
+        min_brightness = min(brightness_config.get('min_brightness', 15), max_brightness)
+        return [round(min_brightness + (max_brightness - min_brightness) * (1 - math.cos(2 * math.pi * minute / 1440)) / 2) for minute in range(1440)]
+
+    # If unexpected brightness_mode, fallback to max brightness.
+    else:
+        print(f"Unexpected brightness_mode encountered in config.yaml: {brightness_config['brightness_mode']}")
+        return [100] * 1440
+
+
+def build_dimming_lut(brightness, hardware_min_brightness, gamma=2.2):
+    """ Builds a lookup table that dims images in software, for brightness below what the matrix hardware displays well.
+    The matrix is kept at hardware_min_brightness and each channel value is scaled down the rest of the way. Scaling is done in linear light (per gamma), so dimming looks even across colours.
+
+    Args:
+        brightness (int): Target brightness (0-100).
+        hardware_min_brightness (int): Lowest brightness the matrix is set to.
+        gamma (float, optional): Gamma of the matrix. Defaults to 2.2.
+
+    Returns:
+        list: Lookup table of 768 values (256 per channel) for Image.point.
+    """
+
+    scale = brightness / hardware_min_brightness
+    lut = [round(255 * ((value / 255) ** gamma * scale) ** (1 / gamma)) for value in range(256)]
+    return lut * 3
+
+
+class BrightnessController():
+    """ Keeps matrix brightness up to date with the brightness schedule, from a background timer. Brightness changes at any point rather than only between loops of scene_order.
+    The schedule is only rebuilt when config.yaml changes. If brightness.hardware_min_brightness is set, lower brightness is achieved by dimming frames in software (see DimmedMatrix).
+    """
+
+    def __init__(self, matrix, config_path='config.yaml'):
+        """ Builds the schedule and sets the matrix brightness for the current time.
+
+        Args:
+            matrix (RGBMatrix): Matrix to set the brightness of.
+            config_path (str, optional): Path of config.yaml. Defaults to 'config.yaml'.
+        """
+
+        self.matrix = matrix
+        self.config_path = config_path
+
+        # Modified time of config.yaml the schedule was built from, and the schedule.
+        self.config_mtime = None
+        self.schedule = None
+
+        # Brightness currently applied, and the software dimming lookup table (None if not dimming in software).
+        self.brightness = None
+        self.dimming_lut = None
+
+        self.update()
+
+
+    def update(self):
+        """ Rebuilds the schedule if config.yaml has changed since it was built, and applies the brightness for the current time if it has changed.
+        """
+
+        # Rebuild the schedule if config.yaml has changed.
+        config_mtime = os.path.getmtime(self.config_path)
+        if config_mtime != self.config_mtime:
+            self.brightness_config = data_utils.read_yaml(self.config_path)['brightness']
+            self.schedule = build_brightness_schedule(self.brightness_config)
+            self.config_mtime = config_mtime
+            self.brightness = None # Reapply, as settings may have changed.
+
+        # Determine the brightness for the current minute. Nothing to do if it's already applied.
+        now = clock_utils.now()
+        brightness = self.schedule[now.hour * 60 + now.minute]
+        if brightness == self.brightness:
+            return
+
+        # Set the matrix brightness. If below the hardware min (when set), keep the matrix at the min and dim the rest of the way in software.
+        hardware_min_brightness = self.brightness_config.get('hardware_min_brightness')
+        if hardware_min_brightness and brightness < hardware_min_brightness:
+            self.dimming_lut = build_dimming_lut(brightness, hardware_min_brightness, self.brightness_config.get('gamma', 2.2))
+            self.matrix.brightness = hardware_min_brightness
+        else:
+            self.dimming_lut = None
+            self.matrix.brightness = brightness
+
+        self.brightness = brightness
+
+
+    def start(self, interval=15):
+        """ Starts a background timer that updates the brightness every interval seconds. The timer is a daemon, so doesn't keep the scoreboard running on its own.
+
+        Args:
+            interval (float, optional): Seconds between updates. Defaults to 15.
+        """
+
+        # Update until the scoreboard stops. Errors (e.g., config.yaml mid-edit) are noted and retried on the next update.
+        def run():
+            while True:
+                clock_utils.sleep(interval)
+                try:
+                    self.update()
+                except Exception as e:
+                    print(f'Unable to update matrix brightness: {e!r}')
+
+        threading.Thread(target=run, daemon=True).start()
+
+
+    def dim_image(self, image):
+        """ Applies software dimming to an image, if needed at the current brightness.
+
+        Args:
+            image (Image): RGB image to dim.
+
+        Returns:
+            Image: Dimmed image. The provided image if no dimming is needed.
+        """
+
+        dimming_lut = self.dimming_lut # Read once, as the timer may replace it at any point.
+        return image.point(dimming_lut) if dimming_lut else image
+
+
+class DimmedMatrix():
+    """ Wraps the matrix, dimming each frame in software per the brightness controller before it's displayed. Otherwise behaves the same as the matrix.
+    """
+
+    def __init__(self, matrix, brightness_controller):
+        """ Wraps the provided matrix.
+
+        Args:
+            matrix (RGBMatrix): Matrix to wrap.
+            brightness_controller (BrightnessController): Controller determining the dimming to apply.
+        """
+
+        # Set directly, as all other attributes are set on the wrapped matrix.
+        self.__dict__['matrix'] = matrix
+        self.__dict__['brightness_controller'] = brightness_controller
+
+
+    # Anything other than dimming is handled by the wrapped matrix.
+    def __getattr__(self, name):
+        return getattr(self.matrix, name)
+
+
+    def __setattr__(self, name, value):
+        setattr(self.matrix, name, value)
+
+
+    def SetImage(self, image, *args, **kwargs):
+        """ Displays an image on the matrix, dimmed if needed.
+
+        Args:
+            image (Image): RGB image to display.
+        """
+
+        self.matrix.SetImage(self.brightness_controller.dim_image(image), *args, **kwargs)
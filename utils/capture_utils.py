@@ -0,0 +1,167 @@
+from utils import clock_utils
+
+from PIL import Image, ImageSequence
+import requests
+import hashlib
+import json
+import os
+
+
+class FrameCapture():
+    """ Wraps the matrix, recording every frame displayed while capturing along with the time it was displayed. Otherwise behaves the same as the matrix.
+    """
+
+    def __init__(self, matrix):
+        """ Wraps the provided matrix. Not capturing until start is called.
+
+        Args:
+            matrix (RGBMatrix): Matrix to wrap.
+        """
+
+        # Set directly, as all other attributes are set on the wrapped matrix.
+        self.__dict__['matrix'] = matrix
+        self.__dict__['frames'] = None
+
+
+    # Anything other than capturing is handled by the wrapped matrix.
+    def __getattr__(self, name):
+        return getattr(self.matrix, name)
+
+
+    def __setattr__(self, name, value):
+        setattr(self.matrix, name, value)
+
+
+    def start(self):
+        """ Starts capturing frames. Any previously captured frames are discarded.
+        """
+
+        self.__dict__['frames'] = []
+
+
+    def stop(self):
+        """ Stops capturing frames.
+
+        Returns:
+            tuple: List of tuples of the time (monotonic) each frame was displayed and a copy of the frame, in the order displayed. And the time capture stopped.
+        """
+
+        frames, self.__dict__['frames'] = self.frames, None
+        return frames, clock_utils.monotonic()
+
+
+    def SetImage(self, image, *args, **kwargs):
+        """ Displays an image on the matrix, noting it if capturing.
+
+        Args:
+            image (Image): RGB image to display.
+        """
+
+        if self.frames is not None:
+            self.frames.append((clock_utils.monotonic(), image.copy())) # Copied, as scenes reuse the same image (or buffer) between frames.
+        self.matrix.SetImage(image, *args, **kwargs)
+
+
+def save_frames(frames, end_time, path):
+    """ Saves captured frames as an animation, with each frame displayed for as long as it was on the matrix.
+    Saved as an APNG if path ends in .png, otherwise a GIF. APNG is lossless, so is preferred for comparing captures.
+
+    Args:
+        frames (list): List of tuples of the time each frame was displayed and the frame, per FrameCapture.stop.
+        end_time (float): Time (monotonic) capture stopped. Determines how long the last frame is displayed.
+        path (str): Path to save the animation to.
+    """
+
+    # Determine how many ms each frame was displayed for. Min 10ms, the shortest duration a GIF frame can have.
+    times = [time for time, frame in frames] + [end_time]
+    durations = [max(round((times[i + 1] - times[i]) * 1000), 10) for i in range(len(frames))]
+
+    images = [frame for time, frame in frames]
+    images[0].save(path, save_all=True, append_images=images[1:], duration=durations, loop=0)
+
+
+def compare_captures(path, other_path):
+    """ Compares two saved captures pixel by pixel.
+
+    Args:
+        path (str): Path to the first capture.
+        other_path (str): Path to the second capture.
+
+    Returns:
+        dict: Number of frames in each capture, and the index of each frame that differs between them (up to the length of the shorter capture).
+    """
+
+    with Image.open(path) as capture, Image.open(other_path) as other_capture:
+        frames = [frame.convert('RGB').tobytes() for frame in ImageSequence.Iterator(capture)]
+        other_frames = [frame.convert('RGB').tobytes() for frame in ImageSequence.Iterator(other_capture)]
+
+    return {
+        'num_frames': len(frames),
+        'other_num_frames': len(other_frames),
+        'differing_frames': [i for i, (frame, other_frame) in enumerate(zip(frames, other_frames)) if frame != other_frame]
+    }
+
+
+def determine_fixture_path(directory, url):
+    """ Determines the path of the fixture for a URL.
+
+    Args:
+        directory (str): Directory fixtures are saved in.
+        url (str): URL requested.
+
+    Returns:
+        str: Path of the fixture.
+    """
+
+    return os.path.join(directory, f'{hashlib.sha1(url.encode()).hexdigest()[:16]}.json')
+
+
+def record_fixtures(session, directory):
+    """ Saves the response to every GET request made with the session as a fixture, so it can later be replayed with replay_fixtures.
+
+    Args:
+        session (ScoreboardSession): Session to record requests made with.
+        directory (str): Directory to save fixtures in. Created if it doesn't exist.
+    """
+
+    os.makedirs(directory, exist_ok=True)
+    session_get = session.get
+
+    # Make each request as usual, then save the response.
+    def get(url, **kwargs):
+        response = session_get(url, **kwargs)
+        with open(determine_fixture_path(directory, url), 'w') as file:
+            json.dump({'url': url, 'status_code': response.status_code, 'headers': dict(response.headers), 'text': response.text}, file)
+        return response
+
+    session.get = get
+
+
+def replay_fixtures(session, directory):
+    """ Responds to every GET request made with the session with its fixture saved by record_fixtures, rather than making the request.
+    Fixtures are matched by URL. Requests without a fixture fail with a connection error, the same as if the API was unreachable.
+
+    Args:
+        session (ScoreboardSession): Session to replay requests made with.
+        directory (str): Directory fixtures were saved in.
+    """
+
+    # Load the fixture in place of making the request.
+    def get(url, **kwargs):
+        fixture_path = determine_fixture_path(directory, url)
+        if not os.path.exists(fixture_path):
+            raise requests.exceptions.ConnectionError(f'No fixture recorded for {url}.')
+
+        with open(fixture_path) as file:
+            fixture = json.load(file)
+
+        # Build the response as requests would have.
+        response = requests.Response()
+        response.url = fixture['url']
+        response.status_code = fixture['status_code']
+        response.headers.update(fixture['headers'])
+        response.encoding = 'utf-8'
+        response._content = fixture['text'].encode('utf-8')
+        return response
+
+    session.get = get
@@ -0,0 +1,119 @@
+from datetime import datetime as dt
+from datetime import timedelta
+import threading
+import time
+
+
+class SystemClock():
+    """ Clock backed by the system. Used unless another clock is set with set_clock.
+    """
+
+    def now(self):
+        return dt.today()
+
+
+    def monotonic(self):
+        return time.monotonic()
+
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+
+class VirtualTimeElapsed(BaseException):
+    """ Raised from sleep once a virtual clock reaches its end time. A BaseException so it isn't caught by the per-scene error handling in run_scoreboard.
+    """
+
+
+class VirtualClock():
+    """ Clock where time only moves when slept through, and sleeping is instant. Allows hours of scoreboard operation to run in seconds.
+    Sleeps in the thread that created the clock advance time. Sleeps in any other thread (e.g., the brightness timer) wait until time has been advanced past them.
+    """
+
+    def __init__(self, start_datetime, end_datetime=None):
+        """ Starts the clock.
+
+        Args:
+            start_datetime (datetime): Local date and time the clock starts at.
+            end_datetime (datetime, optional): Local date and time to stop at. Once reached, sleep raises VirtualTimeElapsed. Defaults to None (never stop).
+        """
+
+        self.start_datetime = start_datetime
+        self.end_datetime = end_datetime
+
+        # Seconds of virtual time elapsed since the start.
+        self.elapsed = 0
+
+        # Thread that advances time, and a condition for other threads to wait on it.
+        self.driver_thread_id = threading.get_ident()
+        self.condition = threading.Condition()
+
+
+    def now(self):
+        return self.start_datetime + timedelta(seconds=self.elapsed)
+
+
+    def monotonic(self):
+        return self.elapsed
+
+
+    def sleep(self, seconds):
+        with self.condition:
+            wake_at = self.elapsed + max(seconds, 0)
+
+            # Other threads wait until the driver thread advances time past their wake time.
+            if threading.get_ident() != self.driver_thread_id:
+                self.condition.wait_for(lambda: self.elapsed >= wake_at)
+                return
+
+            # The driver thread advances time immediately, waking any other threads due by then.
+            self.elapsed = wake_at
+            self.condition.notify_all()
+
+        if self.end_datetime and self.now() >= self.end_datetime:
+            raise VirtualTimeElapsed()
+
+
+# Clock used throughout the scoreboard. System clock by default.
+clock = SystemClock()
+
+
+def set_clock(new_clock):
+    """ Sets the clock used throughout the scoreboard (e.g., to a VirtualClock).
+
+    Args:
+        new_clock (SystemClock or VirtualClock): Clock to use.
+    """
+
+    global clock
+    clock = new_clock
+
+
+def now():
+    """ Gets the current local date and time, per the clock in use. Use in place of datetime.today().
+
+    Returns:
+        datetime: Current local date and time (naive).
+    """
+
+    return clock.now()
+
+
+def monotonic():
+    """ Gets the value of a monotonic clock (seconds), per the clock in use. Use in place of time.monotonic().
+
+    Returns:
+        float: Seconds. Only meaningful relative to another value from this function.
+    """
+
+    return clock.monotonic()
+
+
+def sleep(seconds):
+    """ Sleeps for the provided number of seconds, per the clock in use. Use in place of time.sleep().
+
+    Args:
+        seconds (float): Seconds to sleep.
+    """
+
+    clock.sleep(seconds)
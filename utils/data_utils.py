@@ -1,8 +1,15 @@
+import copy
+import os
 import yaml
 
 
+# Parsed .yaml files keyed by path, with the modified time each was parsed at.
+yaml_cache = {}
+
+
 def read_yaml(file_path):
     """ Safely reads a .yaml file and returns a dict.
+    Files are only parsed again once modified, as config.yaml is read by every scene (often many times a minute). Edits still apply from the next read.
 
     Args:
         file_path (str): Path of .yaml file.
@@ -10,6 +17,12 @@ def read_yaml(file_path):
     Returns:
         dict: Dict correspond to the values in the .yaml file.
     """
-    
-    with open(file_path, 'r') as file:
-        return yaml.safe_load(file)
\ No newline at end of file
+
+    # Parse the file if it hasn't been, or has been modified since.
+    mtime = os.path.getmtime(file_path)
+    if file_path not in yaml_cache or yaml_cache[file_path][0] != mtime:
+        with open(file_path, 'r') as file:
+            yaml_cache[file_path] = (mtime, yaml.safe_load(file))
+
+    # Return a copy, so callers can modify it without affecting the cache.
+    return copy.deepcopy(yaml_cache[file_path][1])
@@ -1,4 +1,7 @@
-from datetime import datetime, timedelta
+from utils import clock_utils
+
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 
 def determine_dates_to_display_games(start, end):
@@ -13,7 +16,7 @@ def determine_dates_to_display_games(start, end):
     """
 
     # Get the current date and time.
-    cur_datetime = datetime.today()
+    cur_datetime = clock_utils.now()
     cur_date = cur_datetime.date()
     cur_time = cur_datetime.time()
 
@@ -36,4 +39,35 @@ def determine_dates_to_display_games(start, end):
     else:
         dates_to_display.append(cur_date)
 
-    return dates_to_display
\ No newline at end of file
+    return dates_to_display
+
+
+@lru_cache(maxsize=4096)
+def parse_timestamp(timestamp):
+    """ Parses an ISO 8601 timestamp returned by a league API (e.g., '2025-01-01T00:00:00Z' or '2025-01-01T19:00:00-05:00') into UTC and local datetimes.
+    Memoised, as the same timestamps are returned on every pull (and often used several times per pull). Datetimes are immutable, so are safe to share.
+
+    Args:
+        timestamp (str): ISO 8601 timestamp w/ a UTC offset.
+
+    Returns:
+        tuple: Timezone aware datetimes (UTC, local).
+    """
+
+    datetime_utc = datetime.fromisoformat(timestamp).astimezone(timezone.utc)
+    return datetime_utc, datetime_utc.astimezone(tz=None)
+
+
+@lru_cache(maxsize=1024)
+def parse_date(date_string, date_format):
+    """ Parses the date from a date string returned by a league API. Memoised, as schedules return the same dates on every pull.
+
+    Args:
+        date_string (str): Date (or datetime) string. E.g., '01/31/2025 00:00:00'.
+        date_format (str): strptime format of date_string. E.g., '%m/%d/%Y %H:%M:%S'.
+
+    Returns:
+        date: Date of date_string.
+    """
+
+    return datetime.strptime(date_string, date_format).date()
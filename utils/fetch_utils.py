@@ -0,0 +1,46 @@
+from setup.session_setup import session
+
+import asyncio
+
+
+def get_json(url, headers=None):
+    """ Makes a GET request with the shared session and returns the decoded JSON.
+
+    Args:
+        url (str): URL to request.
+        headers (dict, optional): Headers to include in the request. Defaults to None.
+
+    Returns:
+        dict: Decoded JSON response.
+    """
+
+    return session.get(url=url, headers=headers).json()
+
+
+async def run_concurrently_async(calls, raise_errors=True):
+    """ Runs each of the provided calls concurrently, each in a worker thread so blocking requests don't hold up one another.
+    Connections per host are capped by the session's connection pool (network.max_connections_per_host in config.yaml).
+
+    Args:
+        calls (list): List of tuples of a function and a tuple of args to call it with.
+        raise_errors (bool, optional): If an error in any call should be raised. If False, the error is returned in place of that call's result. Defaults to True.
+
+    Returns:
+        list: Result of each call, in the same order as calls.
+    """
+
+    return await asyncio.gather(*(asyncio.to_thread(func, *args) for func, args in calls), return_exceptions=not raise_errors)
+
+
+def run_concurrently(calls, raise_errors=True):
+    """ Synchronous facade for run_concurrently_async. Blocks until all calls are complete, so wall time is that of the slowest call rather than the sum of all calls.
+
+    Args:
+        calls (list): List of tuples of a function and a tuple of args to call it with.
+        raise_errors (bool, optional): If an error in any call should be raised. If False, the error is returned in place of that call's result. Defaults to True.
+
+    Returns:
+        list: Result of each call, in the same order as calls.
+    """
+
+    return asyncio.run(run_concurrently_async(calls, raise_errors))
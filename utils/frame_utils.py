@@ -0,0 +1,166 @@
+from PIL import Image, ImageDraw
+
+# NumPy is optional. If installed, frames are composited as NumPy arrays. Otherwise, PIL is used.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Lookup tables by overlay opacity, mapping each channel value to its value after the black fade overlay is applied.
+fade_luts = {}
+
+
+def create_faded_image(image, overlay_opacity):
+    """ Takes the provided image and overlay_opacity and returns the same image with a black overlay with overlay_opacity applied.
+    We can't use real opacity due to RGBMatrix only being able to display images of type RGB on a matrix.
+
+    Args:
+        image (Image): Image to apply black overlay to.
+        overlay_opacity (int): Opacity of black overlay to apply.
+
+    Returns:
+        Image: Provided image with a black overlay applied with opacity of overlay_opacity.
+    """
+
+    # Convert input image to RGBA. Needed in order to apply fade overlay.
+    image = image.convert('RGBA')
+
+    # Create a new image of the same size with a black rectangle with opacity of the input overlay_opacity.
+    fade_overlay_image = Image.new('RGBA', image.size)
+    fade_overlay_draw = ImageDraw.Draw(fade_overlay_image)
+    fade_overlay_draw.rectangle([(0,0), fade_overlay_image.size], fill=(0, 0, 0, overlay_opacity))
+
+    # Apply the overlay to the provided image and convert to RGB.
+    faded_image = Image.alpha_composite(image, fade_overlay_image)
+    faded_image = faded_image.convert('RGB')
+
+    return faded_image
+
+
+def get_fade_lut(overlay_opacity):
+    """ Gets the lookup table for a fade overlay opacity. Built by fading an image of every channel value, so the result is identical to create_faded_image.
+
+    Args:
+        overlay_opacity (int): Opacity of black overlay.
+
+    Returns:
+        ndarray: Array of 256 uint8 values, the faded value of each channel value.
+    """
+
+    if overlay_opacity not in fade_luts:
+        channel_values = Image.frombytes('L', (256, 1), bytes(range(256))).convert('RGB')
+        fade_luts[overlay_opacity] = np.frombuffer(create_faded_image(channel_values, overlay_opacity).getchannel('R').tobytes(), dtype=np.uint8)
+
+    return fade_luts[overlay_opacity]
+
+
+class FrameBuffer():
+    """ Preallocated frame that layers (i.e., images) are composited onto before being displayed on the matrix.
+    When NumPy is installed, the frame and layers are stored as uint8 arrays, so each clear, paste, and fade is a single array operation on preallocated buffers. Otherwise, PIL images are used.
+    """
+
+    def __init__(self, size):
+        """ Allocates the frame.
+
+        Args:
+            size (tuple): Width and height of the frame (i.e., of the matrix).
+        """
+
+        self.size = size
+        self.layers = {}
+
+        if np is not None:
+            # Frame to composite onto, and a second to write the faded frame to.
+            self.frame = np.zeros((size[1], size[0], 3), dtype=np.uint8)
+            self.faded_frame = np.zeros_like(self.frame)
+        else:
+            self.frame = Image.new('RGB', size)
+            self.frame_draw = ImageDraw.Draw(self.frame)
+
+
+    def set_layer(self, name, image):
+        """ Loads an image as a layer that can then be pasted onto the frame. Done once per image rather than on every frame.
+
+        Args:
+            name (str): Name of the layer.
+            image (Image): RGB image to use as the layer.
+        """
+
+        self.layers[name] = np.asarray(image) if np is not None else image
+
+
+    def set_layers(self, images):
+        """ Loads each of the provided images as a layer of the same name.
+
+        Args:
+            images (dict): RGB images by name.
+        """
+
+        for name, image in images.items():
+            self.set_layer(name, image)
+
+
+    def clear(self):
+        """ Resets the frame to black.
+        """
+
+        if np is not None:
+            self.frame.fill(0)
+        else:
+            self.frame_draw.rectangle([(0,0), self.size], fill=(0, 0, 0))
+
+
+    def paste_layer(self, name, position, clip_box=None):
+        """ Pastes a layer onto the frame. Any portion of the layer outside the frame is ignored, so layers can be positioned partially (or fully) off the matrix.
+
+        Args:
+            name (str): Name of the layer to paste.
+            position (tuple): Col and row in the frame of the top left corner of the layer. Can be negative.
+            clip_box (tuple, optional): Box (left, upper, right, lower) of the frame to limit the paste to. Portions of the layer outside it are ignored. Defaults to None (the full frame).
+        """
+
+        layer = self.layers[name]
+        layer_size = layer.shape[1::-1] if np is not None else layer.size
+
+        # Without a clip box, PIL handles the portion of the layer outside the frame itself.
+        if np is None and clip_box is None:
+            self.frame.paste(layer, position)
+            return
+
+        # Determine the portion of the layer that lands within the frame (and clip box).
+        col, row = position
+        clip_box = clip_box or (0, 0, *self.size)
+        col_start, row_start = max(col, clip_box[0], 0), max(row, clip_box[1], 0)
+        col_end, row_end = min(col + layer_size[0], clip_box[2], self.size[0]), min(row + layer_size[1], clip_box[3], self.size[1])
+        if col_start >= col_end or row_start >= row_end:
+            return
+
+        # Copy that portion of the layer onto the frame.
+        if np is not None:
+            self.frame[row_start:row_end, col_start:col_end] = layer[row_start - row:row_end - row, col_start - col:col_end - col]
+        else:
+            self.frame.paste(layer.crop((col_start - col, row_start - row, col_end - col, row_end - row)), (col_start, row_start))
+
+
+    def get_image(self, overlay_opacity=0):
+        """ Gets the frame as an image to display on the matrix, with a black overlay of overlay_opacity applied.
+
+        Args:
+            overlay_opacity (int, optional): Opacity of black overlay to apply. Defaults to 0 (no overlay).
+
+        Returns:
+            Image: RGB image of the frame.
+        """
+
+        if np is None:
+            return create_faded_image(self.frame, overlay_opacity) if overlay_opacity else self.frame
+
+        # Apply the fade as a lookup of every channel value into a preallocated buffer.
+        frame = self.frame
+        if overlay_opacity:
+            np.take(get_fade_lut(overlay_opacity), self.frame, out=self.faded_frame, mode='clip')
+            frame = self.faded_frame
+
+        # PIL stores RGB images with 4 bytes per pixel, so the array can't be shared directly. This is a single unpack of the buffer.
+        return Image.frombuffer('RGB', self.size, frame, 'raw', 'RGB', 0, 1)
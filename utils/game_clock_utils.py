@@ -0,0 +1,41 @@
+from utils import clock_utils
+
+
+# Max seconds to tick a clock forward from its last sync. Beyond this, the data is old enough that the clock has likely stopped (or the game has moved on), so it's held.
+MAX_INTERPOLATION_DURATION = 120
+
+
+def is_clock_running(game):
+    """ Determines if a game's clock is running, per the latest data pull. Never during intermission or halftime.
+
+    Args:
+        game (dict): Dictionary with all details of a specific game.
+
+    Returns:
+        bool: If the clock is running.
+    """
+
+    return bool(game.get('is_clock_running')) and not game.get('is_intermission') and not game.get('is_halftime')
+
+
+def determine_time_remaining(game):
+    """ Determines the time remaining in the playing period as of now, ticking the clock forward from when it was synced with the API.
+    Clocks resync each data pull, as each pull replaces the time remaining and the time it was synced.
+
+    Args:
+        game (dict): Dictionary with all details of a specific game. The time it was synced is clock_synced_at (monotonic).
+
+    Returns:
+        str: Time remaining in 'MM:SS' format. As per the latest data pull if the clock isn't running.
+    """
+
+    time_remaining = game.get('period_time_remaining')
+    if not time_remaining or game.get('clock_synced_at') is None or not is_clock_running(game):
+        return time_remaining
+
+    # Count down from the synced time by the time since, stopping at zero.
+    minutes, seconds = time_remaining.split(':')
+    elapsed = min(clock_utils.monotonic() - game['clock_synced_at'], MAX_INTERPOLATION_DURATION)
+    seconds_remaining = max(int(minutes) * 60 + int(seconds) - int(elapsed), 0)
+
+    return f'{seconds_remaining // 60:02d}:{seconds_remaining % 60:02d}'
@@ -0,0 +1,125 @@
+import math
+
+
+# Size of the layout scenes are designed around, a single 64x32 panel. On larger displays, this is placed within the native display.
+CARD_SIZE = (64, 32)
+
+
+def determine_card_origin(display_size, grid_size=(1, 1), card=0):
+    """ Determines where the top left corner of a card (i.e., the 64x32 layout scenes are designed around) sits on the display.
+    Cards are laid out in a grid, filling each row before the next. The grid is centred on displays larger than it.
+
+    Args:
+        display_size (tuple): Width and height of the display.
+        grid_size (tuple, optional): Cols and rows of cards in the grid. Defaults to (1, 1), a single card.
+        card (int, optional): Index of the card within the grid. Defaults to 0.
+
+    Returns:
+        tuple: Col and row of the top left corner of the card.
+    """
+
+    grid_col, grid_row = card % grid_size[0], card // grid_size[0]
+
+    return (
+        (display_size[0] - CARD_SIZE[0] * grid_size[0]) // 2 + CARD_SIZE[0] * grid_col,
+        (display_size[1] - CARD_SIZE[1] * grid_size[1]) // 2 + CARD_SIZE[1] * grid_row
+    )
+
+
+def determine_card_box(display_size, grid_size=(1, 1), card=0):
+    """ Determines the area of the display a card covers.
+
+    Args:
+        display_size (tuple): Width and height of the display.
+        grid_size (tuple, optional): Cols and rows of cards in the grid. Defaults to (1, 1), a single card.
+        card (int, optional): Index of the card within the grid. Defaults to 0.
+
+    Returns:
+        tuple: Box (left, upper, right, lower) of the card on the display.
+    """
+
+    col, row = determine_card_origin(display_size, grid_size, card)
+    return (col, row, col + CARD_SIZE[0], row + CARD_SIZE[1])
+
+
+def determine_max_cards(display_size):
+    """ Determines how many cards fit on the display at once. Always at least one, even if the display is smaller than a card.
+
+    Args:
+        display_size (tuple): Width and height of the display.
+
+    Returns:
+        int: Max number of cards.
+    """
+
+    return max(display_size[0] // CARD_SIZE[0], 1) * max(display_size[1] // CARD_SIZE[1], 1)
+
+
+def determine_card_grid(display_size, num_cards):
+    """ Determines the grid to lay out num_cards cards in. Cards sit side by side where the display is wide enough, then wrap onto additional rows.
+
+    Args:
+        display_size (tuple): Width and height of the display.
+        num_cards (int): Number of cards to lay out. Should be no more than determine_max_cards.
+
+    Returns:
+        tuple: Cols and rows of cards in the grid.
+    """
+
+    grid_cols = min(num_cards, max(display_size[0] // CARD_SIZE[0], 1))
+    return (grid_cols, math.ceil(num_cards / grid_cols))
+
+
+def determine_game_layout(display_size, grid_size=(1, 1), card=0):
+    """ Determines the position of each image of a game scene on the display.
+    The left and right images are wider than what's visible on a single panel, leaving a col of buffer on either side of the centre image. They must be clipped to the card (see determine_card_box), so they don't spill onto the rest of larger displays.
+
+    Args:
+        display_size (tuple): Width and height of the display.
+        grid_size (tuple, optional): Cols and rows of game cards in the grid, when displaying multiple games at once. Defaults to (1, 1), a single game.
+        card (int, optional): Index of the game card within the grid. Defaults to 0.
+
+    Returns:
+        dict: Col and row of the top left corner of each image, by image name.
+    """
+
+    col, row = determine_card_origin(display_size, grid_size, card)
+
+    return {
+        'left':     (col - 19, row + 1), # 21 of 40 cols will be visible on a single panel (cols 0-20) when not moving.
+        'centre':   (col + 22, row + 1),
+        'right':    (col + 43, row + 1), # 21 of 40 cols will be visible on a single panel (cols 43-63) when not moving.
+        'full':     (col, row)
+    }
+
+
+def determine_standings_layout(display_size):
+    """ Determines the position of each image of a standings scene on the display. Standings use the full height of the display, so taller displays show more teams at once.
+
+    Args:
+        display_size (tuple): Width and height of the display.
+
+    Returns:
+        dict: Col and row of the top left corner of each image, by image name.
+    """
+
+    col, row = determine_card_origin(display_size)
+
+    return {
+        'side':         (col, 0),
+        'standings':    (col + 8, 0),
+        'full':         (col, row)
+    }
+
+
+def determine_full_layout(display_size):
+    """ Determines the position of the full image for scenes built directly to it (e.g., next game).
+
+    Args:
+        display_size (tuple): Width and height of the display.
+
+    Returns:
+        dict: Col and row of the top left corner of the full image.
+    """
+
+    return {'full': determine_card_origin(display_size)}
@@ -0,0 +1,69 @@
+import math
+
+
+def build_scroll_schedule(distance, step, pause_duration, speed=None, total_duration=None):
+    """ Precomputes the timeline of a scroll. The scroll moves step pixels at a time, pausing before the first step, between steps, and after the last.
+    Either speed or total_duration determines how long each move takes. If total_duration is provided, the whole scroll (incl. pauses) takes exactly that long regardless of distance.
+
+    Args:
+        distance (int): Total number of pixels to scroll.
+        step (int): Pixels to move between pauses (e.g., the height of a row).
+        pause_duration (float): Seconds to pause at each step.
+        speed (float, optional): Pixels per second while moving. Defaults to None.
+        total_duration (float, optional): Seconds the whole scroll should take. Takes precedence over speed. Defaults to None.
+
+    Returns:
+        list: List of segment dicts in chronological order. Each has 'start' and 'end' times (seconds from the start of the scroll) and 'from' and 'to' offsets (pixels). Pauses have equal 'from' and 'to'.
+    """
+
+    num_moves = math.ceil(distance / step) if distance > 0 else 0
+    num_pauses = num_moves + 1
+
+    # Determine how long each move and pause takes.
+    if total_duration is not None:
+        # Split the total between moves and pauses. If the pauses alone would exceed the total, shrink them to leave a third of the time for moving.
+        if num_moves and pause_duration * num_pauses > total_duration * 2 / 3:
+            pause_duration = total_duration * 2 / 3 / num_pauses
+        elif not num_moves:
+            pause_duration = total_duration
+        move_duration = (total_duration - pause_duration * num_pauses) / num_moves if num_moves else 0
+    else:
+        move_duration = step / speed
+
+    # Build the segments, alternating pauses and moves.
+    schedule = []
+    time = 0
+    offset = 0
+    for move in range(num_moves + 1):
+        schedule.append({'start': time, 'end': time + pause_duration, 'from': offset, 'to': offset})
+        time += pause_duration
+
+        if move < num_moves:
+            next_offset = min(offset + step, distance)
+            schedule.append({'start': time, 'end': time + move_duration, 'from': offset, 'to': next_offset})
+            time += move_duration
+            offset = next_offset
+
+    return schedule
+
+
+def get_scroll_offset(schedule, elapsed):
+    """ Determines the scroll offset at a point in time, per a schedule from build_scroll_schedule. Motion within each move is eased in and out.
+
+    Args:
+        schedule (list): Scroll schedule.
+        elapsed (float): Seconds since the start of the scroll.
+
+    Returns:
+        int: Scroll offset in pixels.
+    """
+
+    for segment in schedule:
+        if elapsed < segment['end']:
+            # Portion of the way through the segment (0-1), eased so motion starts and ends smoothly.
+            progress = max(elapsed - segment['start'], 0) / (segment['end'] - segment['start'])
+            eased_progress = progress * progress * (3 - 2 * progress)
+            return round(segment['from'] + (segment['to'] - segment['from']) * eased_progress)
+
+    # Past the end of the schedule.
+    return schedule[-1]['to']
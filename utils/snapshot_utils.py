@@ -0,0 +1,263 @@
+from utils import clock_utils
+
+from functools import wraps
+import threading
+import copy
+
+
+# Last good result of each data call, keyed by function and arguments. Shared across all scenes.
+snapshots = {}
+
+# Revalidations currently in flight, keyed the same way as snapshots.
+revalidations = {}
+
+# Guards access to both dicts above, as revalidation happens in background threads.
+lock = threading.Lock()
+
+# Current loop of scene_order. Data loaded during it can be reused by later scenes in the same loop (see start_cycle).
+cycle = {
+    'started_at': None,
+    'max_age': 0
+}
+
+
+def start_cycle(max_age):
+    """ Starts a new loop of scene_order. Until the next call, data shared within the cycle (see stale_while_revalidate) that was loaded during this loop is reused for up to max_age seconds.
+    Scenes listed more than once in scene_order then reuse the data loaded for their first appearance, rather than loading it again.
+
+    Args:
+        max_age (float): Max seconds data loaded during the cycle is reused for.
+    """
+
+    with lock:
+        cycle['started_at'] = clock_utils.monotonic()
+        cycle['max_age'] = max_age
+
+
+def stale_while_revalidate(max_age=0, revalidate_wait=3, share_within_cycle=False):
+    """ Decorator for data functions that makes them return the last good snapshot when fresh data can't be loaded quickly.
+    Each call starts a background revalidation and waits up to revalidate_wait seconds for it. If it completes, the fresh result is returned.
+    If it doesn't (slow API, retries, errors, etc.), the last good snapshot is returned immediately and marked stale. The revalidation keeps running in the background and updates the snapshot once complete.
+    If there's no snapshot yet, the call waits for the revalidation and raises any error it encountered.
+
+    Args:
+        max_age (int, optional): Seconds a snapshot is considered fresh for. Fresh snapshots are returned without revalidating. Defaults to 0.
+        revalidate_wait (int, optional): Max seconds to wait for a revalidation before falling back to the last good snapshot. Defaults to 3.
+        share_within_cycle (bool, optional): If snapshots loaded during the current cycle are also fresh for the cycle's max_age (see start_cycle). For data that changes slowly (schedules, standings, etc.), not live scores. Defaults to False.
+
+    Returns:
+        function: Decorator.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args):
+            key = (func.__module__, func.__name__, args)
+
+            # If the snapshot is still fresh, return it without revalidating.
+            with lock:
+                snapshot = snapshots.get(key)
+                if snapshot and is_fresh(snapshot, max_age, share_within_cycle):
+                    snapshot['is_stale'] = False
+                    return copy.deepcopy(snapshot['data'])
+
+            # Start revalidating (or join the one already in flight) and wait a limited time for it, unless there's nothing to fall back to.
+            # Snapshots restored from a previous run are returned straight away, so something is displayed as soon as possible after a restart.
+            revalidation = start_revalidation(key, func, args)
+            revalidation['done'].wait(timeout=(0 if snapshot.get('is_restored') else revalidate_wait) if snapshot else None)
+
+            with lock:
+                snapshot = snapshots.get(key)
+
+                # Revalidation failed and there's nothing to fall back to.
+                if not snapshot:
+                    raise revalidation['error']
+
+                # Mark whether the snapshot returned is the result of this revalidation or an older one.
+                snapshot['is_stale'] = not (revalidation['done'].is_set() and revalidation['error'] is None)
+                return copy.deepcopy(snapshot['data'])
+
+        # Allow callers to check the state of the snapshot for a given set of args (e.g., to show a stale indicator).
+        wrapper.snapshot_info = lambda *args: get_snapshot_info((func.__module__, func.__name__, args))
+
+        # Allow callers to reuse the snapshot for a given set of args without loading anything (e.g., data already loaded by another scene).
+        wrapper.snapshot_data = lambda *args, max_age=None: get_snapshot_data((func.__module__, func.__name__, args), max_age)
+
+        # Allow callers to check if data loaded now is still fresh for the rest of the cycle (e.g., to load it ahead of the scenes using it).
+        wrapper.share_within_cycle = share_within_cycle
+
+        return wrapper
+
+    return decorator
+
+
+def is_fresh(snapshot, max_age, share_within_cycle):
+    """ Determines if a snapshot is fresh, and can be returned without revalidating. Must be called w/ the lock held.
+
+    Args:
+        snapshot (dict): Snapshot.
+        max_age (float): Seconds the snapshot is fresh for.
+        share_within_cycle (bool): If the snapshot is also fresh for the cycle's max_age when loaded during the current cycle.
+
+    Returns:
+        bool: If the snapshot is fresh.
+    """
+
+    age = clock_utils.monotonic() - snapshot['fetched_at']
+    if age <= max_age:
+        return True
+
+    # Loaded during the current cycle, and within the cycle's max age.
+    return share_within_cycle and cycle['started_at'] is not None and snapshot['fetched_at'] >= cycle['started_at'] and age <= cycle['max_age']
+
+
+def start_revalidation(key, func, args):
+    """ Starts a background thread that calls func and updates the snapshot for key with the result.
+    If a revalidation for key is already in flight, it's returned rather than starting another.
+
+    Args:
+        key (tuple): Snapshot key.
+        func (function): Data function to call.
+        args (tuple): Arguments to call func with.
+
+    Returns:
+        dict: Revalidation details. 'done' is an Event set once complete, 'error' is any exception raised.
+    """
+
+    with lock:
+        if key in revalidations:
+            return revalidations[key]
+
+        revalidation = {'done': threading.Event(), 'error': None}
+        revalidations[key] = revalidation
+
+    def revalidate():
+        try:
+            data = func(*args)
+            with lock:
+                snapshots[key] = {
+                    'data': data,
+                    'fetched_at': clock_utils.monotonic(),
+                    'fetched_at_datetime': clock_utils.now().astimezone(),
+                    'is_stale': False
+                }
+        except Exception as e:
+            # Keep the last good snapshot. The error is only raised to the caller if there's no snapshot to fall back to.
+            print(f'Unable to refresh data for {func.__module__}.{func.__name__}{args}: {e!r}')
+            revalidation['error'] = e
+        finally:
+            with lock:
+                del revalidations[key]
+            revalidation['done'].set()
+
+    threading.Thread(target=revalidate, daemon=True).start()
+    return revalidation
+
+
+def get_snapshot_info(key):
+    """ Gets the state of the snapshot for key.
+
+    Args:
+        key (tuple): Snapshot key.
+
+    Returns:
+        dict: 'is_stale' (bool) and 'age' (float, seconds since the snapshot data was fetched). None if there's no snapshot.
+    """
+
+    with lock:
+        snapshot = snapshots.get(key)
+        if not snapshot:
+            return None
+
+        return {
+            'is_stale': snapshot['is_stale'],
+            'age': clock_utils.monotonic() - snapshot['fetched_at']
+        }
+
+
+def get_snapshot_data(key, max_age=None):
+    """ Gets the data of the snapshot for key, without revalidating it.
+
+    Args:
+        key (tuple): Snapshot key.
+        max_age (float, optional): Max seconds since the snapshot data was fetched. Older snapshots are ignored. Defaults to None (any age).
+
+    Returns:
+        any: Copy of the snapshot data. None if there's no snapshot (or it's too old).
+    """
+
+    with lock:
+        snapshot = snapshots.get(key)
+        if not snapshot or (max_age is not None and clock_utils.monotonic() - snapshot['fetched_at'] > max_age):
+            return None
+
+        return copy.deepcopy(snapshot['data'])
+
+
+def export_snapshots(max_age=None):
+    """ Exports snapshots so they can be saved and restored after a restart (see restore_snapshots).
+    Monotonic times don't carry across restarts, so the time each snapshot was fetched is exported as a datetime.
+
+    Args:
+        max_age (float, optional): Max seconds since the snapshot data was fetched. Older snapshots (e.g., for past dates no longer displayed) aren't exported. Defaults to None (any age).
+
+    Returns:
+        dict: Data and fetched datetime of each snapshot, keyed the same way as snapshots.
+    """
+
+    # Snapshot data is never modified once stored (only replaced), so it's exported as is, w/o copying.
+    with lock:
+        exported_snapshots = {
+            key: {'data': snapshot['data'], 'fetched_at_datetime': snapshot['fetched_at_datetime']}
+            for key, snapshot in snapshots.items()
+            if max_age is None or clock_utils.monotonic() - snapshot['fetched_at'] <= max_age
+        }
+
+    return exported_snapshots
+
+
+def restore_snapshots(exported_snapshots):
+    """ Restores snapshots exported by export_snapshots (e.g., by a previous run). Snapshots already loaded in this run are kept.
+    Restored snapshots are marked stale and returned without waiting on revalidation, while fresh data is loaded in the background.
+
+    Args:
+        exported_snapshots (dict): Snapshots as returned by export_snapshots.
+    """
+
+    cur_datetime = clock_utils.now().astimezone()
+    with lock:
+        for key, exported_snapshot in exported_snapshots.items():
+            if key in snapshots:
+                continue
+
+            # Convert the fetched datetime back to monotonic time. Monotonic times in the data itself (e.g., when game clocks were synced) are meaningless now, so clear them.
+            snapshots[key] = {
+                'data': clear_monotonic_times(exported_snapshot['data']),
+                'fetched_at': clock_utils.monotonic() - (cur_datetime - exported_snapshot['fetched_at_datetime']).total_seconds(),
+                'fetched_at_datetime': exported_snapshot['fetched_at_datetime'],
+                'is_stale': True,
+                'is_restored': True
+            }
+
+
+def clear_monotonic_times(data):
+    """ Clears monotonic times (clock_synced_at of games) throughout snapshot data, as they're only meaningful within the run they were recorded in.
+    Games w/o a synced time display the time remaining as last pulled, rather than ticking the clock forward.
+
+    Args:
+        data (any): Snapshot data. Nested dicts and lists are cleared too.
+
+    Returns:
+        any: The same data, cleared in place.
+    """
+
+    if isinstance(data, dict):
+        if 'clock_synced_at' in data:
+            data['clock_synced_at'] = None
+        for value in data.values():
+            clear_monotonic_times(value)
+    elif isinstance(data, list):
+        for value in data:
+            clear_monotonic_times(value)
+
+    return data
@@ -0,0 +1,98 @@
+from setup.matrix_setup import display_size
+from utils import snapshot_utils
+
+from functools import lru_cache
+import hashlib
+import os
+import pickle
+
+
+# Location of the saved state. Relative to the app root, like the results store.
+state_path = 'cache/warm_start.pickle'
+
+# Scene attributes holding rendered images that are worth keeping across restarts.
+RENDER_CACHE_ATTRIBUTES = ['game_image_cache', 'standings_image_cache']
+
+# Files that images are rendered from. Directories include all files within them. Relative to the app root.
+RENDER_SOURCES = ['scenes', 'utils/image_utils.py', 'utils/layout_utils.py', 'utils/frame_utils.py', 'assets']
+
+# Max seconds since a snapshot was fetched for it to be saved. Older snapshots (e.g., games on past dates) are no longer displayed.
+SNAPSHOT_MAX_AGE = 24 * 3600
+
+
+@lru_cache(maxsize=1)
+def determine_render_version():
+    """ Determines the version of rendered images, so images rendered differently (other display size, updated code, logos, or fonts) aren't restored.
+    Determined once per run, as that's what images rendered during the run were rendered with.
+
+    Returns:
+        str: Hash of the display size and the contents of the render sources.
+    """
+
+    # List every file of the render sources, in a consistent order.
+    file_paths = []
+    for render_source in RENDER_SOURCES:
+        if os.path.isdir(render_source):
+            file_paths += sorted(os.path.join(directory, file_name) for directory, directory_names, file_names in os.walk(render_source) for file_name in file_names if '__pycache__' not in directory)
+        else:
+            file_paths.append(render_source)
+
+    # Hash the path and contents of each, so renamed files count as a change too.
+    render_version = hashlib.sha1(repr(display_size).encode())
+    for file_path in file_paths:
+        render_version.update(file_path.encode())
+        with open(file_path, 'rb') as file:
+            render_version.update(file.read())
+
+    return render_version.hexdigest()
+
+
+def save_state(scene_mapping):
+    """ Saves the latest data snapshots and rendered images of each scene, so they can be restored after a restart.
+    Written to a temporary file and then moved into place, so a restart mid-save never leaves a partial file.
+
+    Args:
+        scene_mapping (dict): Scene objects by their name in config.yaml scene_order.
+    """
+
+    state = {
+        'snapshots': snapshot_utils.export_snapshots(max_age=SNAPSHOT_MAX_AGE),
+        'render_version': determine_render_version(),
+        'render_caches': {scene_name: {attribute: getattr(scene, attribute) for attribute in RENDER_CACHE_ATTRIBUTES if hasattr(scene, attribute)} for scene_name, scene in scene_mapping.items()}
+    }
+
+    try:
+        os.makedirs(os.path.dirname(state_path), exist_ok=True)
+        with open(f'{state_path}.tmp', 'wb') as file:
+            pickle.dump(state, file)
+        os.replace(f'{state_path}.tmp', state_path)
+    except Exception as e:
+        print(f'Unable to save warm start state: {e!r}')
+
+
+def load_state(scene_mapping):
+    """ Restores the data snapshots and rendered images saved by save_state (e.g., before a restart), so scenes display straight away while fresh data is loaded.
+    Rendered images are only restored if they were rendered the same way as they would be now.
+
+    Args:
+        scene_mapping (dict): Scene objects by their name in config.yaml scene_order.
+    """
+
+    # Nothing to restore on first run.
+    if not os.path.exists(state_path):
+        return
+
+    try:
+        with open(state_path, 'rb') as file:
+            state = pickle.load(file)
+
+        snapshot_utils.restore_snapshots(state['snapshots'])
+
+        if state['render_version'] == determine_render_version():
+            for scene_name, render_caches in state['render_caches'].items():
+                if scene_name in scene_mapping:
+                    for attribute, render_cache in render_caches.items():
+                        setattr(scene_mapping[scene_name], attribute, render_cache)
+    except Exception as e:
+        print(f'Unable to load warm start state: {e!r}')
+